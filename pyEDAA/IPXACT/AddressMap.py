@@ -0,0 +1,361 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___ ______  __    _    ____ _____                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    |_ _|  _ \ \/ /   / \  / ___|_   _|                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \    | || |_) \  /   / _ \| |     | |                                          #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ _ | ||  __//  \  / ___ \ |___  | |                                          #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___|_|  /_/\_\/_/   \_\____| |_|                                          #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2025 Patrick Lehmann - Bötzingen, Germany                                                             #
+# Copyright 2016-2016 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Checks memory maps placed in an address space for overlapping address blocks, registers crossing the bounds of their
+address block, overlapping registers and gaps between address blocks.
+
+Address blocks and registers are sorted by their start address and swept once, so a check takes *O(n log n)* time for
+*n* address blocks and registers.
+"""
+from enum                    import Enum
+from sys                     import version_info
+from typing                  import Dict, Iterable, Iterator, List, Optional as Nullable, Tuple
+
+from pyTooling.Common        import getFullyQualifiedName
+from pyTooling.Decorators    import export, readonly
+from pyTooling.MetaClasses   import ExtendedType
+
+from pyEDAA.IPXACT           import IPXACTException, VLNV
+from pyEDAA.IPXACT.Component import Component
+from pyEDAA.IPXACT.MemoryMap import MemoryMapTable, MemoryMap, AddressBlock, Register
+
+
+@export
+class ConflictKind(Enum):
+	"""Kinds of conflicts found by :class:`AddressMapChecker`."""
+
+	BlockOverlap =         0  #: An address block overlaps another address block.
+	RegisterOverlap =      1  #: A register overlaps another register of the same address block.
+	RegisterOutsideBlock = 2  #: A register exceeds the range of its address block.
+	Gap =                  3  #: Addresses between two address blocks aren't covered by any address block.
+
+
+@export
+class AddressConflict(metaclass=ExtendedType, slots=True):
+	"""
+	A conflict found by :class:`AddressMapChecker`.
+
+	Each side of a conflict is identified by the VLNV of its component and a path of the form
+	``<memoryMap>/<addressBlock>[/<register>]``. For gaps, the address block following the gap is the first side and the
+	preceding address block is the other side.
+	"""
+
+	_kind:      ConflictKind    #: Kind of the conflict.
+	_start:     int             #: First address of the conflicting address range.
+	_end:       int             #: Address following the conflicting address range.
+	_vlnv:      Nullable[VLNV]  #: VLNV of the component containing the first side.
+	_path:      str             #: Path of the first side.
+	_otherVLNV: Nullable[VLNV]  #: VLNV of the component containing the other side.
+	_otherPath: Nullable[str]   #: Path of the other side.
+
+	def __init__(
+		self,
+		kind: ConflictKind,
+		start: int,
+		end: int,
+		vlnv: Nullable[VLNV],
+		path: str,
+		otherVLNV: Nullable[VLNV] = None,
+		otherPath: Nullable[str] = None
+	) -> None:
+		self._kind = kind
+		self._start = start
+		self._end = end
+		self._vlnv = vlnv
+		self._path = path
+		self._otherVLNV = otherVLNV
+		self._otherPath = otherPath
+
+	@readonly
+	def Kind(self) -> ConflictKind:
+		return self._kind
+
+	@readonly
+	def Start(self) -> int:
+		return self._start
+
+	@readonly
+	def End(self) -> int:
+		return self._end
+
+	@readonly
+	def VLNV(self) -> Nullable[VLNV]:
+		return self._vlnv
+
+	@readonly
+	def Path(self) -> str:
+		return self._path
+
+	@readonly
+	def OtherVLNV(self) -> Nullable[VLNV]:
+		return self._otherVLNV
+
+	@readonly
+	def OtherPath(self) -> Nullable[str]:
+		return self._otherPath
+
+	@staticmethod
+	def _Context(vlnv: Nullable[VLNV], path: str) -> str:
+		return path if vlnv is None else f"{vlnv}/{path}"
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} {self._kind.name} 0x{self._start:x}..0x{self._end - 1:x}>"
+
+	def __str__(self) -> str:
+		addresses = f"0x{self._start:x}..0x{self._end - 1:x}"
+		context = self._Context(self._vlnv, self._path)
+		if self._kind is ConflictKind.BlockOverlap:
+			return f"Address block '{context}' overlaps address block '{self._Context(self._otherVLNV, self._otherPath)}' at {addresses}."
+		elif self._kind is ConflictKind.RegisterOverlap:
+			return f"Register '{context}' overlaps register '{self._Context(self._otherVLNV, self._otherPath)}' at {addresses}."
+		elif self._kind is ConflictKind.RegisterOutsideBlock:
+			return f"Register '{context}' exceeds its address block at {addresses}."
+		else:
+			return f"Gap at {addresses} between address blocks '{self._Context(self._otherVLNV, self._otherPath)}' and '{context}'."
+
+
+def _Sweep(starts: List[int], ends: List[int], indices: Iterable[int]) -> Iterator[Tuple[bool, int, int, int, int]]:
+	"""
+	Sweeps over half-open intervals sorted by their start.
+
+	For each interval overlapping a preceding interval, ``(True, index, other, start, end)`` is yielded, whereby
+	``other`` is the preceding interval reaching furthest and ``start`` and ``end`` bound the overlap. For each gap
+	between intervals, ``(False, index, other, start, end)`` is yielded, whereby ``index`` is the interval following and
+	``other`` is the interval preceding the gap.
+
+	Each interval is reported at most once, so the number of results is linear instead of quadratic, if many intervals
+	overlap each other.
+	"""
+	reach = None
+	reachEnd = 0
+	for index in sorted(indices, key=lambda i: (starts[i], ends[i])):
+		start = starts[index]
+		end = ends[index]
+		if reach is not None:
+			if start < reachEnd:
+				yield True, index, reach, start, min(end, reachEnd)
+			elif start > reachEnd:
+				yield False, index, reach, reachEnd, start
+
+		if reach is None or end > reachEnd:
+			reach = index
+			reachEnd = end
+
+
+@export
+class AddressMapChecker(metaclass=ExtendedType, slots=True):
+	"""
+	Checks memory maps placed in one address space, e.g. the address space of a SoC's bus.
+
+	Memory maps are placed at a base address by :meth:`AddMemoryMap` or :meth:`AddComponent`. :meth:`Check` reports:
+
+	* address blocks overlapping other address blocks of any placed memory map,
+	* registers exceeding the range of their address block,
+	* registers overlapping other registers of the same address block and
+	* gaps between address blocks.
+
+	Each overlapping address block or register is reported once together with the preceding one reaching furthest.
+	Address blocks and registers, whose base address, range, address offset or size is an unresolved expression, are
+	skipped. Register files are checked as part of their address block, as they are flattened by
+	:class:`~pyEDAA.IPXACT.MemoryMap.MemoryMapTable`.
+
+	.. code-block:: python
+
+	   checker = AddressMapChecker()
+	   checker.AddComponent(uart, 0x4000_0000)
+	   checker.AddComponent(timer, 0x4000_1000)
+
+	   for conflict in checker.Check():
+	     print(conflict)
+	"""
+
+	_addressUnitBits: int                                                  #: Number of bits per address unit.
+	_placements:      List[Tuple[Nullable[VLNV], MemoryMapTable, int, int]]  #: VLNV, table, memory map index and base address of each placed memory map.
+
+	def __init__(self, addressUnitBits: int = 8) -> None:
+		"""
+		Initializes an empty address space.
+
+		:param addressUnitBits: Number of bits per address unit. All placed memory maps must use it.
+		:raises TypeError:      If parameter 'addressUnitBits' is not an integer.
+		:raises ValueError:     If parameter 'addressUnitBits' is not positive.
+		"""
+		if not isinstance(addressUnitBits, int):
+			ex = TypeError("Parameter 'addressUnitBits' is not an integer.")
+			if version_info >= (3, 11):  # pragma: no cover
+				ex.add_note(f"Got type '{getFullyQualifiedName(addressUnitBits)}'.")
+			raise ex
+		elif addressUnitBits <= 0:
+			raise ValueError(f"Parameter 'addressUnitBits' is not positive.")
+
+		self._addressUnitBits = addressUnitBits
+		self._placements = []
+
+	@readonly
+	def AddressUnitBits(self) -> int:
+		return self._addressUnitBits
+
+	def AddMemoryMap(self, memoryMap: MemoryMap, baseAddress: int = 0, vlnv: Nullable[VLNV] = None) -> None:
+		"""
+		Places a memory map in the address space.
+
+		:param memoryMap:        The memory map.
+		:param baseAddress:      Address of the memory map's address 0 in the address space.
+		:param vlnv:             VLNV of the component containing the memory map. It's used to report conflicts.
+		:raises TypeError:       If parameter 'memoryMap' is not a MemoryMap.
+		:raises IPXACTException: If the memory map's address unit doesn't match the address space's address unit.
+		"""
+		if not isinstance(memoryMap, MemoryMap):
+			ex = TypeError("Parameter 'memoryMap' is not a MemoryMap.")
+			if version_info >= (3, 11):  # pragma: no cover
+				ex.add_note(f"Got type '{getFullyQualifiedName(memoryMap)}'.")
+			raise ex
+
+		if memoryMap.AddressUnitBits != self._addressUnitBits:
+			raise IPXACTException(f"Memory map '{memoryMap.Name}' uses {memoryMap.AddressUnitBits} bits per address unit, but the address space uses {self._addressUnitBits}.")
+
+		self._placements.append((vlnv, memoryMap.Table, memoryMap.Index, baseAddress))
+
+	def AddComponent(self, component: Component, baseAddress: int = 0) -> None:
+		"""
+		Places all memory maps of a component at the same base address.
+
+		Use :meth:`AddMemoryMap` for components with multiple memory maps, e.g. one per bus interface.
+
+		:param component:   The component.
+		:param baseAddress: Address of the memory maps' address 0 in the address space.
+		"""
+		for memoryMap in component.MemoryMaps:
+			self.AddMemoryMap(memoryMap, baseAddress, component.VLNV)
+
+	def Check(self, gaps: bool = True) -> List[AddressConflict]:
+		"""
+		Checks all placed memory maps.
+
+		:param gaps: If ``True``, gaps between address blocks are reported.
+		:returns:    All conflicts ordered by kind, then by address.
+		"""
+		aub = self._addressUnitBits
+		columns: Dict[int, Tuple[List[Nullable[int]], ...]] = {}
+
+		blockStarts = []
+		blockEnds = []
+		blockRefs = []
+		conflicts = []
+		for vlnv, table, mapIndex, baseAddress in self._placements:
+			if (tableColumns := columns.get(id(table))) is None:
+				tableColumns = columns[id(table)] = tuple(table.Values(name) for name in (
+					"memoryMap.firstAddressBlock", "addressBlock.baseAddress", "addressBlock.range", "addressBlock.firstRegister",
+					"register.addressOffset", "register.size"
+				))
+			firstBlocks, baseAddresses, ranges, firstRegisters, offsets, sizes = tableColumns
+
+			blockCount = len(baseAddresses)
+			for blockIndex in range(firstBlocks[mapIndex], firstBlocks[mapIndex + 1] if mapIndex + 1 < len(firstBlocks) else blockCount):
+				blockRange = ranges[blockIndex]
+				if baseAddresses[blockIndex] is None or not blockRange:
+					continue
+
+				blockStart = baseAddress + baseAddresses[blockIndex]
+				blockStarts.append(blockStart)
+				blockEnds.append(blockStart + blockRange)
+				blockRefs.append((vlnv, table, blockIndex))
+
+				registerStarts = []
+				registerEnds = []
+				registerIndices = []
+				for registerIndex in range(firstRegisters[blockIndex], firstRegisters[blockIndex + 1] if blockIndex + 1 < blockCount else len(offsets)):
+					offset = offsets[registerIndex]
+					size = sizes[registerIndex]
+					if offset is None or not size:
+						continue
+
+					registerStart = blockStart + offset
+					registerEnd = registerStart - (-size // aub)
+					registerStarts.append(registerStart)
+					registerEnds.append(registerEnd)
+					registerIndices.append(registerIndex)
+					if offset - (-size // aub) > blockRange:
+						conflicts.append(AddressConflict(
+							ConflictKind.RegisterOutsideBlock, max(registerStart, blockStart + blockRange), registerEnd, vlnv, self._Path(table, blockIndex, registerIndex)
+						))
+
+				for overlaps, index, other, start, end in _Sweep(registerStarts, registerEnds, range(len(registerIndices))):
+					if overlaps:
+						conflicts.append(AddressConflict(
+							ConflictKind.RegisterOverlap, start, end,
+							vlnv, self._Path(table, blockIndex, registerIndices[index]),
+							vlnv, self._Path(table, blockIndex, registerIndices[other])
+						))
+
+		for overlaps, index, other, start, end in _Sweep(blockStarts, blockEnds, range(len(blockRefs))):
+			if overlaps or gaps:
+				vlnv, table, blockIndex = blockRefs[index]
+				otherVLNV, otherTable, otherBlockIndex = blockRefs[other]
+				conflicts.append(AddressConflict(
+					ConflictKind.BlockOverlap if overlaps else ConflictKind.Gap, start, end,
+					vlnv, self._Path(table, blockIndex),
+					otherVLNV, self._Path(otherTable, otherBlockIndex)
+				))
+
+		conflicts.sort(key=lambda conflict: (conflict._kind.value, conflict._start, conflict._end))
+		return conflicts
+
+	@classmethod
+	def CheckComponent(cls, component: Component, gaps: bool = False) -> List[AddressConflict]:
+		"""
+		Checks each memory map of a component in an address space of its own.
+
+		:param component:        The component.
+		:param gaps:             If ``True``, gaps between address blocks are reported.
+		:returns:                All conflicts of all memory maps.
+		:raises IPXACTException: If a memory map's address unit bits aren't resolved.
+		"""
+		conflicts = []
+		for memoryMap in component.MemoryMaps:
+			if memoryMap.AddressUnitBits is None:
+				raise IPXACTException(f"Memory map '{memoryMap.Name}' of component '{component.VLNV}' has no resolved number of bits per address unit.")
+
+			checker = cls(memoryMap.AddressUnitBits)
+			checker.AddMemoryMap(memoryMap, 0, component.VLNV)
+			conflicts.extend(checker.Check(gaps))
+
+		return conflicts
+
+	@staticmethod
+	def _Path(table: MemoryMapTable, blockIndex: int, registerIndex: Nullable[int] = None) -> str:
+		block = AddressBlock(table, blockIndex)
+		path = f"{block.MemoryMap.Name}/{block.Name}"
+		return path if registerIndex is None else f"{path}/{Register(table, registerIndex).Name}"
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} {len(self._placements)} memory maps>"
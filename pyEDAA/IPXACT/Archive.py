@@ -0,0 +1,409 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___ ______  __    _    ____ _____                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    |_ _|  _ \ \/ /   / \  / ___|_   _|                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \    | || |_) \  /   / _ \| |     | |                                          #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ _ | ||  __//  \  / ___ \ |___  | |                                          #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___|_|  /_/\_\/_/   \_\____| |_|                                          #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2025 Patrick Lehmann - Bötzingen, Germany                                                             #
+# Copyright 2016-2016 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Reading IP-XACT documents directly from zip and tar archives without extracting them.
+
+Members are decompressed on demand, when a document is loaded or a file is opened. Decompressed member contents are
+kept in a size-bounded cache, so documents referenced multiple times are decompressed once.
+"""
+from collections           import OrderedDict
+from fnmatch               import fnmatch
+from io                    import BytesIO, RawIOBase, SEEK_SET
+from pathlib               import Path, PurePosixPath
+from posixpath             import normpath
+from sys                   import version_info
+from tarfile               import TarFile, is_tarfile, open as openTar, TarError
+from threading             import RLock
+from typing                import Dict, IO, Iterator, Optional as Nullable, Type, Union
+from zipfile               import ZipFile, is_zipfile, BadZipFile
+
+from pyTooling.Decorators  import export, readonly
+from pyTooling.MetaClasses import ExtendedType
+from pyTooling.Common      import getFullyQualifiedName
+
+from pyEDAA.IPXACT           import RootElement, IPXACTException, TreeRetention, ValidationLevel
+from pyEDAA.IPXACT.Component import Component
+from pyEDAA.IPXACT.Loader    import DocumentHeader, ReadDocumentHeaderFromStream
+
+
+def _ResolveMember(archivePath: Path, name: str, relativeTo: str) -> str:
+	member = normpath(str(PurePosixPath(relativeTo).parent / name.replace("\\", "/")))
+	if member.startswith("../") or member == ".." or member.startswith("/"):
+		raise IPXACTException(f"File '{name}' referenced from '{relativeTo}' is outside of archive '{archivePath}'.")
+
+	return member
+
+
+class _MemberLocator(metaclass=ExtendedType, slots=True):
+	"""Locates the files of a component loaded from an archive member. It doesn't refer to the archive, so it can be pickled."""
+
+	_archivePath: Path  #: Resolved path of the archive file.
+	_member:      str   #: Member name of the component.
+
+	def __init__(self, archivePath: Path, member: str) -> None:
+		self._archivePath = archivePath
+		self._member =      member
+
+	def __call__(self, name: Path) -> Nullable[Path]:
+		try:
+			return self._archivePath / _ResolveMember(self._archivePath, name.as_posix(), self._member)
+		except IPXACTException:
+			return None
+
+
+class _TarMemberStream(RawIOBase):
+	"""
+	Streams a tar member without reading it into memory.
+
+	Tar members share the archive's file object. Each member stream seeks to its own position before reading, thus reads
+	are serialized by the archive's lock. The stream is seekable, so it can be parsed incrementally in two passes.
+	"""
+
+	def __init__(self, stream: IO[bytes], lock: RLock) -> None:
+		super().__init__()
+		self._stream = stream
+		self._lock =   lock
+
+	def readable(self) -> bool:
+		return True
+
+	def readinto(self, buffer) -> int:
+		with self._lock:
+			data = self._stream.read(len(buffer))
+		buffer[:len(data)] = data
+		return len(data)
+
+	def seekable(self) -> bool:
+		return True
+
+	def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+		with self._lock:
+			return self._stream.seek(offset, whence)
+
+	def tell(self) -> int:
+		with self._lock:
+			return self._stream.tell()
+
+	def close(self) -> None:
+		if not self.closed:
+			self._stream.close()
+		super().close()
+
+
+@export
+class Archive(metaclass=ExtendedType, slots=True):
+	"""
+	A read-only view on a zip or tar archive (optionally gzip, bzip2 or xz compressed) containing IP-XACT documents.
+
+	Members are addressed by their POSIX path inside the archive. For use in a :class:`~pyEDAA.IPXACT.Repository.Repository`,
+	each member has a pseudo path made of the archive's path and the member name (see :meth:`PathOf`).
+
+	.. code-block:: python
+
+	   from pyEDAA.IPXACT.Archive import Archive
+
+	   with Archive(Path("drops/ip.zip")) as archive:
+	     component = archive.Load("ip/component.xml")
+	"""
+
+	_path:       Path                           #: Resolved path of the archive file.
+	_archive:    Union[ZipFile, TarFile]        #: Opened archive.
+	_members:    Dict[str, Union[str, object]]  #: Archive members by normalized name.
+	_lock:       RLock                          #: Lock serializing access to the archive and the cache.
+	_cache:      OrderedDict                    #: Decompressed member contents in LRU order.
+	_cacheSize:  int                            #: Sum of cached content sizes in bytes.
+	_capacity:   int                            #: Maximum sum of cached content sizes in bytes.
+	_hits:       int                            #: Number of cache hits.
+	_misses:     int                            #: Number of cache misses.
+
+	def __init__(self, archiveFile: Path, capacity: int = 64 * 1024 * 1024) -> None:
+		"""
+		Opens an archive and lists its members.
+
+		Zip archives have a table of contents, which is read. Tar archives have none, thus their member headers are scanned.
+		For compressed tar archives, this decompresses the whole archive once. Reading a member located before the current
+		position decompresses the archive again from its start up to that member.
+
+		:param archiveFile:      Path to a zip or tar archive.
+		:param capacity:         Maximum number of bytes of decompressed member contents kept in the cache.
+		:raises TypeError:       If parameter 'archiveFile' is not a Path.
+		:raises IPXACTException: If the file doesn't exist or is neither a zip nor a tar archive.
+		"""
+		if not isinstance(archiveFile, Path):
+			ex = TypeError(f"Parameter 'archiveFile' is not a Path.")
+			if version_info >= (3, 11):  # pragma: no cover
+				ex.add_note(f"Got type '{getFullyQualifiedName(archiveFile)}'.")
+			raise ex
+		elif not archiveFile.exists():
+			raise IPXACTException(f"Archive '{archiveFile}' not found.") from FileNotFoundError(str(archiveFile))
+
+		self._path =      archiveFile.resolve()
+		self._lock =      RLock()
+		self._cache =     OrderedDict()
+		self._cacheSize = 0
+		self._capacity =  capacity
+		self._hits =      0
+		self._misses =    0
+
+		try:
+			if is_zipfile(archiveFile):
+				self._archive = ZipFile(archiveFile)
+				self._members = {normpath(info.filename): info.filename for info in self._archive.infolist() if not info.is_dir()}
+			elif is_tarfile(archiveFile):
+				self._archive = openTar(archiveFile, mode="r:*")
+				self._members = {normpath(info.name): info for info in self._archive.getmembers() if info.isfile()}
+			else:
+				raise IPXACTException(f"File '{archiveFile}' is neither a zip nor a tar archive.")
+		except (OSError, BadZipFile, TarError) as ex:
+			raise IPXACTException(f"Couldn't open archive '{archiveFile}'.") from ex
+
+	@readonly
+	def File(self) -> Path:
+		return self._path
+
+	@readonly
+	def Capacity(self) -> int:
+		return self._capacity
+
+	@readonly
+	def CacheSize(self) -> int:
+		return self._cacheSize
+
+	@readonly
+	def Hits(self) -> int:
+		return self._hits
+
+	@readonly
+	def Misses(self) -> int:
+		return self._misses
+
+	def Resolve(self, name: str, relativeTo: str = "") -> str:
+		"""
+		Resolves a file name as used in ``ipxactFile`` or ``fileSet`` references to a member name.
+
+		:param name:             File name, possibly relative.
+		:param relativeTo:       Member name of the referencing document. Relative names are resolved against its directory.
+		:returns:                Normalized member name.
+		:raises IPXACTException: If the name points outside the archive.
+		"""
+		return _ResolveMember(self._path, name, relativeTo)
+
+	def PathOf(self, member: str) -> Path:
+		"""
+		Returns the pseudo path of a member.
+
+		:param member: Member name.
+		:returns:      Archive path joined with the member name.
+		"""
+		return self._path / member
+
+	def MemberOf(self, path: Path) -> str:
+		"""
+		Returns the member name of a pseudo path.
+
+		:param path:        Pseudo path created by :meth:`PathOf`.
+		:returns:           Member name.
+		:raises ValueError: If the path doesn't belong to this archive.
+		"""
+		return path.relative_to(self._path).as_posix()
+
+	def Members(self, pattern: str = "*.xml") -> Iterator[str]:
+		"""
+		Iterates all file members matching a glob pattern.
+
+		:param pattern: Glob pattern for member names.
+		:returns:       An iterator of member names in archive order.
+		"""
+		for member in self._members:
+			if fnmatch(PurePosixPath(member).name, pattern):
+				yield member
+
+	def Open(self, member: str) -> IO[bytes]:
+		"""
+		Opens a member for streaming. The content isn't cached.
+
+		:param member:           Member name.
+		:returns:                Binary file object.
+		:raises IPXACTException: If the member doesn't exist or can't be read.
+		"""
+		with self._lock:
+			if member in self._cache:
+				return BytesIO(self._cache[member])
+
+			return self._OpenMember(member)
+
+	def Read(self, member: str) -> bytes:
+		"""
+		Returns the decompressed content of a member. The content is cached.
+
+		:param member:           Member name.
+		:returns:                Content of the member.
+		:raises IPXACTException: If the member doesn't exist or can't be read.
+		"""
+		with self._lock:
+			try:
+				content = self._cache[member]
+				self._cache.move_to_end(member)
+				self._hits += 1
+				return content
+			except KeyError:
+				self._misses += 1
+
+			stream = self._OpenMember(member)
+
+		# Decompress outside the lock, so reads of different members run concurrently. Tar member streams take the lock per
+		# chunk, as they share the archive's file object.
+		with stream:
+			try:
+				content = stream.read()
+			except (OSError, BadZipFile, TarError) as ex:
+				raise IPXACTException(f"Couldn't read '{member}' from archive '{self._path}'.") from ex
+
+		with self._lock:
+			# Another thread might have cached the member meanwhile.
+			if member not in self._cache and len(content) <= self._capacity:
+				self._cache[member] = content
+				self._cacheSize += len(content)
+				while self._cacheSize > self._capacity:
+					_, evicted = self._cache.popitem(last=False)
+					self._cacheSize -= len(evicted)
+
+			return content
+
+	def ReadHeader(self, member: str) -> DocumentHeader:
+		"""
+		Reads the header of an IP-XACT document without decompressing the whole member.
+
+		:param member:           Member name.
+		:returns:                The document header with the member's pseudo path.
+		:raises IPXACTException: If the member doesn't exist, can't be read or isn't well-formed.
+		"""
+		with self.Open(member) as stream:
+			return ReadDocumentHeaderFromStream(stream, self.PathOf(member))
+
+	def ScanHeaders(self, pattern: str = "*.xml") -> Iterator[DocumentHeader]:
+		"""
+		Reads the headers of all supported IP-XACT documents in the archive.
+
+		Members which aren't well-formed or aren't supported IP-XACT documents are skipped.
+
+		:param pattern: Glob pattern for member names.
+		:returns:       An iterator of document headers.
+		"""
+		for member in self.Members(pattern):
+			try:
+				header = self.ReadHeader(member)
+			except IPXACTException:
+				continue
+
+			if header.DocumentType is not None:
+				yield header
+
+	def Load(
+		self,
+		member: str,
+		cls: Nullable[Type[RootElement]] = None,
+		streaming: bool = False,
+		retention: TreeRetention = TreeRetention.Keep,
+		validation: ValidationLevel = ValidationLevel.Full
+	) -> RootElement:
+		"""
+		Loads an IP-XACT document from a member.
+
+		The files of a component's file sets are located inside the archive: :attr:`File.Location
+		<pyEDAA.IPXACT.Component.File.Location>` is the pseudo path of the referenced member (see :meth:`PathOf`), which can
+		be opened via ``archive.Open(archive.MemberOf(file.Location))``. Files outside the archive have no location.
+
+		:param member:           Member name.
+		:param cls:              Root element class. If ``None``, the document type is detected from the root tag.
+		:param streaming:        If true, parse the member incrementally while it's decompressed.
+		:param retention:        Retention policy for the lxml tree after parsing.
+		:param validation:       Validation level applied while loading.
+		:returns:                The loaded document.
+		:raises IPXACTException: If the member doesn't exist, can't be read, isn't supported or isn't valid.
+		"""
+		if cls is None:
+			cls = self.ReadHeader(member).DocumentType
+			if cls is None:
+				raise IPXACTException(f"Member '{member}' of archive '{self._path}' isn't a supported IP-XACT document.")
+
+		if streaming:
+			with self.Open(member) as stream:
+				document = cls(stream, parse=True, streaming=True, retention=retention, validation=validation)
+		else:
+			document = cls(self.Read(member), parse=True, retention=retention, validation=validation)
+
+		if isinstance(document, Component):
+			document.LocateFiles(_MemberLocator(self._path, member))
+
+		return document
+
+	def ClearCache(self) -> None:
+		"""Removes all decompressed member contents from the cache."""
+		with self._lock:
+			self._cache.clear()
+			self._cacheSize = 0
+
+	def Close(self) -> None:
+		"""Closes the archive and clears the cache."""
+		with self._lock:
+			self.ClearCache()
+			self._archive.close()
+
+	def _OpenMember(self, member: str) -> IO[bytes]:
+		try:
+			info = self._members[member]
+		except KeyError:
+			raise IPXACTException(f"File '{member}' not found in archive '{self._path}'.") from None
+
+		try:
+			if isinstance(self._archive, ZipFile):
+				return self._archive.open(info)
+			else:
+				return _TarMemberStream(self._archive.extractfile(info), self._lock)
+		except (OSError, BadZipFile, TarError) as ex:
+			raise IPXACTException(f"Couldn't read '{member}' from archive '{self._path}'.") from ex
+
+	def __contains__(self, member: str) -> bool:
+		return member in self._members
+
+	def __len__(self) -> int:
+		return len(self._members)
+
+	def __enter__(self) -> "Archive":
+		return self
+
+	def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+		self.Close()
+
+	def __repr__(self) -> str:
+		return f"<Archive '{self._path}' {len(self._members)} members, {self._hits} hits, {self._misses} misses>"
@@ -29,17 +29,17 @@
 # SPDX-License-Identifier: Apache-2.0                                                                                  #
 # ==================================================================================================================== #
 #
+from os.path  import relpath
 from pathlib  import Path
 from sys      import version_info
-from textwrap import dedent
-from typing import List, Dict, Optional as Nullable, ClassVar
+from typing   import Dict, Iterator, List, Optional as Nullable, ClassVar, Tuple
 
-from lxml.etree import QName, _Element
+from lxml.etree import _Element, _Comment
 
 from pyTooling.Decorators    import export, readonly
 from pyTooling.Common        import getFullyQualifiedName
 
-from pyEDAA.IPXACT           import NamedElement, RootElement, VLNV, IPXACTException, __DEFAULT_SCHEMA__, IPXACTSchema, Element
+from pyEDAA.IPXACT           import NamedElement, RootElement, VLNV, IPXACTException, __DEFAULT_SCHEMA__, IPXACTSchema, TreeRetention, ValidationLevel, TagTable, XMLSource, EscapeXml
 from pyEDAA.IPXACT.Component import Component
 
 
@@ -47,16 +47,24 @@ from pyEDAA.IPXACT.Component import Component
 class IpxactFile(NamedElement):
 	"""Represents a IP-XACT file."""
 
-	_name:        str    #: Name
-	_description: str    #: Description
+	_name:        str              #: Name
+	_description: Nullable[str]    #: Description
 
-	def __init__(self, vlnv: VLNV, name: str, description: str):
+	_elementTable: ClassVar[TagTable] = TagTable({"ipxactFile": None})  #: Accepted tag names of this element.
+	_tagTable:     ClassVar[TagTable] = TagTable({                      #: Handlers for child elements.
+		"vlnv":             TagTable.Set("vlnv", VLNV.FromXml),
+		"name":             TagTable.Text("name"),
+		"description":      TagTable.Text("description"),
+		"vendorExtensions": None
+	})
+
+	def __init__(self, vlnv: VLNV, name: str, description: Nullable[str] = None):
 		"""
 		Instantiates an ipxactFile structure.
 
 		:param vlnv:        A Vendor-Library-Name-Version unique identified.
 		:param name:        Name of the IP-XACT file.
-		:param description: A description text.
+		:param description: An optional description text.
 		:raises TypeError:  If parameter vlnv is not a VLNV.
 		:raises TypeError:  If parameter name is not a string.
 		:raises ValueError: If parameter name is empty.
@@ -73,7 +81,9 @@ class IpxactFile(NamedElement):
 		elif name == "":
 			raise ValueError(f"Parameter 'name' is empty.")
 
-		if not isinstance(description, str):
+		if description is None:
+			pass
+		elif not isinstance(description, str):
 			ex = TypeError(f"Parameter 'description' is not a string.")
 			if version_info >= (3, 11):  # pragma: no cover
 				ex.add_note(f"Got type '{getFullyQualifiedName(description)}'.")
@@ -85,50 +95,45 @@ class IpxactFile(NamedElement):
 		self._name = name
 		self._description = description
 
+	@readonly
+	def Name(self) -> str:
+		return self._name
+
+	@readonly
+	def Description(self) -> Nullable[str]:
+		return self._description
+
 	@classmethod
 	def FromXml(cls, ipxactFileElement):
 		"""Constructs an instance of ``IpxactFile`` from an lxml element."""
 
-		elementTag = QName(ipxactFileElement.tag)
-		if elementTag.localname != "ipxactFile":
+		if ipxactFileElement.tag not in cls._elementTable:
 			raise IPXACTException("Expected tag 'ipxactFile'.")
 
-		vlnv = None
-		name = None
-		description = None
-		for subElement in ipxactFileElement:
-			element = QName(subElement)
-			if element.localname == "vlnv":
-				vendor =  subElement.get("vendor")
-				library = subElement.get("library")
-				name2 =   subElement.get("name")
-				version = subElement.get("version")
-
-				vlnv = VLNV(vendor, library, name2, version)
-			elif element.localname == "name":
-				name = subElement.text
-			elif element.localname == "description":
-				description = subElement.text
-			else:
-				raise IPXACTException(f"Unsupported tag '{ipxactFileElement.localname}' in node 'ipxactFile'.")
-
-		ipxactFile = cls(vlnv, name, description)
-		return ipxactFile
+		fields = {}
+		cls._tagTable.ParseChildren(fields, ipxactFileElement, "node 'ipxactFile'")
+
+		return cls(fields.get("vlnv"), fields.get("name"), fields.get("description"))
 
 	def ToXml(self, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__):
 		"""Converts the object's data into XML format."""
 		# WORKAROUND:
 		#   Python <=3.11:
 		#   {'\t' * indent} is not supported by Python before 3.12 due to a backslash within {...}
-		indent = "\t" * indent
+		indentation = "\t" * indent
 		xmlns = schema.NamespacePrefix
-		return dedent(f"""\
-			{indent}<{xmlns}:ipxactFile>
-			{indent}\t{self._vlnv.ToXml(0, schema)}
-			{indent}\t<{xmlns}:name>{self._name}</{xmlns}:name>
-			{indent}\t<{xmlns}:description>{self._description}</{xmlns}:description>
-			{indent}</{xmlns}:ipxactFile>
-		""")
+		buffer = (
+			f"{indentation}<{xmlns}:ipxactFile>\n"
+			f"{self._vlnv.ToXml(indent + 1, schema)}"
+			f"{indentation}\t<{xmlns}:name>{EscapeXml(self._name)}</{xmlns}:name>\n"
+		)
+
+		if self._description is not None:
+			buffer += f"{indentation}\t<{xmlns}:description>{EscapeXml(self._description)}</{xmlns}:description>\n"
+
+		buffer += f"{indentation}</{xmlns}:ipxactFile>\n"
+
+		return buffer
 
 
 @export
@@ -136,55 +141,72 @@ class Catalog(RootElement):
 	"""Represents an IP-XACT catalog."""
 
 	_rootTagName:            ClassVar[str] = "catalog"
+	_tagTable:               ClassVar[TagTable] = RootElement._tagTable.Derive({
+		"catalogs":               lambda self, element: self._ParseIpxactFiles(element, self._catalogs),
+		"busDefinitions":         lambda self, element: self._ParseIpxactFiles(element, self._busDefinitions),
+		"abstractionDefinitions": lambda self, element: self._ParseIpxactFiles(element, self._abstractionDefinitions),
+		"components":             lambda self, element: self._ParseIpxactFiles(element, self._componentFiles),
+		"abstractors":            lambda self, element: self._ParseIpxactFiles(element, self._abstractors),
+		"designs":                lambda self, element: self._ParseIpxactFiles(element, self._designs),
+		"designConfigurations":   lambda self, element: self._ParseIpxactFiles(element, self._designConfigurations),
+		"generatorChains":        lambda self, element: self._ParseIpxactFiles(element, self._generatorChains),
+		"typeDefinitions":        lambda self, element: self._ParseIpxactFiles(element, self._typeDefinitions)
+	})
 
-	_abstractionDefinitions: List
-	_abstractors:            List
-	_busInterfaces:          List
 	_catalogs:               Dict[VLNV, IpxactFile]
-	_components:             List
-	_designConfigurations:   List
-	_designs:                List
-	_generatorChains:        List
+	_busDefinitions:         Dict[VLNV, IpxactFile]
+	_abstractionDefinitions: Dict[VLNV, IpxactFile]
+	_componentFiles:         Dict[VLNV, IpxactFile]
+	_components:             List[Component]
+	_abstractors:            Dict[VLNV, IpxactFile]
+	_designs:                Dict[VLNV, IpxactFile]
+	_designConfigurations:   Dict[VLNV, IpxactFile]
+	_generatorChains:        Dict[VLNV, IpxactFile]
+	_typeDefinitions:        Dict[VLNV, IpxactFile]
 
 	def __init__(
 		self,
-		catalogFile: Nullable[Path] = None,
+		catalogFile: Nullable[XMLSource] = None,
 		parse: bool = False,
 		vlnv: Nullable[VLNV] = None,
-		description: Nullable[str] = None
+		description: Nullable[str] = None,
+		streaming: bool = False,
+		retention: TreeRetention = TreeRetention.Keep,
+		validation: ValidationLevel = ValidationLevel.Full
 	):
-		self._abstractionDefinitions =  []
-		self._abstractors =             []
-		self._busInterfaces =           []
 		self._catalogs =                {}
+		self._busDefinitions =          {}
+		self._abstractionDefinitions =  {}
+		self._componentFiles =          {}
 		self._components =              []
-		self._designConfigurations =    []
-		self._designs =                 []
-		self._generatorChains =         []
-
-		super().__init__(catalogFile, parse, vlnv, description)
-
-	def Parse(self, element: _Element) -> None:
-		elementLocalname = QName(element).localname
-		if elementLocalname == "catalogs":
-			for ipxactFileElement in element:
-				self.AddItem(IpxactFile.FromXml(ipxactFileElement))
-		elif elementLocalname == "abstractionDefinitions":
-			pass
-		elif elementLocalname == "components":
-			pass
-		elif elementLocalname == "abstractors":
-			pass
-		elif elementLocalname == "designs":
-			pass
-		elif elementLocalname == "designConfigurations":
-			pass
-		elif elementLocalname == "generatorChains":
-			pass
-		else:
-			raise IPXACTException(f"Unsupported tag '{elementLocalname}' at root-level.")
+		self._abstractors =             {}
+		self._designs =                 {}
+		self._designConfigurations =    {}
+		self._generatorChains =         {}
+		self._typeDefinitions =         {}
+
+		super().__init__(catalogFile, parse, vlnv, description, streaming, retention, validation)
+
+	@staticmethod
+	def _ParseIpxactFiles(element: _Element, ipxactFiles: Dict[VLNV, IpxactFile]) -> None:
+		for ipxactFileElement in element:
+			if isinstance(ipxactFileElement, _Comment):
+				continue
+
+			ipxactFile = IpxactFile.FromXml(ipxactFileElement)
+			ipxactFiles[ipxactFile.VLNV] = ipxactFile
 
 	def AddItem(self, item) -> None:
+		"""
+		Adds a reference to a catalog or a component.
+
+		When the catalog is written, a component is referenced by its file path relative to this catalog's directory. If the
+		catalog has no file, the component's path is used as is. A component without a file is referenced as ``<name>.xml``
+		next to this catalog, where ``<name>`` is the name part of its VLNV.
+
+		:param item:       IP-XACT file reference of a catalog, or a component.
+		:raises TypeError: If parameter item is neither an IpxactFile nor a Component.
+		"""
 		if isinstance(item, IpxactFile):
 			self._catalogs[item.VLNV] = item
 		elif isinstance(item, Component):
@@ -195,38 +217,98 @@ class Catalog(RootElement):
 				ex.add_note(f"Got type '{getFullyQualifiedName(item)}'.")
 			raise ex
 
-	def ToXml(self, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
-		"""Converts the object's data into XML format."""
+	def _RelativeName(self, item: RootElement) -> str:
+		if item.File is None:
+			return f"{item.VLNV.Name}.xml"
+		elif self._file is None:
+			return item.File.as_posix()
 
-		xmlns = schema.NamespacePrefix
-		buffer = dedent(f"""\
-			<?xml version="1.0" encoding="UTF-8"?>
-			<{xmlns}:catalog
-			\txmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
-			\txmlns:{xmlns}="{schema.SchemaUri}"
-			\txsi:schemaLocation="{schema.SchemaUri} {schema.SchemaUrl}">
-			{self._vlnv.ToXml(schema, isVersionedIdentifier=True)}
-			\t<{xmlns}:description>{self._description}</{xmlns}:description>
-			""")
-
-		if self._catalogs:
-			buffer += f"\t<{xmlns}:catalogs>\n"
-			for ipxactFile in self._catalogs:
-				buffer += ipxactFile.ToXml(2, schema)
-			buffer += f"\t</{xmlns}:catalogs>\n"
+		try:
+			return Path(relpath(item.File.absolute(), self._file.absolute().parent)).as_posix()
+		except ValueError:  # pragma: no cover
+			# Windows: paths on different drives have no relative path.
+			return item.File.absolute().as_posix()
 
+	def IterateReferences(self) -> Iterator[Tuple[str, IpxactFile]]:
+		"""
+		Iterates all IP-XACT files referenced by this catalog.
+
+		:returns: An iterator of tuples made of the section name (e.g. ``components``) and the referenced IP-XACT file.
+		"""
+		for section, ipxactFiles in self._Sections():
+			for ipxactFile in ipxactFiles.values():
+				yield section, ipxactFile
+
+	def _Sections(self) -> Tuple[Tuple[str, Dict[VLNV, IpxactFile]], ...]:
+		componentFiles = self._componentFiles
 		if self._components:
-			buffer += f"\t<{xmlns}:components>\n"
-			for ipxactFile in self._components:
-				buffer += ipxactFile.ToXml(2, schema)
-			buffer += f"\t</{xmlns}:components>\n"
+			componentFiles = componentFiles.copy()
+			for component in self._components:
+				componentFiles[component.VLNV] = IpxactFile(component.VLNV, self._RelativeName(component), component._description)
+
+		return (
+			("catalogs",               self._catalogs),
+			("busDefinitions",         self._busDefinitions),
+			("abstractionDefinitions", self._abstractionDefinitions),
+			("components",             componentFiles),
+			("abstractors",            self._abstractors),
+			("designs",                self._designs),
+			("designConfigurations",   self._designConfigurations),
+			("generatorChains",        self._generatorChains),
+			("typeDefinitions",        self._typeDefinitions),
+		)
+
+	def IterateXml(self, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> Iterator[str]:
+		"""
+		Converts the object's data into XML format and yields it in chunks.
 
-		buffer += dedent(f"""\
-			</{xmlns}:catalog>
-			""")
+		:param schema: XML schema.
+		:returns:      An iterator of XML formatted strings.
+		"""
+		yield from self._IterateXmlStart(schema)
 
-		return buffer
+		for section, ipxactFiles in self._Sections():
+			if ipxactFiles:
+				yield from self._IterateXmlSection(section, ipxactFiles.values(), schema)
+
+		yield from self._IterateXmlEnd(schema)
 
 	@readonly
 	def Catalogs(self) -> Dict[VLNV, IpxactFile]:
 		return self._catalogs
+
+	@readonly
+	def BusDefinitions(self) -> Dict[VLNV, IpxactFile]:
+		return self._busDefinitions
+
+	@readonly
+	def AbstractionDefinitions(self) -> Dict[VLNV, IpxactFile]:
+		return self._abstractionDefinitions
+
+	@readonly
+	def ComponentFiles(self) -> Dict[VLNV, IpxactFile]:
+		return self._componentFiles
+
+	@readonly
+	def Components(self) -> List[Component]:
+		return self._components
+
+	@readonly
+	def Abstractors(self) -> Dict[VLNV, IpxactFile]:
+		return self._abstractors
+
+	@readonly
+	def Designs(self) -> Dict[VLNV, IpxactFile]:
+		return self._designs
+
+	@readonly
+	def DesignConfigurations(self) -> Dict[VLNV, IpxactFile]:
+		return self._designConfigurations
+
+	@readonly
+	def GeneratorChains(self) -> Dict[VLNV, IpxactFile]:
+		return self._generatorChains
+
+	@readonly
+	def TypeDefinitions(self) -> Dict[VLNV, IpxactFile]:
+		return self._typeDefinitions
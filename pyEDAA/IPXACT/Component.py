@@ -31,14 +31,14 @@
 #
 from pathlib              import Path
 from sys                  import version_info
-from textwrap             import dedent
-from typing import List, Optional as Nullable, ClassVar, Dict, Union
+from typing               import List, Optional as Nullable, ClassVar, Dict, Iterator, Callable
 
-from lxml.etree           import _Element, QName, _Comment
+from lxml.etree           import _Element, _Comment
 from pyTooling.Decorators import export, readonly
 from pyTooling.Common     import getFullyQualifiedName
 
-from pyEDAA.IPXACT        import __DEFAULT_SCHEMA__, RootElement, VLNV, IPXACTSchema, Element, IPXACTException
+from pyEDAA.IPXACT           import __DEFAULT_SCHEMA__, RootElement, VLNV, IPXACTSchema, Element, TreeRetention, ValidationLevel, TagTable, XMLSource, EscapeXml, IPXACTException
+from pyEDAA.IPXACT.MemoryMap import MemoryMap, MemoryMapTable
 
 
 @export
@@ -52,7 +52,7 @@ class BusInterface(Element):
 	def FromXml(cls, element: _Element) -> "BusInterface":
 		pass
 
-	def ToXml(self, indent=0):
+	def ToXml(self, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
 		"""Converts the object's data into XML format."""
 
 		return ""
@@ -65,7 +65,7 @@ class IndirectInterface(Element):
 	def __init__(self, vlnv: VLNV) -> None:
 		super().__init__(vlnv)
 
-	def ToXml(self, indent=0):
+	def ToXml(self, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
 		"""Converts the object's data into XML format."""
 
 		return ""
@@ -78,7 +78,7 @@ class Channel(Element):
 	def __init__(self, vlnv: VLNV) -> None:
 		super().__init__(vlnv)
 
-	def ToXml(self, indent=0):
+	def ToXml(self, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
 		"""Converts the object's data into XML format."""
 
 		return ""
@@ -91,7 +91,7 @@ class RemapState(Element):
 	def __init__(self, vlnv: VLNV) -> None:
 		super().__init__(vlnv)
 
-	def ToXml(self, indent=0):
+	def ToXml(self, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
 		"""Converts the object's data into XML format."""
 
 		return ""
@@ -104,20 +104,7 @@ class AddressSpace(Element):
 	def __init__(self, vlnv: VLNV) -> None:
 		super().__init__(vlnv)
 
-	def ToXml(self, indent=0):
-		"""Converts the object's data into XML format."""
-
-		return ""
-
-
-@export
-class MemoryMap(Element):
-	"""Represents an IP-XACT memory map."""
-
-	def __init__(self, vlnv: VLNV) -> None:
-		super().__init__(vlnv)
-
-	def ToXml(self, indent=0):
+	def ToXml(self, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
 		"""Converts the object's data into XML format."""
 
 		return ""
@@ -130,20 +117,20 @@ class Model(Element):
 	def __init__(self, vlnv: VLNV) -> None:
 		super().__init__(vlnv)
 
-	def ToXml(self, indent=0):
+	def ToXml(self, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
 		"""Converts the object's data into XML format."""
 
 		return ""
 
 
 @export
-class ComponentGenerator:
+class ComponentGenerator(Element):
 	"""Represents an IP-XACT component generator."""
 
 	def __init__(self, vlnv: VLNV) -> None:
 		super().__init__(vlnv)
 
-	def ToXml(self, indent=0):
+	def ToXml(self, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
 		"""Converts the object's data into XML format."""
 
 		return ""
@@ -156,7 +143,7 @@ class Choice(Element):
 	def __init__(self, vlnv: VLNV) -> None:
 		super().__init__(vlnv)
 
-	def ToXml(self, indent=0):
+	def ToXml(self, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
 		"""Converts the object's data into XML format."""
 
 		return ""
@@ -164,39 +151,60 @@ class Choice(Element):
 
 @export
 class File(Element):
-	_path: Path
+	"""Represents an IP-XACT file."""
+
+	_path:     Path            #: Path to the file.
+	_fileType: Nullable[str]   #: File type.
+	_location: Nullable[Path]  #: Location of the file resolved by the component's file locator, if any.
+
+	_tagTable: ClassVar[TagTable] = TagTable({  #: Handlers for child elements.
+		"name":         TagTable.Text("name"),
+		"fileType":     TagTable.Text("fileType"),
+		"isStructural": None
+	})
 
-	def __init__(self, path: Path) -> None:
-		self._path = Path
+	def __init__(self, path: Path, fileType: Nullable[str] = None) -> None:
+		self._path =     path
+		self._fileType = fileType
+		self._location = None
 
 	@readonly
 	def Path(self) -> Path:
 		return self._path
 
-	@classmethod
-	def FromXml(cls, fileElement: _Element) -> "FileSet":
-		fileName = None
-		fileType = None
-		for element in fileElement:
-			if isinstance(element, _Comment):
-				continue
+	@readonly
+	def Location(self) -> Nullable[Path]:
+		"""
+		Read-only property to access the resolved location of the file.
 
-			elementLocalname = QName(element).localname
-			if elementLocalname == "name":
-				fileName = element.text
-			elif elementLocalname == "fileType":
-				fileType = element.text
-			elif elementLocalname == "isStructural":
-				pass
-			else:
-				raise IPXACTException(f"Unsupported tag '{elementLocalname}' at component → fileSets → fileSet → file.")
+		:returns: The location set by :meth:`Component.LocateFiles` or ``None``, if the file wasn't located.
+		"""
+		return self._location
 
-		return cls(Path(fileName))
+	@readonly
+	def FileType(self) -> Nullable[str]:
+		return self._fileType
+
+	@classmethod
+	def FromXml(cls, fileElement: _Element) -> "File":
+		fields = {}
+		cls._tagTable.ParseChildren(fields, fileElement, "component → fileSets → fileSet → file")
+
+		return cls(Path(fields.get("name")), fields.get("fileType"))
 
-	def ToXml(self, indent=0):
+	def ToXml(self, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
 		"""Converts the object's data into XML format."""
 
-		return ""
+		# WORKAROUND:
+		#   Python <=3.11:
+		#   {'\t' * indent} is not supported by Python before 3.12 due to a backslash within {...}
+		indent = "\t" * indent
+		xmlns = schema.NamespacePrefix
+		buffer = f"{indent}<{xmlns}:file>\n{indent}\t<{xmlns}:name>{EscapeXml(self._path.as_posix())}</{xmlns}:name>\n"
+		if self._fileType is not None:
+			buffer += f"{indent}\t<{xmlns}:fileType>{EscapeXml(self._fileType)}</{xmlns}:fileType>\n"
+
+		return buffer + f"{indent}</{xmlns}:file>\n"
 
 	def __str__(self) -> str:
 		return str(self._path)
@@ -209,6 +217,11 @@ class FileSet(Element):
 	_name: str
 	_files: List[File]
 
+	_tagTable: ClassVar[TagTable] = TagTable({  #: Handlers for child elements.
+		"name": TagTable.Text("name"),
+		"file": TagTable.Append("files", File.FromXml)
+	})
+
 	def __init__(self, name: str, files: List[File]) -> None:
 		self._name =  name
 		self._files = [file for file in files]
@@ -227,26 +240,33 @@ class FileSet(Element):
 
 	@classmethod
 	def FromXml(cls, fileSetElement: _Element) -> "FileSet":
-		files = []
-		fileSetName = None
-		for element in fileSetElement:
-			if isinstance(element, _Comment):
-				continue
-
-			elementLocalname = QName(element).localname
-			if elementLocalname == "name":
-				fileSetName = element.text
-			elif elementLocalname == "file":
-				files.append(File.FromXml(element))
-			else:
-				raise IPXACTException(f"Unsupported tag '{elementLocalname}' at component → fileSets → fileSet.")
-
-		return cls(fileSetName, files)
+		fields = {"files": []}
+		cls._tagTable.ParseChildren(fields, fileSetElement, "component → fileSets → fileSet")
+
+		return cls(fields.get("name"), fields["files"])
+
+	def IterateXml(self, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> Iterator[str]:
+		"""
+		Converts the object's data into XML format and yields one chunk per file.
+
+		:param indent: Level of indentations.
+		:param schema: XML schema.
+		:returns:      An iterator of XML formatted strings.
+		"""
+		# WORKAROUND:
+		#   Python <=3.11:
+		#   {'\t' * indent} is not supported by Python before 3.12 due to a backslash within {...}
+		indentation = "\t" * indent
+		xmlns = schema.NamespacePrefix
+		yield f"{indentation}<{xmlns}:fileSet>\n{indentation}\t<{xmlns}:name>{EscapeXml(self._name)}</{xmlns}:name>\n"
+		for file in self._files:
+			yield file.ToXml(indent + 1, schema)
+		yield f"{indentation}</{xmlns}:fileSet>\n"
 
-	def ToXml(self, indent=0):
+	def ToXml(self, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
 		"""Converts the object's data into XML format."""
 
-		return ""
+		return "".join(self.IterateXml(indent, schema))
 
 	def __str__(self) -> str:
 		return f"FileSet {self._name} ({len(self._files)})"
@@ -259,7 +279,7 @@ class WhiteboxElement(Element):
 	def __init__(self, vlnv: VLNV) -> None:
 		super().__init__(vlnv)
 
-	def ToXml(self, indent=0):
+	def ToXml(self, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
 		"""Converts the object's data into XML format."""
 
 		return ""
@@ -272,7 +292,7 @@ class Cpu(Element):
 	def __init__(self, vlnv: VLNV) -> None:
 		super().__init__(vlnv)
 
-	def ToXml(self, indent=0):
+	def ToXml(self, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
 		"""Converts the object's data into XML format."""
 
 		return ""
@@ -285,7 +305,7 @@ class OtherClockDriver(Element):
 	def __init__(self, vlnv: VLNV) -> None:
 		super().__init__(vlnv)
 
-	def ToXml(self, indent=0):
+	def ToXml(self, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
 		"""Converts the object's data into XML format."""
 
 		return ""
@@ -298,7 +318,7 @@ class ResetType(Element):
 	def __init__(self, vlnv: VLNV) -> None:
 		super().__init__(vlnv)
 
-	def ToXml(self, indent=0):
+	def ToXml(self, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
 		"""Converts the object's data into XML format."""
 
 		return ""
@@ -311,7 +331,7 @@ class Parameter(Element):
 	def __init__(self, vlnv: VLNV) -> None:
 		super().__init__(vlnv)
 
-	def ToXml(self, indent=0):
+	def ToXml(self, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
 		"""Converts the object's data into XML format."""
 
 		return ""
@@ -324,7 +344,7 @@ class Assertion(Element):
 	def __init__(self, vlnv: VLNV) -> None:
 		super().__init__(vlnv)
 
-	def ToXml(self, indent=0):
+	def ToXml(self, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
 		"""Converts the object's data into XML format."""
 
 		return ""
@@ -332,16 +352,49 @@ class Assertion(Element):
 
 @export
 class Component(RootElement):
-	"""Represents an IP-XACT components."""
+	"""
+	Represents an IP-XACT components.
 
-	_rootTagName:         ClassVar[str] = "component"
+	Sections with a registered builder (see :attr:`_sectionTable`) aren't built while loading, if the lxml tree is kept
+	(see :attr:`TreeRetention.Keep`). Instead, the section's tag is recorded and the section's objects are built from the
+	kept tree on first access of the corresponding property. Errors within a deferred section are raised on first access.
+	While streaming or if the tree isn't kept, sections are built while loading, so the file is never re-read to build
+	a section.
+	"""
 
+	_rootTagName:         ClassVar[str] = "component"
+	_tagTable:            ClassVar[TagTable] = RootElement._tagTable.Derive({
+		"busInterfaces":       None,
+		"indirectInterfaces":  None,
+		"channels":            None,
+		"remapStates":         None,
+		"addressSpaces":       None,
+		"memoryMaps":          lambda self, element: self._DeferSection("memoryMaps", element),
+		"model":               None,
+		"componentGenerators": None,
+		"choices":             None,
+		"fileSets":            lambda self, element: self._DeferSection("fileSets", element),
+		"whiteboxElements":    None,
+		"cpus":                None,
+		"otherClockDrivers":   None,
+		"resetTypes":          None,
+		"parameters":          None,
+		"assertions":          None
+	})
+	_sectionTable:        ClassVar[Dict[str, Callable[["Component", _Element], None]]] = {  #: Builders for deferred sections.
+		"memoryMaps":          lambda self, element: self._ParseMemoryMaps(element),
+		"fileSets":            lambda self, element: self._ParseFileSets(element)
+	}
+
+	_pendingSections:     Dict[str, str]  #: Tags of sections, which are not yet built.
+	_fileLocator:         Nullable[Callable[[Path], Nullable[Path]]]  #: Resolves file names of file sets to locations.
 	_busInterfaces:       List
 	_indirectInterfaces:  List
 	_channels:            List
 	_remapStates:         List
 	_addressSpaces:       List
-	_memoryMaps:          List
+	_memoryMaps:          List[MemoryMap]
+	_memoryMapTable:      Nullable[MemoryMapTable]
 	_model:               Nullable[Model]
 	_componentGenerators: List
 	_choices:             List
@@ -355,10 +408,13 @@ class Component(RootElement):
 
 	def __init__(
 		self,
-		componentFile: Nullable[Path] = None,
+		componentFile: Nullable[XMLSource] = None,
 		parse: bool = False,
 		vlnv: Nullable[VLNV] = None,
-		description: Nullable[str] = None
+		description: Nullable[str] = None,
+		streaming: bool = False,
+		retention: TreeRetention = TreeRetention.Keep,
+		validation: ValidationLevel = ValidationLevel.Full
 	):
 		self._busInterfaces = []
 		self._indirectInterfaces = []
@@ -366,6 +422,7 @@ class Component(RootElement):
 		self._remapStates = []
 		self._addressSpaces = []
 		self._memoryMaps = []
+		self._memoryMapTable = None
 		self._model = None
 		self._componentGenerators = []
 		self._choices = []
@@ -376,55 +433,103 @@ class Component(RootElement):
 		self._resetTypes = []
 		self._parameters = []
 		self._assertions = []
+		self._pendingSections = {}
+		self._fileLocator = None
 
-		super().__init__(componentFile, parse, vlnv, description)
+		super().__init__(componentFile, parse, vlnv, description, streaming, retention, validation)
 
 	@readonly
 	def FileSets(self) -> Dict[str, FileSet]:
+		self._MaterializeSection("fileSets")
 		return self._fileSets
 
-	def Parse(self, element: _Element) -> None:
-		elementLocalname = QName(element).localname
-		if elementLocalname == "busInterfaces":
-			pass
-		# for busInterfaceElement in element:
-		# 	self.AddItem(BusInterface.FromXml(busInterfaceElement))
-		elif elementLocalname == "indirectInterfaces":
-			pass
-		elif elementLocalname == "channels":
-			pass
-		elif elementLocalname == "remapStates":
-			pass
-		elif elementLocalname == "addressSpaces":
-			pass
-		elif elementLocalname == "memoryMaps":
-			pass
-		elif elementLocalname == "model":
-			pass
-		elif elementLocalname == "componentGenerators":
-			pass
-		elif elementLocalname == "choices":
-			pass
-		elif elementLocalname == "fileSets":
-			for fileSetElement in element:
-				if isinstance(fileSetElement, _Comment):
-					continue
-
-				self.AddFileSet(FileSet.FromXml(fileSetElement))
-		elif elementLocalname == "whiteboxElements":
-			pass
-		elif elementLocalname == "cpus":
-			pass
-		elif elementLocalname == "otherClockDrivers":
-			pass
-		elif elementLocalname == "resetTypes":
-			pass
-		elif elementLocalname == "parameters":
-			pass
-		elif elementLocalname == "assertions":
-			pass
+	@readonly
+	def MemoryMaps(self) -> List[MemoryMap]:
+		self._MaterializeSection("memoryMaps")
+		return self._memoryMaps
+
+	@readonly
+	def MemoryMapTable(self) -> Nullable[MemoryMapTable]:
+		"""
+		Read-only property to access the column-wise storage of the memory maps read from file.
+
+		:returns: The memory map table or ``None``, if the component has no memory maps read from file.
+		"""
+		self._MaterializeSection("memoryMaps")
+		return self._memoryMapTable
+
+	@readonly
+	def PendingSections(self) -> List[str]:
+		"""
+		Read-only property to access the names of sections, which are not yet built.
+
+		:returns: List of section names.
+		"""
+		return list(self._pendingSections)
+
+	def _DeferSection(self, name: str, element: _Element) -> None:
+		if self._xmlRoot is not None and self._retention is TreeRetention.Keep:
+			self._pendingSections[name] = element.tag
 		else:
-			raise IPXACTException(f"Unsupported tag '{elementLocalname}' at root-level.")
+			# The tree is discarded section by section while streaming or isn't kept after loading. Re-reading the file
+			# would skip the validation and could pick up a changed file.
+			self._sectionTable[name](self, element)
+
+	def _MaterializeSection(self, name: str) -> None:
+		"""
+		Builds a deferred section, if it's still pending.
+
+		Materialization isn't synchronized. If multiple threads access a component's sections, the first access should be
+		serialized (e.g. by calling :meth:`Materialize` before sharing the component).
+
+		:param name:             Name of the section.
+		:raises IPXACTException: If the section's XML isn't available anymore.
+		"""
+		if (tag := self._pendingSections.get(name)) is None:
+			return
+		elif (xmlRoot := self.XmlRoot) is None or (element := xmlRoot.find(tag)) is None:
+			raise IPXACTException(f"Section '{name}' can't be built, because the document's XML isn't available anymore.")
+
+		del self._pendingSections[name]
+		self._sectionTable[name](self, element)
+
+	def Materialize(self) -> None:
+		"""
+		Builds all deferred sections.
+		"""
+		for name in list(self._pendingSections):
+			self._MaterializeSection(name)
+
+	def LocateFiles(self, locator: Callable[[Path], Nullable[Path]]) -> None:
+		"""
+		Sets a locator, which resolves the file names of file sets read from XML to locations (see :attr:`File.Location`).
+
+		Files of already built file sets are located immediately, files of a deferred file set section when it's built.
+
+		:param locator: Callable mapping a file name to its location or ``None``, if the file can't be located.
+		"""
+		self._fileLocator = locator
+		if "fileSets" not in self._pendingSections:
+			for fileSet in self._fileSets.values():
+				self._LocateFileSet(fileSet)
+
+	def _LocateFileSet(self, fileSet: FileSet) -> None:
+		for file in fileSet._files:
+			file._location = self._fileLocator(file._path)
+
+	def _ParseFileSets(self, element: _Element) -> None:
+		for fileSetElement in element:
+			if isinstance(fileSetElement, _Comment):
+				continue
+
+			fileSet = FileSet.FromXml(fileSetElement)
+			if self._fileLocator is not None:
+				self._LocateFileSet(fileSet)
+			self.AddFileSet(fileSet)
+
+	def _ParseMemoryMaps(self, element: _Element) -> None:
+		self._memoryMapTable = MemoryMapTable.FromXml(element)
+		self._memoryMaps.extend(self._memoryMapTable.MemoryMaps)
 
 	def SetItem(self, item):
 		if isinstance(item, Model):
@@ -444,6 +549,7 @@ class Component(RootElement):
 		elif isinstance(item, AddressSpace):
 			self._addressSpaces.append(item)
 		elif isinstance(item, MemoryMap):
+			self._MaterializeSection("memoryMaps")
 			self._memoryMaps.append(item)
 		elif isinstance(item, ComponentGenerator):
 			self._componentGenerators.append(item)
@@ -470,6 +576,7 @@ class Component(RootElement):
 			raise ex
 
 	def AddFileSet(self, fileset: FileSet):
+		self._MaterializeSection("fileSets")
 		if not isinstance(fileset, FileSet):
 			ex = TypeError("Parameter 'fileset' is not a FileSet.")
 			if version_info >= (3, 11):  # pragma: no cover
@@ -481,117 +588,47 @@ class Component(RootElement):
 
 		self._fileSets[fileset._name] = fileset
 
-	def ToXml(self, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
-		"""Converts the object's data into XML format."""
+	def IterateXml(self, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> Iterator[str]:
+		"""
+		Converts the object's data into XML format and yields it in chunks.
 
-		xmlns = schema.NamespacePrefix
-		buffer = dedent(f"""\
-			<?xml version="1.0" encoding="UTF-8" ?>
-			<{xmlns}:component
-			\txmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
-			\txmlns:{xmlns}="{schema.SchemaUri}"
-			\txsi:schemaLocation="{schema.SchemaUri} {schema.SchemaUrl}">
-			{self._vlnv.ToXml(schema, isVersionedIdentifier=True)}
-			\t<{xmlns}:description>{self._description}</{xmlns}:description>
-			""")
+		:param schema: XML schema.
+		:returns:      An iterator of XML formatted strings.
+		"""
+		self.Materialize()
+		yield from self._IterateXmlStart(schema)
 
 		if self._busInterfaces:
-			buffer += f"\t<{xmlns}:busInterfaces>\n"
-			for busInterface in self._busInterfaces:
-				buffer += busInterface.ToXml(2, schema)
-			buffer += f"\t</{xmlns}:busInterfaces>\n"
-
+			yield from self._IterateXmlSection("busInterfaces", self._busInterfaces, schema)
 		if self._indirectInterfaces:
-			buffer += f"\t<{xmlns}:indirectInterfaces>\n"
-			for indirectInterface in self._indirectInterfaces:
-				buffer += indirectInterface.ToXml(2, schema)
-			buffer += f"\t</{xmlns}:indirectInterfaces>\n"
-
+			yield from self._IterateXmlSection("indirectInterfaces", self._indirectInterfaces, schema)
 		if self._channels:
-			buffer += f"\t<{xmlns}:channels>\n"
-			for channel in self._channels:
-				buffer += channel.ToXml(2, schema)
-			buffer += f"\t</{xmlns}:channels>\n"
-
+			yield from self._IterateXmlSection("channels", self._channels, schema)
 		if self._remapStates:
-			buffer += f"\t<{xmlns}:remapStates>\n"
-			for remapState in self._remapStates:
-				buffer += remapState.ToXml(2, schema)
-			buffer += f"\t</{xmlns}:remapStates>\n"
-
+			yield from self._IterateXmlSection("remapStates", self._remapStates, schema)
 		if self._addressSpaces:
-			buffer += f"\t<{xmlns}:addressSpaces>\n"
-			for addressSpace in self._addressSpaces:
-				buffer += addressSpace.ToXml(2, schema)
-			buffer += f"\t</{xmlns}:addressSpaces>\n"
-
+			yield from self._IterateXmlSection("addressSpaces", self._addressSpaces, schema)
 		if self._memoryMaps:
-			buffer += f"\t<{xmlns}:memoryMaps>\n"
-			for memoryMap in self._memoryMaps:
-				buffer += memoryMap.ToXml(2, schema)
-			buffer += f"\t</{xmlns}:memoryMaps>\n"
-
+			yield from self._IterateXmlSection("memoryMaps", self._memoryMaps, schema)
 		if self._model:
-			buffer += f"\t<{xmlns}:model>\n"
-			buffer += self._model.ToXml(2, schema)
-			buffer += f"\t</{xmlns}:model>\n"
-
+			yield from self._IterateXmlSection("model", (self._model, ), schema)
 		if self._componentGenerators:
-			buffer += f"\t<{xmlns}:componentGenerators>\n"
-			for componentGenerator in self._componentGenerators:
-				buffer += componentGenerator.ToXml(2, schema)
-			buffer += f"\t</{xmlns}:componentGenerators>\n"
-
+			yield from self._IterateXmlSection("componentGenerators", self._componentGenerators, schema)
 		if self._choices:
-			buffer += f"\t<{xmlns}:choices>\n"
-			for choice in self._choices:
-				buffer += choice.ToXml(2, schema)
-			buffer += f"\t</{xmlns}:choices>\n"
-
+			yield from self._IterateXmlSection("choices", self._choices, schema)
 		if self._fileSets:
-			buffer += f"\t<{xmlns}:fileSets>\n"
-			for fileSet in self._fileSets:
-				buffer += fileSet.ToXml(2, schema)
-			buffer += f"\t</{xmlns}:fileSets>\n"
-
+			yield from self._IterateXmlSection("fileSets", self._fileSets.values(), schema)
 		if self._whiteboxElements:
-			buffer += f"\t<{xmlns}:whiteboxElements>\n"
-			for whiteboxElement in self._whiteboxElements:
-				buffer += whiteboxElement.ToXml(2, schema)
-			buffer += f"\t</{xmlns}:whiteboxElements>\n"
-
+			yield from self._IterateXmlSection("whiteboxElements", self._whiteboxElements, schema)
 		if self._cpus:
-			buffer += f"\t<{xmlns}:cpus>\n"
-			for cpu in self._cpus:
-				buffer += cpu.ToXml(2, schema)
-			buffer += f"\t</{xmlns}:cpus>\n"
-
+			yield from self._IterateXmlSection("cpus", self._cpus, schema)
 		if self._otherClockDrivers:
-			buffer += f"\t<{xmlns}:otherClockDrivers>\n"
-			for otherClockDriver in self._otherClockDrivers:
-				buffer += otherClockDriver.ToXml(2, schema)
-			buffer += f"\t</{xmlns}:otherClockDrivers>\n"
-
+			yield from self._IterateXmlSection("otherClockDrivers", self._otherClockDrivers, schema)
 		if self._resetTypes:
-			buffer += f"\t<{xmlns}:resetTypes>\n"
-			for resetType in self._resetTypes:
-				buffer += resetType.ToXml(2, schema)
-			buffer += f"\t</{xmlns}:resetTypes>\n"
-
+			yield from self._IterateXmlSection("resetTypes", self._resetTypes, schema)
 		if self._parameters:
-			buffer += f"\t<{xmlns}:parameters>\n"
-			for parameter in self._parameters:
-				buffer += parameter.ToXml(2, schema)
-			buffer += f"\t</{xmlns}:parameters>\n"
-
+			yield from self._IterateXmlSection("parameters", self._parameters, schema)
 		if self._assertions:
-			buffer += f"\t<{xmlns}:assertions>\n"
-			for assertion in self._assertions:
-				buffer += assertion.ToXml(2, schema)
-			buffer += f"\t</{xmlns}:assertions>\n"
-
-		buffer += dedent(f"""\
-				</{xmlns}:component>
-				""")
+			yield from self._IterateXmlSection("assertions", self._assertions, schema)
 
-		return buffer
+		yield from self._IterateXmlEnd(schema)
@@ -29,16 +29,13 @@
 # SPDX-License-Identifier: Apache-2.0                                                                                  #
 # ==================================================================================================================== #
 #
-from pathlib              import Path
 from sys                  import version_info
-from textwrap             import dedent
-from typing               import List, ClassVar, Optional as Nullable
+from typing               import List, ClassVar, Iterator, Optional as Nullable
 
-from lxml.etree           import _Element, QName
 from pyTooling.Decorators import export
 from pyTooling.Common     import getFullyQualifiedName
 
-from pyEDAA.IPXACT        import RootElement, __DEFAULT_SCHEMA__, VLNV, IPXACTSchema, Element, IPXACTException
+from pyEDAA.IPXACT        import RootElement, __DEFAULT_SCHEMA__, VLNV, IPXACTSchema, Element, TreeRetention, ValidationLevel, TagTable, XMLSource, EscapeXml
 
 
 @export
@@ -46,6 +43,11 @@ class Design(RootElement):
 	"""Represents an IP-XACT design."""
 
 	_rootTagName:            ClassVar[str] = "design"
+	_tagTable:               ClassVar[TagTable] = RootElement._tagTable.Derive({
+		"componentInstances": None,
+		"interconnections":   None,
+		"adHocConnections":   None
+	})
 
 	_componentInstances: List
 	_interconnections:   List
@@ -53,10 +55,13 @@ class Design(RootElement):
 
 	def __init__(
 		self,
-		designFile: Nullable[Path] = None,
+		designFile: Nullable[XMLSource] = None,
 		parse: bool = False,
 		vlnv: Nullable[VLNV] = None,
-		description: Nullable[str] = None
+		description: Nullable[str] = None,
+		streaming: bool = False,
+		retention: TreeRetention = TreeRetention.Keep,
+		validation: ValidationLevel = ValidationLevel.Full
 	):
 		"""
 		Instantiates a design structure.
@@ -68,7 +73,7 @@ class Design(RootElement):
 		self._interconnections =   []
 		self._adHocConnections =   []
 
-		super().__init__(designFile, parse, vlnv, description)
+		super().__init__(designFile, parse, vlnv, description, streaming, retention, validation)
 
 		# if not isinstance(description, str):
 		# 	ex = TypeError(f"Parameter 'description' is not a string.")
@@ -78,21 +83,6 @@ class Design(RootElement):
 		# elif description == "":
 		# 	raise ValueError(f"Parameter 'description' is empty.")
 
-	def Parse(self, element: _Element) -> None:
-		elementLocalname = QName(element).localname
-		if elementLocalname == "componentInstances":
-			pass
-			# for ipxactFileElement in element:
-			# 	self.AddItem(IpxactFile.FromXml(ipxactFileElement))
-		elif elementLocalname == "componentInstances":
-			pass
-		elif elementLocalname == "interconnections":
-			pass
-		elif elementLocalname == "adHocConnections":
-			pass
-		else:
-			raise IPXACTException(f"Unsupported tag '{elementLocalname}' at root-level.")
-
 	def AddItem(self, item) -> None:
 		if isinstance(item, ComponentInstance):
 			self._componentInstances.append(item)
@@ -103,43 +93,23 @@ class Design(RootElement):
 		else:
 			raise ValueError()
 
-	def ToXml(self, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
-		"""Converts the object's data into XML format."""
+	def IterateXml(self, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> Iterator[str]:
+		"""
+		Converts the object's data into XML format and yields it in chunks.
 
-		xmlns = schema.NamespacePrefix
-		buffer = dedent(f"""\
-			<?xml version="1.0" encoding="UTF-8"?>
-			<{xmlns}:design
-			\txmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
-			\txmlns:{xmlns}="{schema.SchemaUri}"
-			\txsi:schemaLocation="{schema.SchemaUri} {schema.SchemaUrl}">
-			{self._vlnv.ToXml(schema, isVersionedIdentifier=True)}
-			\t<{xmlns}:description>{self._description}</{xmlns}:description>
-			""")
+		:param schema: XML schema.
+		:returns:      An iterator of XML formatted strings.
+		"""
+		yield from self._IterateXmlStart(schema)
 
 		if self._componentInstances:
-			buffer += f"\t<{xmlns}:componentInstances>\n"
-			for componentInstance in self._componentInstances:
-				buffer += componentInstance.ToXml(2, schema)
-			buffer += f"\t</{xmlns}:componentInstances>\n"
-
+			yield from self._IterateXmlSection("componentInstances", self._componentInstances, schema)
 		if self._interconnections:
-			buffer += f"\t<{xmlns}:interconnections>\n"
-			for interconnection in self._interconnections:
-				buffer += interconnection.ToXml(2, schema)
-			buffer += f"\t</{xmlns}:interconnections>\n"
-
+			yield from self._IterateXmlSection("interconnections", self._interconnections, schema)
 		if self._adHocConnections:
-			buffer += f"\t<{xmlns}:adHocConnections>\n"
-			for adHocConnection in self._adHocConnections:
-				buffer += adHocConnection.ToXml(2, schema)
-			buffer += f"\t</{xmlns}:adHocConnections>\n"
-
-		buffer += dedent(f"""\
-			</{xmlns}:design>
-			""")
+			yield from self._IterateXmlSection("adHocConnections", self._adHocConnections, schema)
 
-		return buffer
+		yield from self._IterateXmlEnd(schema)
 
 
 @export
@@ -189,15 +159,15 @@ class IpxactFile(Element):
 		# WORKAROUND:
 		#   Python <=3.11:
 		#   {'\t' * indent} is not supported by Python before 3.12 due to a backslash within {...}
-		indent = "\t" * indent
+		indentation = "\t" * indent
 		xmlns = schema.NamespacePrefix
-		return dedent(f"""\
-			{indent}<{xmlns}:ipxactFile>
-			{indent}\t{self._vlnv.ToXml(indent)}
-			{indent}\t<{xmlns}:name>{self._name}</{xmlns}:name>
-			{indent}\t<{xmlns}:description>{self._description}</{xmlns}:description>
-			{indent}</{xmlns}:ipxactFile>
-		""")
+		return (
+			f"{indentation}<{xmlns}:ipxactFile>\n"
+			f"{self._vlnv.ToXml(indent + 1, schema)}"
+			f"{indentation}\t<{xmlns}:name>{EscapeXml(self._name)}</{xmlns}:name>\n"
+			f"{indentation}\t<{xmlns}:description>{EscapeXml(self._description)}</{xmlns}:description>\n"
+			f"{indentation}</{xmlns}:ipxactFile>\n"
+		)
 
 
 @export
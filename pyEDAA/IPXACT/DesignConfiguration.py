@@ -29,14 +29,11 @@
 # SPDX-License-Identifier: Apache-2.0                                                                                  #
 # ==================================================================================================================== #
 #
-from pathlib              import Path
-from textwrap             import dedent
-from typing               import Optional as Nullable, ClassVar
+from typing               import Optional as Nullable, ClassVar, Iterator
 
-from lxml.etree           import _Element, QName
 from pyTooling.Decorators import export
 
-from pyEDAA.IPXACT        import RootElement, __DEFAULT_SCHEMA__, VLNV, IPXACTSchema, IPXACTException
+from pyEDAA.IPXACT        import RootElement, __DEFAULT_SCHEMA__, VLNV, IPXACTSchema, TreeRetention, ValidationLevel, XMLSource
 
 
 @export
@@ -51,24 +48,19 @@ class DesignConfiguration(RootElement):
 
 	def __init__(
 		self,
-		designConfigurationFile: Nullable[Path] = None,
+		designConfigurationFile: Nullable[XMLSource] = None,
 		parse: bool = False,
 		vlnv: Nullable[VLNV] = None,
-		description: Nullable[str] = None
+		description: Nullable[str] = None,
+		streaming: bool = False,
+		retention: TreeRetention = TreeRetention.Keep,
+		validation: ValidationLevel = ValidationLevel.Full
 	):
 		self._generatorChainConfiguration =  None
 		self._interconnectionConfiguration = None
 		self._viewConfiguration =            None
 
-		super().__init__(designConfigurationFile, parse, vlnv, description)
-
-	def Parse(self, element: _Element) -> None:
-		elementLocalname = QName(element).localname
-		# if elementLocalname == "catalogs":
-		# 	for ipxactFileElement in element:
-		# 		self.AddItem(IpxactFile.FromXml(ipxactFileElement))
-		# else:
-		raise IPXACTException(f"Unsupported tag '{elementLocalname}' at root-level.")
+		super().__init__(designConfigurationFile, parse, vlnv, description, streaming, retention, validation)
 
 	def SetItem(self, item):
 		if isinstance(item,   GeneratorChainConfiguration):
@@ -80,40 +72,32 @@ class DesignConfiguration(RootElement):
 		else:
 			raise ValueError()
 
-	def ToXml(self, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
-		"""Converts the object's data into XML format."""
+	def IterateXml(self, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> Iterator[str]:
+		"""
+		Converts the object's data into XML format and yields it in chunks.
 
+		:param schema: XML schema.
+		:returns:      An iterator of XML formatted strings.
+		"""
 		xmlns = schema.NamespacePrefix
-		buffer = dedent(f"""\
-			<?xml version="1.0" encoding="UTF-8"?>
-			<{xmlns}:designConfiguration
-			\txmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
-			\txmlns:{xmlns}="{schema.SchemaUri}"
-			\txsi:schemaLocation="{schema.SchemaUri} {schema.SchemaUrl}">
-			{self._vlnv.ToXml(schema, isVersionedIdentifier=True)}
-			\t<{xmlns}:description>{self._description}</{xmlns}:description>
-			""")
+		yield from self._IterateXmlStart(schema)
 
 		if self._generatorChainConfiguration:
-			buffer += f"\t<{xmlns}:componentInstances>\n"
-			buffer += self._generatorChainConfiguration.ToXml(2, schema)
-			buffer += f"\t</{xmlns}:componentInstances>\n"
+			yield f"\t<{xmlns}:generatorChainConfiguration>\n"
+			yield self._generatorChainConfiguration.ToXml(2, schema)
+			yield f"\t</{xmlns}:generatorChainConfiguration>\n"
 
 		if self._interconnectionConfiguration:
-			buffer += f"\t<{xmlns}:interconnectionConfiguration>\n"
-			buffer += self._interconnectionConfiguration.ToXml(2, schema)
-			buffer += f"\t</{xmlns}:interconnectionConfiguration>\n"
+			yield f"\t<{xmlns}:interconnectionConfiguration>\n"
+			yield self._interconnectionConfiguration.ToXml(2, schema)
+			yield f"\t</{xmlns}:interconnectionConfiguration>\n"
 
 		if self._viewConfiguration:
-			buffer += f"\t<{xmlns}:viewConfiguration>\n"
-			buffer += self._viewConfiguration.ToXml(2, schema)
-			buffer += f"\t</{xmlns}:viewConfiguration>\n"
-
-		buffer += dedent(f"""\
-			</{xmlns}:designConfiguration>
-			""")
+			yield f"\t<{xmlns}:viewConfiguration>\n"
+			yield self._viewConfiguration.ToXml(2, schema)
+			yield f"\t</{xmlns}:viewConfiguration>\n"
 
-		return buffer
+		yield from self._IterateXmlEnd(schema)
 
 
 @export
@@ -29,14 +29,11 @@
 # SPDX-License-Identifier: Apache-2.0                                                                                  #
 # ==================================================================================================================== #
 #
-from pathlib              import Path
-from textwrap             import dedent
-from typing               import ClassVar, Optional as Nullable, List
+from typing               import ClassVar, Optional as Nullable, List, Iterator
 
-from lxml.etree           import _Element, QName
 from pyTooling.Decorators import export
 
-from pyEDAA.IPXACT        import RootElement, __DEFAULT_SCHEMA__, VLNV, IPXACTException
+from pyEDAA.IPXACT        import RootElement, __DEFAULT_SCHEMA__, VLNV, IPXACTSchema, TreeRetention, ValidationLevel, XMLSource, EscapeXml
 
 
 @export
@@ -48,31 +45,28 @@ class GeneratorChain(RootElement):
 	_displayName:                  str
 	_chainGroup:                   List
 	_generatorChainSelector:       "GeneratorChainSelector"
+	_componentGeneratorSelector:   "ComponentGeneratorSelector"
 	_interconnectionConfiguration: List
 	_generator:                    "Generator"
 
 	def __init__(
 		self,
-		generatorChainFile: Nullable[Path] = None,
+		generatorChainFile: Nullable[XMLSource] = None,
 		parse: bool = False,
 		vlnv: Nullable[VLNV] = None,
-		description: Nullable[str] = None
+		description: Nullable[str] = None,
+		streaming: bool = False,
+		retention: TreeRetention = TreeRetention.Keep,
+		validation: ValidationLevel = ValidationLevel.Full
 	):
 		self._displayName =                   ""  # displayName
 		self._chainGroup =                    []  # chainGroup
 		self._generatorChainSelector =        None
+		self._componentGeneratorSelector =    None
 		self._interconnectionConfiguration =  None
 		self._generator =                     None
 
-		super().__init__(generatorChainFile, parse, vlnv, description)
-
-	def Parse(self, element: _Element) -> None:
-		elementLocalname = QName(element).localname
-		# if elementLocalname == "catalogs":
-		# 	for ipxactFileElement in element:
-		# 		self.AddItem(IpxactFile.FromXml(ipxactFileElement))
-		# else:
-		raise IPXACTException(f"Unsupported tag '{elementLocalname}' at root-level.")
+		super().__init__(generatorChainFile, parse, vlnv, description, streaming, retention, validation)
 
 	def SetItem(self, item):
 		if isinstance(item,   GeneratorChainSelector):      self._generatorChainSelector =      item
@@ -81,49 +75,35 @@ class GeneratorChain(RootElement):
 		else:
 			raise ValueError()
 
-	def ToXml(self) -> str:
-		"""Converts the object's data into XML format."""
+	def IterateXml(self, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> Iterator[str]:
+		"""
+		Converts the object's data into XML format and yields it in chunks.
 
-		buffer = dedent("""\
-			<?xml version="1.0" encoding="UTF-8"?>
-			<{xmlns}:generatorChain
-				xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
-				xmlns:{xmlns}="{schemaUri}"
-				xsi:schemaLocation="{schemaUri} {schemaUrl}">
-			{versionedIdentifier}
-				<{xmlns}:displayName>{displayName}</{xmlns}:displayName>
-				<{xmlns}:description>{description}</{xmlns}:description>
-				<{xmlns}:chainGroup>{chainGroup}</{xmlns}:chainGroup>
-			""").format(
-				xmlns=__DEFAULT_SCHEMA__.NamespacePrefix,
-				schemaUri=__DEFAULT_SCHEMA__.SchemaUri,
-				schemaUrl=__DEFAULT_SCHEMA__.SchemaUrl,
-				versionedIdentifier=self._vlnv.ToXml(isVersionedIdentifier=True),
-				displayName=self._displayName,
-				description=self._description,
-				chainGroup=self._chainGroup
-			)
+		:param schema: XML schema.
+		:returns:      An iterator of XML formatted strings.
+		"""
+		xmlns = schema.NamespacePrefix
+		yield from self._IterateXmlStart(schema, self._displayName if self._displayName != "" else None)
+
+		for chainGroup in self._chainGroup:
+			yield f"\t<{xmlns}:chainGroup>{EscapeXml(chainGroup)}</{xmlns}:chainGroup>\n"
 
 		if self._generatorChainSelector:
-			buffer += "\t<{xmlns}:generatorChainSelector>\n"
-			buffer += self._generatorChainSelector.ToXml(2)
-			buffer += "\t</{xmlns}:generatorChainSelector>\n"
+			yield f"\t<{xmlns}:generatorChainSelector>\n"
+			yield self._generatorChainSelector.ToXml(2, schema)
+			yield f"\t</{xmlns}:generatorChainSelector>\n"
 
 		if self._componentGeneratorSelector:
-			buffer += "\t<{xmlns}:componentGeneratorSelector>\n"
-			buffer += self._componentGeneratorSelector.ToXml(2)
-			buffer += "\t</{xmlns}:componentGeneratorSelector>\n"
+			yield f"\t<{xmlns}:componentGeneratorSelector>\n"
+			yield self._componentGeneratorSelector.ToXml(2, schema)
+			yield f"\t</{xmlns}:componentGeneratorSelector>\n"
 
 		if self._generator:
-			buffer += "\t<{xmlns}:generator>\n"
-			buffer += self._generator.ToXml(2)
-			buffer += "\t</{xmlns}:generator>\n"
-
-		buffer += dedent("""\
-			</{xmlns}:generatorChain>
-			""")
+			yield f"\t<{xmlns}:generator>\n"
+			yield self._generator.ToXml(2, schema)
+			yield f"\t</{xmlns}:generator>\n"
 
-		return buffer.format(xmlns=__DEFAULT_SCHEMA__.NamespacePrefix)
+		yield from self._IterateXmlEnd(schema)
 
 
 @export
@@ -133,7 +113,7 @@ class GeneratorChainSelector:
 	def __init__(self) -> None:
 		pass
 
-	def ToXml(self, indent=0):
+	def ToXml(self, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
 		"""Converts the object's data into XML format."""
 
 		return ""
@@ -146,7 +126,7 @@ class ComponentGeneratorSelector:
 	def __init__(self) -> None:
 		pass
 
-	def ToXml(self, indent=0):
+	def ToXml(self, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
 		"""Converts the object's data into XML format."""
 
 		return ""
@@ -159,7 +139,7 @@ class Generator:
 	def __init__(self) -> None:
 		pass
 
-	def ToXml(self, indent=0):
+	def ToXml(self, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
 		"""Converts the object's data into XML format."""
 
 		return ""
@@ -0,0 +1,279 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___ ______  __    _    ____ _____                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    |_ _|  _ \ \/ /   / \  / ___|_   _|                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \    | || |_) \  /   / _ \| |     | |                                          #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ _ | ||  __//  \  / ___ \ |___  | |                                          #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___|_|  /_/\_\/_/   \_\____| |_|                                          #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2025 Patrick Lehmann - Bötzingen, Germany                                                             #
+# Copyright 2016-2016 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Per-phase timing and counter instrumentation for loading IP-XACT documents.
+
+While a :class:`LoadStatistics` instance is installed, each loaded document records the wall and CPU time spent per
+phase, the number of bytes read, the number of elements per tag and the number of skipped root-level sections. The
+per-document statistics are aggregated by the installed instance, including those of documents which failed to load.
+If no instance is installed, loading checks a single class variable per phase.
+"""
+from collections          import Counter
+from contextlib           import contextmanager
+from pathlib              import Path
+from threading            import RLock
+from time                 import perf_counter, thread_time
+from typing               import Callable, Dict, Iterator, Optional as Nullable, Tuple
+
+from pyTooling.Decorators import export, readonly
+from pyTooling.MetaClasses import ExtendedType
+
+from pyEDAA.IPXACT        import RootElement
+
+
+__PHASES__ = ("read", "parse", "schema", "validate", "model")  #: Phases of loading a document.
+
+
+@export
+class DocumentStatistics(metaclass=ExtendedType, slots=True):
+	"""
+	Timing and counters of loading a single document.
+
+	Phase times are exclusive: while a nested phase is active, the enclosing phase is paused. Thus, the sum of all phase
+	times is the instrumented load time.
+
+	* ``read`` - opening and mapping or reading the file.
+	* ``parse`` - parsing (and decompressing) the document. In streaming mode, this includes the validation.
+	* ``schema`` - looking up or compiling the XML schema.
+	* ``validate`` - validating the document against the XML schema.
+	* ``model`` - building the object model by the ``Parse`` handlers.
+	"""
+
+	_file:            Nullable[Path]       #: Path of the document or ``None`` for buffers and file objects.
+	_wallTimes:       Dict[str, float]     #: Wall time per phase in seconds.
+	_cpuTimes:        Dict[str, float]     #: CPU time of the loading thread per phase in seconds.
+	_bytesRead:       int                  #: Number of bytes read.
+	_elementCounts:   Counter              #: Number of elements per tag (in Clark notation), counted while parsing.
+	_skippedSections: Counter              #: Number of skipped root-level sections per tag (in Clark notation).
+	_failed:          bool                 #: True, if loading the document failed.
+	_currentPhase:    Nullable[str]        #: Currently active phase.
+	_phaseStart:      Tuple[float, float]  #: Wall and CPU time, when the active phase was entered or resumed.
+
+	def __init__(self, file: Nullable[Path] = None) -> None:
+		self._file =            file
+		self._wallTimes =       dict.fromkeys(__PHASES__, 0.0)
+		self._cpuTimes =        dict.fromkeys(__PHASES__, 0.0)
+		self._bytesRead =       0
+		self._elementCounts =   Counter()
+		self._skippedSections = Counter()
+		self._failed =          False
+		self._currentPhase =    None
+		self._phaseStart =      (0.0, 0.0)
+
+	@readonly
+	def File(self) -> Nullable[Path]:
+		return self._file
+
+	@readonly
+	def WallTimes(self) -> Dict[str, float]:
+		return self._wallTimes
+
+	@readonly
+	def CpuTimes(self) -> Dict[str, float]:
+		return self._cpuTimes
+
+	@readonly
+	def WallTime(self) -> float:
+		return sum(self._wallTimes.values())
+
+	@readonly
+	def BytesRead(self) -> int:
+		return self._bytesRead
+
+	@readonly
+	def ElementCounts(self) -> Counter:
+		return self._elementCounts
+
+	@readonly
+	def SkippedSections(self) -> Counter:
+		return self._skippedSections
+
+	@readonly
+	def Failed(self) -> bool:
+		return self._failed
+
+	@contextmanager
+	def Phase(self, name: str) -> Iterator[None]:
+		"""
+		Accounts the time spent in the with-statement to a phase.
+
+		:param name: Name of the phase.
+		"""
+		previousPhase = self._currentPhase
+		self._Account(previousPhase)
+		self._currentPhase = name
+		try:
+			yield
+		finally:
+			self._Account(name)
+			self._currentPhase = previousPhase
+
+	def _Account(self, phase: Nullable[str]) -> None:
+		wallTime = perf_counter()
+		cpuTime =  thread_time()
+		if phase is not None:
+			startWallTime, startCpuTime = self._phaseStart
+			self._wallTimes[phase] = self._wallTimes.get(phase, 0.0) + wallTime - startWallTime
+			self._cpuTimes[phase] =  self._cpuTimes.get(phase, 0.0) + cpuTime - startCpuTime
+
+		self._phaseStart = (wallTime, cpuTime)
+
+	def AddBytesRead(self, count: int) -> None:
+		self._bytesRead += count
+
+	def MarkFailed(self) -> None:
+		self._failed = True
+
+	def SkipSection(self, tag: str) -> None:
+		self._skippedSections[tag] += 1
+
+	def __str__(self) -> str:
+		status = " (failed)" if self._failed else ""
+		return f"{self._file}{status}: {self.WallTime * 1e3:.2f} ms, {self._bytesRead} bytes, {sum(self._elementCounts.values())} elements"
+
+
+@export
+class LoadStatistics(metaclass=ExtendedType, slots=True):
+	"""
+	Aggregates the statistics of all documents loaded while this instance is installed.
+
+	An instance is installed process-wide for the duration of a with-statement or via
+	:meth:`RootElement.SetInstrumentation <pyEDAA.IPXACT.RootElement.SetInstrumentation>`. Documents loaded by worker
+	threads (e.g. by a :class:`~pyEDAA.IPXACT.Loader.BulkLoader`) are aggregated, too. Optionally, a callback is invoked
+	for each loaded document.
+
+	.. code-block:: python
+
+	   from pyEDAA.IPXACT.Instrumentation import LoadStatistics
+
+	   with LoadStatistics() as statistics:
+	     BulkLoader(useProcesses=False).LoadDirectory(Path("ip"))
+
+	   print(statistics)
+	"""
+
+	_lock:            RLock                                           #: Lock protecting the aggregated values.
+	_callback:        Nullable[Callable[[DocumentStatistics], None]]  #: Optional callback per loaded document.
+	_documents:       int                                             #: Number of loaded documents.
+	_failed:          int                                             #: Number of documents, which failed to load.
+	_wallTimes:       Dict[str, float]                                #: Accumulated wall time per phase in seconds.
+	_cpuTimes:        Dict[str, float]                                #: Accumulated CPU time per phase in seconds.
+	_bytesRead:       int                                             #: Accumulated number of bytes read.
+	_elementCounts:   Counter                                         #: Accumulated number of elements per tag.
+	_skippedSections: Counter                                         #: Accumulated number of skipped sections per tag.
+	_previous:        Nullable["LoadStatistics"]                      #: Instance installed before this one.
+
+	def __init__(self, callback: Nullable[Callable[[DocumentStatistics], None]] = None) -> None:
+		"""
+		Initializes empty load statistics.
+
+		:param callback: Optional function called with the statistics of each loaded document.
+		"""
+		self._lock =            RLock()
+		self._callback =        callback
+		self._documents =       0
+		self._failed =          0
+		self._wallTimes =       dict.fromkeys(__PHASES__, 0.0)
+		self._cpuTimes =        dict.fromkeys(__PHASES__, 0.0)
+		self._bytesRead =       0
+		self._elementCounts =   Counter()
+		self._skippedSections = Counter()
+		self._previous =        None
+
+	@readonly
+	def Documents(self) -> int:
+		return self._documents
+
+	@readonly
+	def Failed(self) -> int:
+		return self._failed
+
+	@readonly
+	def WallTimes(self) -> Dict[str, float]:
+		return self._wallTimes
+
+	@readonly
+	def CpuTimes(self) -> Dict[str, float]:
+		return self._cpuTimes
+
+	@readonly
+	def BytesRead(self) -> int:
+		return self._bytesRead
+
+	@readonly
+	def ElementCounts(self) -> Counter:
+		return self._elementCounts
+
+	@readonly
+	def SkippedSections(self) -> Counter:
+		return self._skippedSections
+
+	def CreateDocumentStatistics(self, file: Nullable[Path]) -> DocumentStatistics:
+		return DocumentStatistics(file)
+
+	def Add(self, statistics: DocumentStatistics) -> None:
+		"""
+		Adds the statistics of a loaded document and invokes the callback.
+
+		Documents, which failed to load, are counted separately. Their phase times, bytes and element counts up to the
+		failure are aggregated, too.
+
+		:param statistics: Statistics of a loaded or failed document.
+		"""
+		with self._lock:
+			if statistics._failed:
+				self._failed += 1
+			else:
+				self._documents += 1
+			for phase, wallTime in statistics._wallTimes.items():
+				self._wallTimes[phase] = self._wallTimes.get(phase, 0.0) + wallTime
+			for phase, cpuTime in statistics._cpuTimes.items():
+				self._cpuTimes[phase] = self._cpuTimes.get(phase, 0.0) + cpuTime
+			self._bytesRead += statistics._bytesRead
+			self._elementCounts.update(statistics._elementCounts)
+			self._skippedSections.update(statistics._skippedSections)
+
+		if self._callback is not None:
+			self._callback(statistics)
+
+	def __enter__(self) -> "LoadStatistics":
+		self._previous = RootElement._instrumentation
+		RootElement.SetInstrumentation(self)
+		return self
+
+	def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+		RootElement.SetInstrumentation(self._previous)
+		self._previous = None
+
+	def __str__(self) -> str:
+		phases = ", ".join(f"{phase} {wallTime * 1e3:.2f} ms" for phase, wallTime in self._wallTimes.items())
+		return f"{self._documents} documents, {self._failed} failed, {self._bytesRead} bytes, {sum(self._elementCounts.values())} elements ({phases})"
@@ -0,0 +1,498 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___ ______  __    _    ____ _____                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    |_ _|  _ \ \/ /   / \  / ___|_   _|                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \    | || |_) \  /   / _ \| |     | |                                          #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ _ | ||  __//  \  / ___ \ |___  | |                                          #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___|_|  /_/\_\/_/   \_\____| |_|                                          #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2025 Patrick Lehmann - Bötzingen, Germany                                                             #
+# Copyright 2016-2016 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Loading of many IP-XACT documents at once.
+
+The document type of each file is detected from its root tag. Files are then read, validated and parsed concurrently
+in a pool of worker processes or threads.
+"""
+from concurrent.futures      import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib              import contextmanager
+from io                      import BytesIO
+from mmap                    import mmap, ACCESS_READ
+from multiprocessing.context import BaseContext
+from os                      import cpu_count, fstat
+from pathlib                 import Path
+from sys                     import version_info
+from typing                  import Dict, IO, Iterable, Iterator, List, Optional as Nullable, Tuple, Type, Union
+
+from lxml.etree            import QName, XMLSyntaxError, XMLPullParser
+from pyTooling.Decorators  import export, readonly
+from pyTooling.MetaClasses import ExtendedType
+from pyTooling.Common      import getFullyQualifiedName
+
+from pyEDAA.IPXACT                     import __URI_MAP__, RootElement, IPXACTException, Compression, TreeRetention, ValidationLevel, IPXACTSchema, VLNV
+from pyEDAA.IPXACT.Catalog             import Catalog
+from pyEDAA.IPXACT.Component           import Component
+from pyEDAA.IPXACT.Design              import Design
+from pyEDAA.IPXACT.DesignConfiguration import DesignConfiguration
+from pyEDAA.IPXACT.GeneratorChain      import GeneratorChain
+
+
+__ROOT_ELEMENTS__: Dict[str, Type[RootElement]] = {
+	cls._rootTagName: cls for cls in (Catalog, Component, Design, DesignConfiguration, GeneratorChain)
+}  #: Mapping from root tag names to :class:`~pyEDAA.IPXACT.RootElement` subclasses.
+
+__DOCUMENT_PATTERNS__ = ("*.xml", "*.xml.gz", "*.xml.bz2", "*.xml.xz", "*.xml.zst")  #: Default glob patterns of uncompressed and compressed IP-XACT files.
+
+
+@export
+class DocumentHeader(metaclass=ExtendedType, slots=True):
+	"""Lightweight record of an IP-XACT document's type, namespace, VLNV and description."""
+
+	_file:         Path                             #: Path of the document.
+	_documentType: Nullable[Type[RootElement]]      #: Root element class or ``None``, if not supported.
+	_rootTagName:  str                              #: Local name of the root tag.
+	_schema:       Nullable[IPXACTSchema]           #: IP-XACT schema or ``None``, if not an IP-XACT namespace.
+	_vlnv:         Nullable[VLNV]                   #: VLNV or ``None``, if incomplete.
+	_description:  Nullable[str]                    #: Description
+
+	def __init__(
+		self,
+		file: Path,
+		documentType: Nullable[Type[RootElement]],
+		rootTagName: str,
+		schema: Nullable[IPXACTSchema],
+		vlnv: Nullable[VLNV],
+		description: Nullable[str]
+	) -> None:
+		self._file =         file
+		self._documentType = documentType
+		self._rootTagName =  rootTagName
+		self._schema =       schema
+		self._vlnv =         vlnv
+		self._description =  description
+
+	@readonly
+	def File(self) -> Path:
+		return self._file
+
+	@readonly
+	def DocumentType(self) -> Nullable[Type[RootElement]]:
+		return self._documentType
+
+	@readonly
+	def RootTagName(self) -> str:
+		return self._rootTagName
+
+	@readonly
+	def Schema(self) -> Nullable[IPXACTSchema]:
+		return self._schema
+
+	@readonly
+	def VLNV(self) -> Nullable[VLNV]:
+		return self._vlnv
+
+	@readonly
+	def Description(self) -> Nullable[str]:
+		return self._description
+
+	def __str__(self) -> str:
+		return f"{self._rootTagName} {self._vlnv} ({self._file})"
+
+
+_HEADER_ELEMENTS = ("vendor", "library", "name", "version", "displayName", "shortDescription", "description")
+
+
+@export
+def ReadDocumentHeader(file: Path, chunkSize: int = 4096) -> DocumentHeader:
+	"""
+	Reads the document type, namespace, VLNV and description of an IP-XACT file without parsing the whole file.
+
+	The file is fed in chunks into an incremental parser. Reading stops at the first top-level element after the
+	document's name group. Neither the complete file is read nor is it validated. Compressed files are decompressed
+	while being read.
+
+	:param file:             Path to an XML file.
+	:param chunkSize:        Number of bytes read at once.
+	:returns:                The document header.
+	:raises IPXACTException: If the file can't be read or isn't well-formed.
+	"""
+	try:
+		with file.open("rb") as fileHandle:
+			compression = Compression.FromMagic(fileHandle.read(6))
+			fileHandle.seek(0)
+			with compression.Open(fileHandle) as stream:
+				return ReadDocumentHeaderFromStream(stream, file, chunkSize)
+	except OSError as ex:
+		raise IPXACTException(f"Couldn't open '{file}'.") from ex
+
+
+@export
+def ReadDocumentHeaderFromStream(stream: IO[bytes], file: Path, chunkSize: int = 4096) -> DocumentHeader:
+	"""
+	Reads the document type, namespace, VLNV and description of an IP-XACT document from a binary file object.
+
+	See :func:`ReadDocumentHeader` for details.
+
+	:param stream:           Binary file object positioned at the start of the document.
+	:param file:             Path of the document reported in the header and in error messages.
+	:param chunkSize:        Number of bytes read at once.
+	:returns:                The document header.
+	:raises IPXACTException: If the stream can't be read or the document isn't well-formed.
+	"""
+	parser = XMLPullParser(events=("start", "end"))
+	rootTag = None
+	values = {}
+	depth = 0
+	done = False
+
+	try:
+		while not done:
+			chunk = stream.read(chunkSize)
+			if chunk:
+				parser.feed(chunk)
+			else:
+				parser.close()
+				done = True
+
+			for event, element in parser.read_events():
+				if event == "start":
+					depth += 1
+					if depth == 1:
+						rootTag = QName(element.tag)
+						if rootTag.namespace not in __URI_MAP__:
+							done = True
+							break
+					elif depth == 2 and QName(element.tag).localname not in _HEADER_ELEMENTS:
+						done = True
+						break
+				else:
+					if depth == 2:
+						values[QName(element.tag).localname] = element.text
+					depth -= 1
+	except XMLSyntaxError as ex:
+		raise IPXACTException(f"The input file '{file}' is not well-formed.") from ex
+	except OSError as ex:
+		raise IPXACTException(f"Couldn't read '{file}'.") from ex
+
+	if rootTag is None:
+		raise IPXACTException(f"The input file '{file}' contains no root element.")
+
+	schema = __URI_MAP__.get(rootTag.namespace, None)
+	documentType = None if schema is None else __ROOT_ELEMENTS__.get(rootTag.localname, None)
+
+	try:
+		vlnv = VLNV.Create(values["vendor"], values["library"], values["name"], values["version"])
+	except (KeyError, ValueError, TypeError):
+		vlnv = None
+
+	return DocumentHeader(file, documentType, rootTag.localname, schema, vlnv, values.get("description", None))
+
+
+def _FindFiles(directory: Path, pattern: Union[str, Iterable[str]]) -> List[Path]:
+	if not directory.is_dir():
+		raise IPXACTException(f"Directory '{directory}' not found.")
+
+	patterns = (pattern, ) if isinstance(pattern, str) else pattern
+	return sorted({file for pattern in patterns for file in directory.rglob(pattern)})
+
+
+@export
+def ScanDirectory(directory: Path, pattern: Union[str, Iterable[str]] = __DOCUMENT_PATTERNS__) -> Iterator[DocumentHeader]:
+	"""
+	Reads the headers of all supported IP-XACT documents in a directory tree.
+
+	Files which aren't well-formed or aren't supported IP-XACT documents are skipped. By default, uncompressed and
+	compressed (``*.xml.gz``, ``*.xml.bz2``, ``*.xml.xz``, ``*.xml.zst``) files are read.
+
+	:param directory:        Directory to search recursively.
+	:param pattern:          Glob pattern or patterns for file names.
+	:returns:                An iterator of document headers.
+	:raises IPXACTException: If the directory doesn't exist.
+	"""
+	for file in _FindFiles(directory, pattern):
+		try:
+			header = ReadDocumentHeader(file)
+		except IPXACTException:
+			continue
+
+		if header.DocumentType is not None:
+			yield header
+
+
+@export
+def DetectDocumentType(file: Path) -> Nullable[Type[RootElement]]:
+	"""
+	Detects the document type of an IP-XACT file by reading its root tag.
+
+	Only the beginning of the file is read and parsed (see :func:`ReadDocumentHeader`).
+
+	:param file:             Path to an XML file.
+	:returns:                Matching root element class or ``None``, if the file isn't a supported IP-XACT document.
+	:raises IPXACTException: If the file can't be read or isn't well-formed.
+	"""
+	return ReadDocumentHeader(file).DocumentType
+
+
+def _LoadDocument(
+	file: Path,
+	streaming: bool,
+	retention: TreeRetention,
+	validation: ValidationLevel,
+	detachTree: bool
+) -> Tuple[Path, Nullable[RootElement], Nullable[Exception]]:
+	try:
+		with _MapFile(file) as buffer:
+			compression = Compression.FromMagic(buffer[:6])
+			if compression is Compression.Uncompressed:
+				content = buffer
+				header = ReadDocumentHeaderFromStream(buffer, file)
+			elif streaming:
+				# The decompressed content isn't held in memory while streaming, thus the header is decompressed twice.
+				with compression.Open(buffer) as stream:
+					header = ReadDocumentHeaderFromStream(stream, file)
+				content = buffer
+			else:
+				with compression.Open(buffer) as stream:
+					content = stream.read()
+				header = ReadDocumentHeaderFromStream(BytesIO(content), file)
+
+			cls = header.DocumentType
+			if cls is None:
+				return file, None, None
+
+			# The document type is detected and the document is parsed from the same mapped or decompressed content.
+			buffer.seek(0)
+			document = cls(content, parse=True, streaming=streaming, retention=retention, validation=validation)
+			document._AssignFile(file)
+
+		if detachTree:
+			# lxml objects can't be transferred between processes, thus deferred parts are built from the tree beforehand.
+			document.Materialize()
+			document._xmlRoot =   None
+			document._xmlSchema = None
+
+		return file, document, None
+	except Exception as ex:
+		return file, None, ex
+
+
+@contextmanager
+def _MapFile(file: Path) -> Iterator[mmap]:
+	"""
+	Memory-maps a file for reading.
+
+	:param file:             Path of the file.
+	:returns:                A context manager yielding the mapping. The mapping is closed on exit.
+	:raises IPXACTException: If the file can't be opened or is empty.
+	"""
+	try:
+		with file.open("rb") as fileHandle:
+			# Empty files can't be memory-mapped.
+			if fstat(fileHandle.fileno()).st_size == 0:
+				raise IPXACTException(f"The input file '{file}' contains no root element.")
+
+			buffer = mmap(fileHandle.fileno(), 0, access=ACCESS_READ)
+	except OSError as ex:
+		raise IPXACTException(f"Couldn't open '{file}'.") from ex
+
+	try:
+		yield buffer
+	finally:
+		buffer.close()
+
+
+@export
+class BulkLoadResult(metaclass=ExtendedType, slots=True):
+	"""Result of a bulk load operation: loaded documents, per-file errors and skipped files."""
+
+	_documents: Dict[Path, RootElement]  #: Successfully loaded documents by path.
+	_errors:    Dict[Path, Exception]    #: Errors by path.
+	_skipped:   List[Path]               #: Files not recognized as supported IP-XACT documents.
+
+	def __init__(self) -> None:
+		self._documents = {}
+		self._errors =    {}
+		self._skipped =   []
+
+	@readonly
+	def Documents(self) -> Dict[Path, RootElement]:
+		return self._documents
+
+	@readonly
+	def Errors(self) -> Dict[Path, Exception]:
+		return self._errors
+
+	@readonly
+	def Skipped(self) -> List[Path]:
+		return self._skipped
+
+	def __len__(self) -> int:
+		return len(self._documents)
+
+	def __iter__(self) -> Iterator[RootElement]:
+		return iter(self._documents.values())
+
+	def __str__(self) -> str:
+		return f"{len(self._documents)} documents, {len(self._errors)} errors, {len(self._skipped)} skipped"
+
+
+@export
+class BulkLoader(metaclass=ExtendedType, slots=True):
+	"""
+	Reads, validates and parses many IP-XACT documents concurrently.
+
+	Worker processes scale with the number of CPU cores, but loaded documents are transferred back to the calling process
+	without their lxml tree (:attr:`~pyEDAA.IPXACT.TreeRetention.Drop`). Worker threads compile each schema once per
+	thread from the schema files cached in memory, reuse one XML parser per thread and can keep the lxml trees. As lxml releases the GIL while parsing and
+	validating, threads are preferable for I/O bound loads, e.g. libraries on network file systems.
+
+	.. code-block:: python
+
+	   from pyEDAA.IPXACT.Loader import BulkLoader
+
+	   loader = BulkLoader(workers=8)
+	   result = loader.LoadDirectory(Path("ip"))
+	   for path, ex in result.Errors.items():
+	     print(f"{path}: {ex}")
+	"""
+
+	_workers:      int              #: Number of worker processes or threads.
+	_useProcesses: bool             #: Use worker processes instead of threads.
+	_streaming:    bool             #: Parse documents incrementally.
+	_retention:    TreeRetention    #: Retention policy for thread workers.
+	_validation:   ValidationLevel  #: Validation level applied to each document.
+	_chunkSize:    int              #: Number of files sent to a worker process at once.
+	_mpContext:    Nullable[BaseContext]  #: Multiprocessing context for worker processes or ``None`` for the default.
+
+	def __init__(
+		self,
+		workers: Nullable[int] = None,
+		useProcesses: bool = True,
+		streaming: bool = False,
+		retention: TreeRetention = TreeRetention.Drop,
+		chunkSize: int = 16,
+		validation: ValidationLevel = ValidationLevel.Full,
+		mpContext: Nullable[BaseContext] = None
+	) -> None:
+		"""
+		Initializes a bulk loader.
+
+		:param workers:      Number of worker processes or threads. If ``None``, the number of CPU cores is used.
+		:param useProcesses: If true, use a process pool, otherwise a thread pool.
+		:param streaming:    If true, parse documents incrementally.
+		:param retention:    Retention policy for the lxml trees. Ignored for process pools.
+		:param chunkSize:    Number of files sent to a worker process at once.
+		:param validation:   Validation level applied to each document.
+		:param mpContext:    Multiprocessing context (e.g. ``get_context("spawn")``) for worker processes. If ``None``, the
+		                     platform's default start method is used.
+		:raises ValueError:  If parameter workers or chunkSize is less than 1.
+		"""
+		if workers is None:
+			workers = cpu_count() or 1
+		elif workers < 1:
+			raise ValueError(f"Parameter 'workers' must be at least 1.")
+
+		if chunkSize < 1:
+			raise ValueError(f"Parameter 'chunkSize' must be at least 1.")
+
+		self._workers =      workers
+		self._useProcesses = useProcesses
+		self._streaming =    streaming
+		self._retention =    TreeRetention.Drop if useProcesses else retention
+		self._validation =   validation
+		self._chunkSize =    chunkSize
+		self._mpContext =    mpContext
+
+	@readonly
+	def Workers(self) -> int:
+		return self._workers
+
+	@readonly
+	def UseProcesses(self) -> bool:
+		return self._useProcesses
+
+	def Load(self, files: Iterable[Path]) -> BulkLoadResult:
+		"""
+		Loads a list of IP-XACT files.
+
+		Files which aren't supported IP-XACT documents are reported as skipped.
+
+		:param files:      Paths to IP-XACT files.
+		:returns:          Loaded documents, per-file errors and skipped files.
+		:raises TypeError: If an element of parameter files is not a Path.
+		"""
+		files = list(files)
+		for file in files:
+			if not isinstance(file, Path):
+				ex = TypeError(f"Parameter 'files' contains an element which is not a Path.")
+				if version_info >= (3, 11):  # pragma: no cover
+					ex.add_note(f"Got type '{getFullyQualifiedName(file)}'.")
+				raise ex
+
+		result = BulkLoadResult()
+		if len(files) == 0:
+			return result
+
+		count = len(files)
+		streaming = [self._streaming] * count
+		retention = [self._retention] * count
+		validation = [self._validation] * count
+		detachTree = [self._useProcesses] * count
+
+		with self._CreateExecutor(count) as executor:
+			if self._useProcesses:
+				results = executor.map(_LoadDocument, files, streaming, retention, validation, detachTree, chunksize=self._chunkSize)
+			else:
+				results = executor.map(_LoadDocument, files, streaming, retention, validation, detachTree)
+
+			for file, document, ex in results:
+				if ex is not None:
+					result._errors[file] = ex
+				elif document is None:
+					result._skipped.append(file)
+				else:
+					result._documents[file] = document
+
+		return result
+
+	def LoadDirectory(self, directory: Path, pattern: Union[str, Iterable[str]] = __DOCUMENT_PATTERNS__) -> BulkLoadResult:
+		"""
+		Loads all IP-XACT files in a directory tree.
+
+		By default, uncompressed and compressed (``*.xml.gz``, ``*.xml.bz2``, ``*.xml.xz``, ``*.xml.zst``) files are
+		loaded.
+
+		:param directory:        Directory to search recursively.
+		:param pattern:          Glob pattern or patterns for file names.
+		:returns:                Loaded documents, per-file errors and skipped files.
+		:raises IPXACTException: If the directory doesn't exist.
+		"""
+		return self.Load(_FindFiles(directory, pattern))
+
+	def _CreateExecutor(self, count: int) -> Executor:
+		workers = min(self._workers, count)
+		if self._useProcesses:
+			return ProcessPoolExecutor(max_workers=workers, mp_context=self._mpContext)
+		else:
+			return ThreadPoolExecutor(max_workers=workers)
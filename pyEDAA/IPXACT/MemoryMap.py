@@ -0,0 +1,1059 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___ ______  __    _    ____ _____                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    |_ _|  _ \ \/ /   / \  / ___|_   _|                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \    | || |_) \  /   / _ \| |     | |                                          #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ _ | ||  __//  \  / ___ \ |___  | |                                          #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___|_|  /_/\_\/_/   \_\____| |_|                                          #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2025 Patrick Lehmann - Bötzingen, Germany                                                             #
+# Copyright 2016-2016 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Memory maps, address blocks, registers and fields of IP-XACT components.
+
+Memory maps of large SoC components describe hundreds of thousands of registers and millions of fields. Thus, they are
+stored column-wise in a :class:`MemoryMapTable`: numeric values are kept in typed arrays (:mod:`array`), names are
+concatenated into one byte string. The classes :class:`MemoryMap`, :class:`AddressBlock`, :class:`Register` and
+:class:`Field` are thin views consisting of a table reference and an index.
+
+Columns can be exported as :class:`memoryview` without copying (see :meth:`MemoryMapTable.Column`), e.g. to process all
+registers at once with NumPy:
+
+.. code-block:: python
+
+   table =     component.MemoryMapTable
+   blocks =    numpy.frombuffer(table.Column("register.addressBlock"), dtype=numpy.uint32)
+   addresses = numpy.frombuffer(table.Column("addressBlock.baseAddress"), dtype=numpy.uint64)[blocks]
+   addresses += numpy.frombuffer(table.Column("register.addressOffset"), dtype=numpy.uint64)
+"""
+from array                 import array
+from enum                  import Enum
+from re                    import compile as re_compile
+from sys                   import version_info
+from typing                import ClassVar, Dict, Iterator, List, Optional as Nullable, Tuple, Union
+
+from lxml.etree            import _Element
+from pyTooling.Common      import getFullyQualifiedName
+from pyTooling.Decorators  import export, readonly
+from pyTooling.MetaClasses import ExtendedType
+
+from pyEDAA.IPXACT         import __DEFAULT_SCHEMA__, IPXACTException, IPXACTSchema, Element, TagTable, EscapeXml
+
+
+Value = Union[int, str]  #: An integer or an unresolved expression.
+
+__INTEGER_LITERAL__ = re_compile(
+	r"\s*(?:"
+	r"\d*'[sS]?(?P<base>[hHdDbBoO])(?P<digits>[0-9a-fA-F_]+)|"  # SystemVerilog literal, e.g. 32'h1000
+	r"0[xX](?P<hex>[0-9a-fA-F_]+)|"                            # 0x1000
+	r"#(?P<hash>[0-9a-fA-F]+)|"                                 # #1000 (IP-XACT 2009)
+	r"(?P<decimal>\d[0-9_]*)(?P<scale>[kKmMgGtT]?)"             # 4096 or 4k (IP-XACT 2009)
+	r")\s*"
+)  #: Integer literals in IP-XACT 2009 (scaled integers) and IP-XACT 2014+ (SystemVerilog literals).
+__LITERAL_BASES__ =  {"h": 16, "d": 10, "b": 2, "o": 8}                      #: Bases of SystemVerilog literals.
+__LITERAL_SCALES__ = {"": 1, "k": 1 << 10, "m": 1 << 20, "g": 1 << 30, "t": 1 << 40}  #: Scaling suffixes of IP-XACT 2009.
+__MAX_EXPONENT__ =   256  #: Largest exponent or shift amount evaluated in constant expressions.
+__MAX_BITS__ =       4096  #: Largest bit length of operands and results evaluated in constant expressions.
+
+
+@export
+def ParseInteger(text: Nullable[str]) -> Nullable[int]:
+	"""
+	Parses an integer literal or a constant integer expression.
+
+	Supported are decimal and hexadecimal (``0x``) numbers, SystemVerilog literals (e.g. ``32'h1000``), IP-XACT 2009
+	scaled integers (e.g. ``#1000`` or ``4k``) and arithmetic expressions of decimal and hexadecimal numbers (e.g.
+	``2**10``). Expressions referring to parameters can't be evaluated.
+
+	:param text: Text of an IP-XACT element.
+	:returns:    The integer or ``None``, if the text isn't a constant.
+	"""
+	if text is None:
+		return None
+
+	try:
+		# Fast path for decimal numbers without leading zeros and for 0x, 0o and 0b prefixed numbers.
+		return int(text, 0)
+	except ValueError:
+		pass
+
+	if (match := __INTEGER_LITERAL__.fullmatch(text)) is not None:
+		try:
+			if (digits := match["digits"]) is not None:
+				return int(digits, __LITERAL_BASES__[match["base"].lower()])
+			elif (digits := match["hex"]) is not None:
+				return int(digits, 16)
+			elif (digits := match["hash"]) is not None:
+				return int(digits, 16)
+			else:
+				return int(match["decimal"]) * __LITERAL_SCALES__[match["scale"].lower()]
+		except ValueError:
+			return None
+
+	return _EvaluateConstant(text)
+
+
+def _EvaluateConstant(text: str) -> Nullable[int]:
+	# ast is imported on first use, as literals are far more common than expressions.
+	from ast import parse, BinOp, UnaryOp, Constant, Add, Sub, Mult, Div, FloorDiv, Mod, Pow, LShift, RShift, BitOr, BitAnd, BitXor, USub, UAdd, Invert
+
+	binaryOperators = {
+		Add: int.__add__, Sub: int.__sub__, Mult: int.__mul__, Div: int.__floordiv__, FloorDiv: int.__floordiv__,
+		Mod: int.__mod__, Pow: int.__pow__, LShift: int.__lshift__, RShift: int.__rshift__, BitOr: int.__or__,
+		BitAnd: int.__and__, BitXor: int.__xor__
+	}
+	unaryOperators = {USub: int.__neg__, UAdd: int.__pos__, Invert: int.__invert__}
+
+	def bounded(value: int) -> int:
+		if value.bit_length() > __MAX_BITS__:
+			raise ValueError()
+		return value
+
+	def evaluate(node) -> int:
+		if isinstance(node, Constant) and type(node.value) is int:
+			return bounded(node.value)
+		elif isinstance(node, BinOp) and (operator := binaryOperators.get(type(node.op))) is not None:
+			left = evaluate(node.left)
+			right = evaluate(node.right)
+			if isinstance(node.op, (Pow, LShift, RShift)) and not (0 <= right <= __MAX_EXPONENT__):
+				raise ValueError()
+			# Nested powers and shifts grow without limit, thus the result's size is checked before it's computed.
+			elif isinstance(node.op, Pow) and (left.bit_length() - 1) * right > __MAX_BITS__:
+				raise ValueError()
+			elif isinstance(node.op, LShift) and left.bit_length() + right > __MAX_BITS__:
+				raise ValueError()
+			return bounded(operator(left, right))
+		elif isinstance(node, UnaryOp) and (operator := unaryOperators.get(type(node.op))) is not None:
+			return bounded(operator(evaluate(node.operand)))
+
+		raise ValueError()
+
+	try:
+		return evaluate(parse(text.strip(), mode="eval").body)
+	except (SyntaxError, ValueError, ZeroDivisionError):
+		return None
+
+
+@export
+class AccessType(Enum):
+	"""Access type of address blocks, registers and fields."""
+
+	Unspecified =   0  #: No access type given. The access type is inherited from the enclosing element.
+	ReadOnly =      1  #: ``read-only``
+	WriteOnly =     2  #: ``write-only``
+	ReadWrite =     3  #: ``read-write``
+	WriteOnce =     4  #: ``writeOnce``
+	ReadWriteOnce = 5  #: ``read-writeOnce``
+	NoAccess =      6  #: ``no-access`` (since IP-XACT 2022)
+
+
+__ACCESS_TYPES__ = {
+	"read-only":      AccessType.ReadOnly,
+	"write-only":     AccessType.WriteOnly,
+	"read-write":     AccessType.ReadWrite,
+	"writeOnce":      AccessType.WriteOnce,
+	"read-writeOnce": AccessType.ReadWriteOnce,
+	"no-access":      AccessType.NoAccess
+}  #: Access types by their XML representation.
+__ACCESS_NAMES__ = {accessType.value: name for name, accessType in __ACCESS_TYPES__.items()}  #: XML representation by access code.
+__ACCESS_CODES__ = tuple(AccessType)  #: Access types by access code.
+
+__MEMORY_MAP_TAGS__ = TagTable({localname: localname for localname in (
+	"memoryMap", "name", "addressBlock", "addressUnitBits", "baseAddress", "range", "width", "access", "accessPolicies",
+	"register", "registerFile", "addressOffset", "size", "reset", "resets", "value", "field", "fieldAccessPolicies",
+	"bitOffset", "bitWidth"
+)})  #: Local names of the processed elements within ``memoryMaps``. Other elements are skipped.
+__MEMORY_MAP_TAG__ = __MEMORY_MAP_TAGS__.Lookup  #: Bound lookup of a local name by qualified tag, as used by the parser's inner loops.
+
+
+class _StringColumn(metaclass=ExtendedType, slots=True):
+	"""A column of strings stored as one UTF-8 encoded byte string and an array of end offsets."""
+
+	_data:    bytearray  #: Concatenated UTF-8 encoded strings.
+	_offsets: array      #: Start offset of each string followed by the end offset of the last string.
+
+	def __init__(self) -> None:
+		self._data =    bytearray()
+		self._offsets = array("Q", (0, ))
+
+	@readonly
+	def ByteSize(self) -> int:
+		return len(self._data) + self._offsets.itemsize * len(self._offsets)
+
+	def Append(self, value: str) -> None:
+		self._data += value.encode("utf-8")
+		self._offsets.append(len(self._data))
+
+	def __getitem__(self, index: int) -> str:
+		return self._data[self._offsets[index]:self._offsets[index + 1]].decode("utf-8")
+
+	def __len__(self) -> int:
+		return len(self._offsets) - 1
+
+
+@export
+class MemoryMapTable(metaclass=ExtendedType, slots=True):
+	"""
+	Column-wise storage of all memory maps of a component.
+
+	Each level (memory map, address block, register, field) is stored as a set of columns. Rows of a level are ordered by
+	their parent, so the children of a row are a contiguous range, which starts at the index given by column
+	``firstAddressBlock``, ``firstRegister`` or ``firstField`` of the parent. Additionally, each row refers to its parent
+	by index.
+
+	Addresses, sizes and reset values, which aren't integer constants (e.g. expressions referring to parameters) or which
+	exceed a column's range, are stored as 0 in the column and are kept in a side table. Views return ``None`` for
+	unresolved expressions (see :meth:`Expression`).
+
+	Rows are appended by :meth:`AddMemoryMap`, :meth:`AddAddressBlock`, :meth:`AddRegister` and :meth:`AddField`. Each
+	row is added to the last row of its parent level. An array can't be extended, while a :class:`memoryview` of it exists.
+	"""
+
+	_mapNames:            _StringColumn  #: Names of memory maps.
+	_mapAddressUnitBits:  array          #: Number of bits per address unit of each memory map.
+	_mapFirstBlocks:      array          #: Index of the first address block of each memory map.
+	_blockNames:          _StringColumn  #: Names of address blocks.
+	_blockMaps:           array          #: Index of the memory map of each address block.
+	_blockBaseAddresses:  array          #: Base address of each address block.
+	_blockRanges:         array          #: Range in address units of each address block.
+	_blockWidths:         array          #: Width in bits of each address block.
+	_blockAccesses:       array          #: Access code of each address block.
+	_blockFirstRegisters: array          #: Index of the first register of each address block.
+	_registerNames:       _StringColumn  #: Names of registers.
+	_registerBlocks:      array          #: Index of the address block of each register.
+	_registerOffsets:     array          #: Address offset of each register relative to the address block.
+	_registerSizes:       array          #: Size in bits of each register.
+	_registerAccesses:    array          #: Access code of each register.
+	_registerResets:      array          #: Reset value of each register.
+	_registerHasResets:   array          #: 1, if a register has a reset value.
+	_registerFirstFields: array          #: Index of the first field of each register.
+	_fieldNames:          _StringColumn  #: Names of fields.
+	_fieldRegisters:      array          #: Index of the register of each field.
+	_fieldBitOffsets:     array          #: Offset of the least significant bit of each field.
+	_fieldBitWidths:      array          #: Width in bits of each field.
+	_fieldAccesses:       array          #: Access code of each field.
+	_fieldResets:         array          #: Reset value of each field.
+	_fieldHasResets:      array          #: 1, if a field has a reset value.
+	_values:              Dict[Tuple[str, int], Value]  #: Values, which aren't stored in their column, by column name and index.
+
+	_columns: ClassVar[Dict[str, str]] = {  #: Slot names of all numeric columns by public column name.
+		"memoryMap.addressUnitBits":      "_mapAddressUnitBits",
+		"memoryMap.firstAddressBlock":    "_mapFirstBlocks",
+		"addressBlock.memoryMap":         "_blockMaps",
+		"addressBlock.baseAddress":       "_blockBaseAddresses",
+		"addressBlock.range":             "_blockRanges",
+		"addressBlock.width":             "_blockWidths",
+		"addressBlock.access":            "_blockAccesses",
+		"addressBlock.firstRegister":     "_blockFirstRegisters",
+		"register.addressBlock":          "_registerBlocks",
+		"register.addressOffset":         "_registerOffsets",
+		"register.size":                  "_registerSizes",
+		"register.access":                "_registerAccesses",
+		"register.reset":                 "_registerResets",
+		"register.hasReset":              "_registerHasResets",
+		"register.firstField":            "_registerFirstFields",
+		"field.register":                 "_fieldRegisters",
+		"field.bitOffset":                "_fieldBitOffsets",
+		"field.bitWidth":                 "_fieldBitWidths",
+		"field.access":                   "_fieldAccesses",
+		"field.reset":                    "_fieldResets",
+		"field.hasReset":                 "_fieldHasResets"
+	}
+
+	def __init__(self) -> None:
+		"""
+		Initializes an empty memory map table.
+		"""
+		self._mapNames =            _StringColumn()
+		self._mapAddressUnitBits =  array("I")
+		self._mapFirstBlocks =      array("I")
+		self._blockNames =          _StringColumn()
+		self._blockMaps =           array("I")
+		self._blockBaseAddresses =  array("Q")
+		self._blockRanges =         array("Q")
+		self._blockWidths =         array("I")
+		self._blockAccesses =       array("B")
+		self._blockFirstRegisters = array("I")
+		self._registerNames =       _StringColumn()
+		self._registerBlocks =      array("I")
+		self._registerOffsets =     array("Q")
+		self._registerSizes =       array("I")
+		self._registerAccesses =    array("B")
+		self._registerResets =      array("Q")
+		self._registerHasResets =   array("B")
+		self._registerFirstFields = array("I")
+		self._fieldNames =          _StringColumn()
+		self._fieldRegisters =      array("I")
+		self._fieldBitOffsets =     array("I")
+		self._fieldBitWidths =      array("I")
+		self._fieldAccesses =       array("B")
+		self._fieldResets =         array("Q")
+		self._fieldHasResets =      array("B")
+		self._values =              {}
+
+	@readonly
+	def MemoryMapCount(self) -> int:
+		return len(self._mapNames)
+
+	@readonly
+	def AddressBlockCount(self) -> int:
+		return len(self._blockNames)
+
+	@readonly
+	def RegisterCount(self) -> int:
+		return len(self._registerNames)
+
+	@readonly
+	def FieldCount(self) -> int:
+		return len(self._fieldNames)
+
+	@readonly
+	def MemoryMaps(self) -> List["MemoryMap"]:
+		return [MemoryMap(self, index) for index in range(len(self._mapNames))]
+
+	@readonly
+	def ByteSize(self) -> int:
+		"""
+		Read-only property to access the memory used by the columns' data.
+
+		:returns: Number of bytes used by all columns. The side table of unresolved values isn't included.
+		"""
+		size = sum(column.ByteSize for column in (self._mapNames, self._blockNames, self._registerNames, self._fieldNames))
+		for slotName in self._columns.values():
+			column = getattr(self, slotName)
+			size += column.itemsize * len(column)
+
+		return size
+
+	def Column(self, name: str) -> memoryview:
+		"""
+		Returns a numeric column as a read-only memoryview without copying it.
+
+		Column names are ``<level>.<column>``, e.g. ``register.addressOffset``. See :attr:`_columns` for all names.
+
+		:param name:      Name of the column.
+		:returns:         Read-only view on the column's array.
+		:raises KeyError: If the column doesn't exist.
+		"""
+		return memoryview(getattr(self, self._columns[name])).toreadonly()
+
+	def Values(self, name: str) -> List[Nullable[int]]:
+		"""
+		Returns a numeric column as a list of integers, including the values kept in the side table.
+
+		:param name:      Name of the column.
+		:returns:         List of all values. Unresolved expressions are ``None``.
+		:raises KeyError: If the column doesn't exist.
+		"""
+		values = getattr(self, self._columns[name]).tolist()
+		for (column, index), value in self._values.items():
+			if column == name:
+				values[index] = value if isinstance(value, int) else None
+
+		return values
+
+	def Expression(self, column: str, index: int) -> Nullable[str]:
+		"""
+		Returns the unresolved expression of a value.
+
+		:param column: Name of the column, e.g. ``addressBlock.range``.
+		:param index:  Index of the row.
+		:returns:      The expression or ``None``, if the value is an integer.
+		"""
+		value = self._values.get((column, index))
+		return value if isinstance(value, str) else None
+
+	def AddMemoryMap(self, name: str, addressUnitBits: Value = 8) -> "MemoryMap":
+		"""
+		Appends a memory map.
+
+		:param name:            Name of the memory map.
+		:param addressUnitBits: Number of bits per address unit.
+		:returns:               View of the new memory map.
+		"""
+		index = len(self._mapNames)
+		self._mapNames.Append(name)
+		self._Append(self._mapAddressUnitBits, "memoryMap.addressUnitBits", addressUnitBits)
+		self._mapFirstBlocks.append(len(self._blockNames))
+
+		return MemoryMap(self, index)
+
+	def AddAddressBlock(self, name: str, baseAddress: Value, range: Value, width: Value, access: AccessType = AccessType.Unspecified) -> "AddressBlock":
+		"""
+		Appends an address block to the last memory map.
+
+		:param name:             Name of the address block.
+		:param baseAddress:      Base address in address units.
+		:param range:            Range in address units.
+		:param width:            Width in bits.
+		:param access:           Access type.
+		:returns:                View of the new address block.
+		:raises IPXACTException: If the table contains no memory map.
+		"""
+		if len(self._mapNames) == 0:
+			raise IPXACTException(f"Address block '{name}' can't be added, because the table contains no memory map.")
+
+		index = len(self._blockNames)
+		self._blockNames.Append(name)
+		self._blockMaps.append(len(self._mapNames) - 1)
+		self._Append(self._blockBaseAddresses, "addressBlock.baseAddress", baseAddress)
+		self._Append(self._blockRanges, "addressBlock.range", range)
+		self._Append(self._blockWidths, "addressBlock.width", width)
+		self._blockAccesses.append(access.value)
+		self._blockFirstRegisters.append(len(self._registerNames))
+
+		return AddressBlock(self, index)
+
+	def AddRegister(self, name: str, addressOffset: Value, size: Value, access: AccessType = AccessType.Unspecified, reset: Nullable[Value] = None) -> "Register":
+		"""
+		Appends a register to the last address block.
+
+		:param name:             Name of the register.
+		:param addressOffset:    Address offset relative to the address block's base address.
+		:param size:             Size in bits.
+		:param access:           Access type.
+		:param reset:            Reset value. ``None``, if the register has no reset value.
+		:returns:                View of the new register.
+		:raises IPXACTException: If the table contains no address block.
+		"""
+		if len(self._blockNames) == 0:
+			raise IPXACTException(f"Register '{name}' can't be added, because the table contains no address block.")
+
+		index = len(self._registerNames)
+		self._registerNames.Append(name)
+		self._registerBlocks.append(len(self._blockNames) - 1)
+		self._Append(self._registerOffsets, "register.addressOffset", addressOffset)
+		self._Append(self._registerSizes, "register.size", size)
+		self._registerAccesses.append(access.value)
+		self._Append(self._registerResets, "register.reset", 0 if reset is None else reset)
+		self._registerHasResets.append(reset is not None)
+		self._registerFirstFields.append(len(self._fieldNames))
+
+		return Register(self, index)
+
+	def AddField(self, name: str, bitOffset: Value, bitWidth: Value, access: AccessType = AccessType.Unspecified, reset: Nullable[Value] = None) -> "Field":
+		"""
+		Appends a field to the last register.
+
+		:param name:             Name of the field.
+		:param bitOffset:        Offset of the field's least significant bit.
+		:param bitWidth:         Width in bits.
+		:param access:           Access type.
+		:param reset:            Reset value. ``None``, if the field has no reset value.
+		:returns:                View of the new field.
+		:raises IPXACTException: If the table contains no register.
+		"""
+		if len(self._registerNames) == 0:
+			raise IPXACTException(f"Field '{name}' can't be added, because the table contains no register.")
+
+		index = len(self._fieldNames)
+		self._fieldNames.Append(name)
+		self._fieldRegisters.append(len(self._registerNames) - 1)
+		self._Append(self._fieldBitOffsets, "field.bitOffset", bitOffset)
+		self._Append(self._fieldBitWidths, "field.bitWidth", bitWidth)
+		self._fieldAccesses.append(access.value)
+		self._Append(self._fieldResets, "field.reset", 0 if reset is None else reset)
+		self._fieldHasResets.append(reset is not None)
+
+		return Field(self, index)
+
+	def _Append(self, column: array, name: str, value: Value) -> None:
+		if type(value) is int and 0 <= value < (1 << (column.itemsize << 3)):
+			column.append(value)
+			return
+		elif not isinstance(value, (int, str)):
+			ex = TypeError(f"Value of column '{name}' is neither an integer nor an expression.")
+			if version_info >= (3, 11):  # pragma: no cover
+				ex.add_note(f"Got type '{getFullyQualifiedName(value)}'.")
+			raise ex
+
+		self._values[(name, len(column))] = value
+		column.append(0)
+
+	def _Get(self, column: array, name: str, index: int) -> Nullable[int]:
+		if self._values and (value := self._values.get((name, index))) is not None:
+			return value if isinstance(value, int) else None
+
+		return column[index]
+
+	def _Raw(self, column: array, name: str, index: int) -> Value:
+		if self._values and (value := self._values.get((name, index))) is not None:
+			return value
+
+		return column[index]
+
+	@staticmethod
+	def _Range(firstChildren: array, index: int, count: int) -> range:
+		return range(firstChildren[index], firstChildren[index + 1] if index + 1 < len(firstChildren) else count)
+
+	@classmethod
+	def FromXml(cls, memoryMapsElement: _Element) -> "MemoryMapTable":
+		"""
+		Reads all memory maps from a ``memoryMaps`` element.
+
+		Address blocks, registers and fields of IP-XACT 2009, 2014 and 2022 are read. Registers within register files are
+		flattened into their address block with their offsets added up. Arrays (``dim``), banks, subspace maps, memory
+		remaps, alternate registers and references to type definitions aren't resolved.
+
+		:param memoryMapsElement: The ``memoryMaps`` element.
+		:returns:                 The table of all memory maps.
+		"""
+		table = cls()
+		for element in memoryMapsElement:
+			if __MEMORY_MAP_TAG__(element.tag) == "memoryMap":
+				table._ParseMemoryMap(element)
+
+		return table
+
+	def _ParseMemoryMap(self, memoryMapElement: _Element) -> None:
+		name = ""
+		addressUnitBits = 8
+		blocks = []
+		for element in memoryMapElement:
+			tag = __MEMORY_MAP_TAG__(element.tag)
+			if tag == "name":
+				name = element.text or ""
+			elif tag == "addressBlock":
+				blocks.append(element)
+			elif tag == "addressUnitBits":
+				addressUnitBits = self._ParseValue(element.text)
+
+		self.AddMemoryMap(name, addressUnitBits)
+		for block in blocks:
+			self._ParseAddressBlock(block)
+
+	def _ParseAddressBlock(self, blockElement: _Element) -> None:
+		name = ""
+		baseAddress = rangeValue = width = 0
+		access = AccessType.Unspecified
+		registers = []
+		for element in blockElement:
+			tag = __MEMORY_MAP_TAG__(element.tag)
+			if tag == "name":
+				name = element.text or ""
+			elif tag == "baseAddress":
+				baseAddress = self._ParseValue(element.text)
+			elif tag == "range":
+				rangeValue = self._ParseValue(element.text)
+			elif tag == "width":
+				width = self._ParseValue(element.text)
+			elif tag == "access" or tag == "accessPolicies":
+				access = self._ParseAccess(element)
+			elif tag == "register" or tag == "registerFile":
+				registers.append(element)
+
+		self.AddAddressBlock(name, baseAddress, rangeValue, width, access)
+		self._ParseRegisters(registers, 0)
+
+	def _ParseRegisters(self, elements: List[_Element], baseOffset: Value) -> None:
+		for element in elements:
+			if __MEMORY_MAP_TAG__(element.tag) == "register":
+				self._ParseRegister(element, baseOffset)
+			else:
+				self._ParseRegisterFile(element, baseOffset)
+
+	def _ParseRegisterFile(self, registerFileElement: _Element, baseOffset: Value) -> None:
+		offset = 0
+		registers = []
+		for element in registerFileElement:
+			tag = __MEMORY_MAP_TAG__(element.tag)
+			if tag == "addressOffset":
+				offset = self._ParseValue(element.text)
+			elif tag == "register" or tag == "registerFile":
+				registers.append(element)
+
+		self._ParseRegisters(registers, self._AddOffsets(baseOffset, offset))
+
+	def _ParseRegister(self, registerElement: _Element, baseOffset: Value) -> None:
+		name = ""
+		offset = size = 0
+		access = AccessType.Unspecified
+		reset = None
+		fields = []
+		for element in registerElement:
+			tag = __MEMORY_MAP_TAG__(element.tag)
+			if tag == "name":
+				name = element.text or ""
+			elif tag == "addressOffset":
+				offset = self._ParseValue(element.text)
+			elif tag == "size":
+				size = self._ParseValue(element.text)
+			elif tag == "access" or tag == "accessPolicies":
+				access = self._ParseAccess(element)
+			elif tag == "reset":
+				# IP-XACT 2009 defines reset values per register.
+				reset = self._ParseResetValue(element)
+			elif tag == "field":
+				fields.append(self._ParseField(element))
+
+		if reset is None:
+			# Since IP-XACT 2014, reset values are defined per field. The register's reset value is composed of them, if every
+			# field has a constant reset value. Otherwise, some bits have no defined reset value and the register has none.
+			if len(fields) > 0 and all(
+				isinstance(bitOffset, int) and isinstance(bitWidth, int) and isinstance(fieldReset, int)
+				for _, bitOffset, bitWidth, _, fieldReset in fields
+			):
+				reset = 0
+				for _, bitOffset, bitWidth, _, fieldReset in fields:
+					reset |= (fieldReset & ((1 << bitWidth) - 1)) << bitOffset
+		elif isinstance(reset, int):
+			fields = [
+				(fieldName, bitOffset, bitWidth, fieldAccess, (reset >> bitOffset) & ((1 << bitWidth) - 1) if isinstance(bitOffset, int) and isinstance(bitWidth, int) else None)
+				for fieldName, bitOffset, bitWidth, fieldAccess, _ in fields
+			]
+
+		self.AddRegister(name, self._AddOffsets(baseOffset, offset), size, access, reset)
+		for field in fields:
+			self.AddField(*field)
+
+	def _ParseField(self, fieldElement: _Element) -> Tuple[str, Value, Value, AccessType, Nullable[Value]]:
+		name = ""
+		bitOffset = bitWidth = 0
+		access = AccessType.Unspecified
+		reset = None
+		for element in fieldElement:
+			tag = __MEMORY_MAP_TAG__(element.tag)
+			if tag == "name":
+				name = element.text or ""
+			elif tag == "bitOffset":
+				bitOffset = self._ParseValue(element.text)
+			elif tag == "bitWidth":
+				bitWidth = self._ParseValue(element.text)
+			elif tag == "access" or tag == "fieldAccessPolicies":
+				access = self._ParseAccess(element)
+			elif tag == "resets":
+				# The reset without reset type is the default (hard) reset. Otherwise, the first reset is used.
+				for resetElement in element:
+					if __MEMORY_MAP_TAG__(resetElement.tag) == "reset":
+						if reset is None or resetElement.get("resetTypeRef") is None:
+							reset = self._ParseResetValue(resetElement)
+						if resetElement.get("resetTypeRef") is None:
+							break
+
+		return name, bitOffset, bitWidth, access, reset
+
+	def _ParseResetValue(self, resetElement: _Element) -> Nullable[Value]:
+		for element in resetElement:
+			if __MEMORY_MAP_TAG__(element.tag) == "value":
+				return self._ParseValue(element.text)
+
+		return None
+
+	@staticmethod
+	def _ParseAccess(element: _Element) -> AccessType:
+		if __MEMORY_MAP_TAG__(element.tag) == "access":
+			return __ACCESS_TYPES__.get(element.text, AccessType.Unspecified)
+
+		# IP-XACT 2022 wraps the access type in (field) access policies. The first policy's access type is used.
+		for policyElement in element:
+			for accessElement in policyElement:
+				if __MEMORY_MAP_TAG__(accessElement.tag) == "access":
+					return __ACCESS_TYPES__.get(accessElement.text, AccessType.Unspecified)
+
+		return AccessType.Unspecified
+
+	@staticmethod
+	def _ParseValue(text: Nullable[str]) -> Value:
+		value = ParseInteger(text)
+		return value if value is not None else ("" if text is None else text.strip())
+
+	@staticmethod
+	def _AddOffsets(baseOffset: Value, offset: Value) -> Value:
+		if isinstance(baseOffset, int) and isinstance(offset, int):
+			return baseOffset + offset
+		elif baseOffset == 0:
+			return offset
+
+		return f"({baseOffset}) + ({offset})"
+
+	def IterateXml(self, memoryMapIndex: int, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> Iterator[str]:
+		"""
+		Converts a memory map into XML format and yields one chunk per address block.
+
+		The elements are written in the layout of the schema's IP-XACT version: IP-XACT 2009 and older define reset values
+		per register, IP-XACT 2022 wraps access types in access policies.
+
+		:param memoryMapIndex: Index of the memory map.
+		:param indent:         Level of indentations.
+		:param schema:         XML schema.
+		:returns:              An iterator of XML formatted strings.
+		"""
+		# WORKAROUND:
+		#   Python <=3.11:
+		#   {'\t' * indent} is not supported by Python before 3.12 due to a backslash within {...}
+		indentation = "\t" * indent
+		xmlns = schema.NamespacePrefix
+		version = schema.Version.Major
+		yield f"{indentation}<{xmlns}:memoryMap>\n{indentation}\t<{xmlns}:name>{EscapeXml(self._mapNames[memoryMapIndex])}</{xmlns}:name>\n"
+		for blockIndex in self._Range(self._mapFirstBlocks, memoryMapIndex, len(self._blockNames)):
+			yield "".join(self._IterateBlockXml(blockIndex, f"{indentation}\t", xmlns, version))
+		yield f"{indentation}\t<{xmlns}:addressUnitBits>{self._Format(self._mapAddressUnitBits, 'memoryMap.addressUnitBits', memoryMapIndex)}</{xmlns}:addressUnitBits>\n"
+		yield f"{indentation}</{xmlns}:memoryMap>\n"
+
+	def _IterateBlockXml(self, index: int, indent: str, xmlns: str, version: int) -> Iterator[str]:
+		yield (
+			f"{indent}<{xmlns}:addressBlock>\n"
+			f"{indent}\t<{xmlns}:name>{EscapeXml(self._blockNames[index])}</{xmlns}:name>\n"
+			f"{indent}\t<{xmlns}:baseAddress>{self._Format(self._blockBaseAddresses, 'addressBlock.baseAddress', index, version)}</{xmlns}:baseAddress>\n"
+			f"{indent}\t<{xmlns}:range>{self._Format(self._blockRanges, 'addressBlock.range', index, version)}</{xmlns}:range>\n"
+			f"{indent}\t<{xmlns}:width>{self._Format(self._blockWidths, 'addressBlock.width', index)}</{xmlns}:width>\n"
+		)
+		yield self._FormatAccess(self._blockAccesses[index], f"{indent}\t", xmlns, version, "accessPolicies", "accessPolicy")
+		for registerIndex in self._Range(self._blockFirstRegisters, index, len(self._registerNames)):
+			yield from self._IterateRegisterXml(registerIndex, f"{indent}\t", xmlns, version)
+		yield f"{indent}</{xmlns}:addressBlock>\n"
+
+	def _IterateRegisterXml(self, index: int, indent: str, xmlns: str, version: int) -> Iterator[str]:
+		yield (
+			f"{indent}<{xmlns}:register>\n"
+			f"{indent}\t<{xmlns}:name>{EscapeXml(self._registerNames[index])}</{xmlns}:name>\n"
+			f"{indent}\t<{xmlns}:addressOffset>{self._Format(self._registerOffsets, 'register.addressOffset', index, version)}</{xmlns}:addressOffset>\n"
+			f"{indent}\t<{xmlns}:size>{self._Format(self._registerSizes, 'register.size', index)}</{xmlns}:size>\n"
+		)
+		yield self._FormatAccess(self._registerAccesses[index], f"{indent}\t", xmlns, version, "accessPolicies", "accessPolicy")
+		if version < 2014 and self._registerHasResets[index]:
+			yield f"{indent}\t<{xmlns}:reset>\n{indent}\t\t<{xmlns}:value>{self._Format(self._registerResets, 'register.reset', index, version)}</{xmlns}:value>\n{indent}\t</{xmlns}:reset>\n"
+
+		for fieldIndex in self._Range(self._registerFirstFields, index, len(self._fieldNames)):
+			yield from self._IterateFieldXml(fieldIndex, f"{indent}\t", xmlns, version)
+		yield f"{indent}</{xmlns}:register>\n"
+
+	def _IterateFieldXml(self, index: int, indent: str, xmlns: str, version: int) -> Iterator[str]:
+		bitWidth = f"{indent}\t<{xmlns}:bitWidth>{self._Format(self._fieldBitWidths, 'field.bitWidth', index)}</{xmlns}:bitWidth>\n"
+		resets = ""
+		if version >= 2014 and self._fieldHasResets[index]:
+			resets = (
+				f"{indent}\t<{xmlns}:resets>\n"
+				f"{indent}\t\t<{xmlns}:reset>\n"
+				f"{indent}\t\t\t<{xmlns}:value>{self._Format(self._fieldResets, 'field.reset', index, version)}</{xmlns}:value>\n"
+				f"{indent}\t\t</{xmlns}:reset>\n"
+				f"{indent}\t</{xmlns}:resets>\n"
+			)
+
+		yield (
+			f"{indent}<{xmlns}:field>\n"
+			f"{indent}\t<{xmlns}:name>{EscapeXml(self._fieldNames[index])}</{xmlns}:name>\n"
+			f"{indent}\t<{xmlns}:bitOffset>{self._Format(self._fieldBitOffsets, 'field.bitOffset', index)}</{xmlns}:bitOffset>\n"
+		)
+		# The reset values precede the bit width in IP-XACT 2014, but follow it in IP-XACT 2022.
+		yield bitWidth + resets if version >= 2022 else resets + bitWidth
+		yield self._FormatAccess(self._fieldAccesses[index], f"{indent}\t", xmlns, version, "fieldAccessPolicies", "fieldAccessPolicy")
+		yield f"{indent}</{xmlns}:field>\n"
+
+	def _Format(self, column: array, name: str, index: int, version: Nullable[int] = None) -> str:
+		"""Formats a value as decimal number or, if a version is given, as hexadecimal literal of this version."""
+		value = self._Raw(column, name, index)
+		if isinstance(value, str):
+			return EscapeXml(value)
+		elif version is None:
+			return str(value)
+		elif version < 2014:
+			return f"0x{value:X}"
+		else:
+			return f"'h{value:X}"
+
+	@staticmethod
+	def _FormatAccess(code: int, indent: str, xmlns: str, version: int, policiesTag: str, policyTag: str) -> str:
+		if code == 0:
+			return ""
+		elif version < 2022:
+			return f"{indent}<{xmlns}:access>{__ACCESS_NAMES__[code]}</{xmlns}:access>\n"
+		else:
+			return (
+				f"{indent}<{xmlns}:{policiesTag}>\n"
+				f"{indent}\t<{xmlns}:{policyTag}>\n"
+				f"{indent}\t\t<{xmlns}:access>{__ACCESS_NAMES__[code]}</{xmlns}:access>\n"
+				f"{indent}\t</{xmlns}:{policyTag}>\n"
+				f"{indent}</{xmlns}:{policiesTag}>\n"
+			)
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} {len(self._mapNames)} memory maps, {len(self._blockNames)} address blocks, {len(self._registerNames)} registers, {len(self._fieldNames)} fields>"
+
+
+@export
+class MemoryMap(Element):
+	"""View of a memory map in a :class:`MemoryMapTable`."""
+
+	_table: MemoryMapTable  #: Table storing the memory map.
+	_index: int             #: Row of the memory map in the table.
+
+	def __init__(self, table: MemoryMapTable, index: int) -> None:
+		self._table = table
+		self._index = index
+
+	@readonly
+	def Table(self) -> MemoryMapTable:
+		return self._table
+
+	@readonly
+	def Index(self) -> int:
+		return self._index
+
+	@readonly
+	def Name(self) -> str:
+		return self._table._mapNames[self._index]
+
+	@readonly
+	def AddressUnitBits(self) -> Nullable[int]:
+		return self._table._Get(self._table._mapAddressUnitBits, "memoryMap.addressUnitBits", self._index)
+
+	@readonly
+	def AddressBlocks(self) -> List["AddressBlock"]:
+		table = self._table
+		return [AddressBlock(table, index) for index in table._Range(table._mapFirstBlocks, self._index, len(table._blockNames))]
+
+	def IterateXml(self, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> Iterator[str]:
+		"""
+		Converts the object's data into XML format and yields one chunk per address block.
+
+		:param indent: Level of indentations.
+		:param schema: XML schema.
+		:returns:      An iterator of XML formatted strings.
+		"""
+		return self._table.IterateXml(self._index, indent, schema)
+
+	def ToXml(self, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
+		"""Converts the object's data into XML format."""
+
+		return "".join(self.IterateXml(indent, schema))
+
+	def __str__(self) -> str:
+		return f"MemoryMap {self.Name}"
+
+
+@export
+class AddressBlock(Element):
+	"""View of an address block in a :class:`MemoryMapTable`."""
+
+	_table: MemoryMapTable  #: Table storing the address block.
+	_index: int             #: Row of the address block in the table.
+
+	def __init__(self, table: MemoryMapTable, index: int) -> None:
+		self._table = table
+		self._index = index
+
+	@readonly
+	def Index(self) -> int:
+		return self._index
+
+	@readonly
+	def Name(self) -> str:
+		return self._table._blockNames[self._index]
+
+	@readonly
+	def MemoryMap(self) -> MemoryMap:
+		return MemoryMap(self._table, self._table._blockMaps[self._index])
+
+	@readonly
+	def BaseAddress(self) -> Nullable[int]:
+		return self._table._Get(self._table._blockBaseAddresses, "addressBlock.baseAddress", self._index)
+
+	@readonly
+	def Range(self) -> Nullable[int]:
+		return self._table._Get(self._table._blockRanges, "addressBlock.range", self._index)
+
+	@readonly
+	def Width(self) -> Nullable[int]:
+		return self._table._Get(self._table._blockWidths, "addressBlock.width", self._index)
+
+	@readonly
+	def Access(self) -> AccessType:
+		return __ACCESS_CODES__[self._table._blockAccesses[self._index]]
+
+	@readonly
+	def Registers(self) -> List["Register"]:
+		table = self._table
+		return [Register(table, index) for index in table._Range(table._blockFirstRegisters, self._index, len(table._registerNames))]
+
+	def Expression(self, column: str) -> Nullable[str]:
+		"""
+		Returns the unresolved expression of a value.
+
+		:param column: Name of the column without level, e.g. ``range``.
+		:returns:      The expression or ``None``, if the value is an integer.
+		"""
+		return self._table.Expression(f"addressBlock.{column}", self._index)
+
+	def ToXml(self, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
+		"""Converts the object's data into XML format."""
+
+		return "".join(self._table._IterateBlockXml(self._index, "\t" * indent, schema.NamespacePrefix, schema.Version.Major))
+
+	def __str__(self) -> str:
+		return f"AddressBlock {self.Name}"
+
+
+@export
+class Register(Element):
+	"""View of a register in a :class:`MemoryMapTable`."""
+
+	_table: MemoryMapTable  #: Table storing the register.
+	_index: int             #: Row of the register in the table.
+
+	def __init__(self, table: MemoryMapTable, index: int) -> None:
+		self._table = table
+		self._index = index
+
+	@readonly
+	def Index(self) -> int:
+		return self._index
+
+	@readonly
+	def Name(self) -> str:
+		return self._table._registerNames[self._index]
+
+	@readonly
+	def AddressBlock(self) -> AddressBlock:
+		return AddressBlock(self._table, self._table._registerBlocks[self._index])
+
+	@readonly
+	def AddressOffset(self) -> Nullable[int]:
+		return self._table._Get(self._table._registerOffsets, "register.addressOffset", self._index)
+
+	@readonly
+	def Address(self) -> Nullable[int]:
+		"""
+		Read-only property to access the register's address.
+
+		:returns: Sum of the address block's base address and the register's address offset or ``None``, if either is
+		          unresolved.
+		"""
+		baseAddress = self.AddressBlock.BaseAddress
+		offset = self.AddressOffset
+		return None if baseAddress is None or offset is None else baseAddress + offset
+
+	@readonly
+	def Size(self) -> Nullable[int]:
+		return self._table._Get(self._table._registerSizes, "register.size", self._index)
+
+	@readonly
+	def Access(self) -> AccessType:
+		return __ACCESS_CODES__[self._table._registerAccesses[self._index]]
+
+	@readonly
+	def Reset(self) -> Nullable[int]:
+		if not self._table._registerHasResets[self._index]:
+			return None
+
+		return self._table._Get(self._table._registerResets, "register.reset", self._index)
+
+	@readonly
+	def Fields(self) -> List["Field"]:
+		table = self._table
+		return [Field(table, index) for index in table._Range(table._registerFirstFields, self._index, len(table._fieldNames))]
+
+	def Expression(self, column: str) -> Nullable[str]:
+		"""
+		Returns the unresolved expression of a value.
+
+		:param column: Name of the column without level, e.g. ``addressOffset``.
+		:returns:      The expression or ``None``, if the value is an integer.
+		"""
+		return self._table.Expression(f"register.{column}", self._index)
+
+	def ToXml(self, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
+		"""Converts the object's data into XML format."""
+
+		return "".join(self._table._IterateRegisterXml(self._index, "\t" * indent, schema.NamespacePrefix, schema.Version.Major))
+
+	def __str__(self) -> str:
+		return f"Register {self.Name}"
+
+
+@export
+class Field(Element):
+	"""View of a register field in a :class:`MemoryMapTable`."""
+
+	_table: MemoryMapTable  #: Table storing the field.
+	_index: int             #: Row of the field in the table.
+
+	def __init__(self, table: MemoryMapTable, index: int) -> None:
+		self._table = table
+		self._index = index
+
+	@readonly
+	def Index(self) -> int:
+		return self._index
+
+	@readonly
+	def Name(self) -> str:
+		return self._table._fieldNames[self._index]
+
+	@readonly
+	def Register(self) -> Register:
+		return Register(self._table, self._table._fieldRegisters[self._index])
+
+	@readonly
+	def BitOffset(self) -> Nullable[int]:
+		return self._table._Get(self._table._fieldBitOffsets, "field.bitOffset", self._index)
+
+	@readonly
+	def BitWidth(self) -> Nullable[int]:
+		return self._table._Get(self._table._fieldBitWidths, "field.bitWidth", self._index)
+
+	@readonly
+	def Access(self) -> AccessType:
+		return __ACCESS_CODES__[self._table._fieldAccesses[self._index]]
+
+	@readonly
+	def EffectiveAccess(self) -> AccessType:
+		"""
+		Read-only property to access the field's access type including inherited access types.
+
+		:returns: The access type of the field, or if unspecified, of its register or its address block.
+		"""
+		table = self._table
+		code = table._fieldAccesses[self._index]
+		if code == 0:
+			registerIndex = table._fieldRegisters[self._index]
+			code = table._registerAccesses[registerIndex]
+			if code == 0:
+				code = table._blockAccesses[table._registerBlocks[registerIndex]]
+
+		return __ACCESS_CODES__[code]
+
+	@readonly
+	def Reset(self) -> Nullable[int]:
+		if not self._table._fieldHasResets[self._index]:
+			return None
+
+		return self._table._Get(self._table._fieldResets, "field.reset", self._index)
+
+	def Expression(self, column: str) -> Nullable[str]:
+		"""
+		Returns the unresolved expression of a value.
+
+		:param column: Name of the column without level, e.g. ``bitWidth``.
+		:returns:      The expression or ``None``, if the value is an integer.
+		"""
+		return self._table.Expression(f"field.{column}", self._index)
+
+	def ToXml(self, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
+		"""Converts the object's data into XML format."""
+
+		return "".join(self._table._IterateFieldXml(self._index, "\t" * indent, schema.NamespacePrefix, schema.Version.Major))
+
+	def __str__(self) -> str:
+		return f"Field {self.Name}"
@@ -0,0 +1,647 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___ ______  __    _    ____ _____                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    |_ _|  _ \ \/ /   / \  / ___|_   _|                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \    | || |_) \  /   / _ \| |     | |                                          #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ _ | ||  __//  \  / ___ \ |___  | |                                          #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___|_|  /_/\_\/_/   \_\____| |_|                                          #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2025 Patrick Lehmann - Bötzingen, Germany                                                             #
+# Copyright 2016-2016 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+A repository of loaded IP-XACT documents and a resolver populating it by following catalog references.
+"""
+from asyncio             import Semaphore, TaskGroup, get_running_loop
+from bisect              import bisect_left, bisect_right
+from concurrent.futures  import Executor, Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from os                  import cpu_count
+from pathlib             import Path
+from sys                 import version_info
+from typing              import Dict, List, Optional as Nullable, Set, Tuple, Type, Iterator, Union
+
+from pyTooling.Decorators  import export, readonly
+from pyTooling.MetaClasses import ExtendedType
+from pyTooling.Common      import getFullyQualifiedName
+from pyTooling.Versioning  import SemanticVersion
+
+from pyEDAA.IPXACT                     import RootElement, VLNV, IPXACTException, TreeRetention, ValidationLevel
+from pyEDAA.IPXACT.Archive             import Archive
+from pyEDAA.IPXACT.Catalog             import Catalog, IpxactFile
+from pyEDAA.IPXACT.Component           import Component
+from pyEDAA.IPXACT.Design              import Design
+from pyEDAA.IPXACT.DesignConfiguration import DesignConfiguration
+from pyEDAA.IPXACT.GeneratorChain      import GeneratorChain
+
+
+__SECTION_CLASSES__: Dict[str, Type[RootElement]] = {
+	"catalogs":             Catalog,
+	"components":           Component,
+	"designs":              Design,
+	"designConfigurations": DesignConfiguration,
+	"generatorChains":      GeneratorChain,
+}  #: Mapping from catalog sections to :class:`~pyEDAA.IPXACT.RootElement` subclasses.
+
+
+class _VersionList(metaclass=ExtendedType, slots=True):
+	"""Versions of one vendor:library:name, sorted ascending, and the corresponding root elements."""
+
+	_versions: List[SemanticVersion]
+	_elements: List[RootElement]
+
+	def __init__(self) -> None:
+		self._versions = []
+		self._elements = []
+
+
+@export
+class VLNVIndex(metaclass=ExtendedType, slots=True):
+	"""
+	An index of root elements organized as a vendor → library → name → sorted versions hierarchy.
+
+	Exact lookups are hash lookups. Latest version and version range queries are binary searches in the sorted version
+	list of a vendor:library:name. Prefix scans by vendor or library only visit the matching subtrees.
+	"""
+
+	_elements: Dict[VLNV, RootElement]                        #: Root elements by VLNV.
+	_tree:     Dict[str, Dict[str, Dict[str, _VersionList]]]  #: Vendor → library → name → versions.
+
+	def __init__(self) -> None:
+		self._elements = {}
+		self._tree =     {}
+
+	def __len__(self) -> int:
+		return len(self._elements)
+
+	def __contains__(self, vlnv: VLNV) -> bool:
+		return vlnv in self._elements
+
+	def __getitem__(self, vlnv: VLNV) -> RootElement:
+		return self._elements[vlnv]
+
+	def __iter__(self) -> Iterator[RootElement]:
+		return iter(self._elements.values())
+
+	def Add(self, element: RootElement) -> None:
+		"""
+		Adds a root element to the index.
+
+		:param element:     Root element to add.
+		:raises ValueError: If an element with the same VLNV exists.
+		"""
+		vlnv = element.VLNV
+		if vlnv in self._elements:
+			raise ValueError(f"Duplicate VLNV '{vlnv}'.")
+
+		self._elements[vlnv] = element
+
+		libraries = self._tree.setdefault(vlnv.Vendor, {})
+		names = libraries.setdefault(vlnv.Library, {})
+		try:
+			versionList = names[vlnv.Name]
+		except KeyError:
+			versionList = names[vlnv.Name] = _VersionList()
+
+		index = bisect_right(versionList._versions, vlnv.Version)
+		versionList._versions.insert(index, vlnv.Version)
+		versionList._elements.insert(index, element)
+
+	def Remove(self, vlnv: VLNV) -> RootElement:
+		"""
+		Removes a root element from the index.
+
+		:param vlnv:      VLNV of the element to remove.
+		:returns:         The removed element.
+		:raises KeyError: If no element with this VLNV exists.
+		"""
+		element = self._elements.pop(vlnv)
+
+		libraries = self._tree[vlnv.Vendor]
+		names = libraries[vlnv.Library]
+		versionList = names[vlnv.Name]
+		index = bisect_left(versionList._versions, vlnv.Version)
+		del versionList._versions[index]
+		del versionList._elements[index]
+
+		if len(versionList._versions) == 0:
+			del names[vlnv.Name]
+			if len(names) == 0:
+				del libraries[vlnv.Library]
+				if len(libraries) == 0:
+					del self._tree[vlnv.Vendor]
+
+		return element
+
+	def Get(self, vlnv: VLNV) -> Nullable[RootElement]:
+		"""
+		Returns the root element with exactly this VLNV.
+
+		:param vlnv: VLNV to look up.
+		:returns:    The root element or ``None``.
+		"""
+		return self._elements.get(vlnv, None)
+
+	def GetLatest(self, vendor: str, library: str, name: str) -> Nullable[RootElement]:
+		"""
+		Returns the root element with the highest version of a vendor:library:name.
+
+		:param vendor:  Vendor name.
+		:param library: Library name.
+		:param name:    Component name.
+		:returns:       The root element or ``None``.
+		"""
+		versionList = self._GetVersionList(vendor, library, name)
+		if versionList is None:
+			return None
+
+		return versionList._elements[-1]
+
+	def GetVersions(
+		self,
+		vendor: str,
+		library: str,
+		name: str,
+		minimum: Union[None, str, SemanticVersion] = None,
+		maximum: Union[None, str, SemanticVersion] = None,
+		includeMaximum: bool = True
+	) -> List[RootElement]:
+		"""
+		Returns all root elements of a vendor:library:name within a version range, sorted by version.
+
+		:param vendor:         Vendor name.
+		:param library:        Library name.
+		:param name:           Component name.
+		:param minimum:        Lowest version (inclusive). If ``None``, the range is unbounded.
+		:param maximum:        Highest version. If ``None``, the range is unbounded.
+		:param includeMaximum: If true, the highest version is included, otherwise excluded.
+		:returns:              List of root elements.
+		"""
+		versionList = self._GetVersionList(vendor, library, name)
+		if versionList is None:
+			return []
+
+		versions = versionList._versions
+		if minimum is None:
+			start = 0
+		else:
+			start = bisect_left(versions, self._ToVersion(minimum))
+
+		if maximum is None:
+			end = len(versions)
+		elif includeMaximum:
+			end = bisect_right(versions, self._ToVersion(maximum))
+		else:
+			end = bisect_left(versions, self._ToVersion(maximum))
+
+		return versionList._elements[start:end]
+
+	def IterateVendor(self, vendor: str) -> Iterator[RootElement]:
+		"""
+		Iterates all root elements of a vendor sorted by library, name and version.
+
+		:param vendor: Vendor name.
+		:returns:      An iterator of root elements.
+		"""
+		libraries = self._tree.get(vendor, {})
+		for library in sorted(libraries):
+			yield from self.IterateLibrary(vendor, library)
+
+	def IterateLibrary(self, vendor: str, library: str) -> Iterator[RootElement]:
+		"""
+		Iterates all root elements of a vendor's library sorted by name and version.
+
+		:param vendor:  Vendor name.
+		:param library: Library name.
+		:returns:       An iterator of root elements.
+		"""
+		names = self._tree.get(vendor, {}).get(library, {})
+		for name in sorted(names):
+			yield from names[name]._elements
+
+	@readonly
+	def Vendors(self) -> List[str]:
+		return sorted(self._tree)
+
+	def Libraries(self, vendor: str) -> List[str]:
+		"""
+		Returns all library names of a vendor.
+
+		:param vendor: Vendor name.
+		:returns:      Sorted list of library names.
+		"""
+		return sorted(self._tree.get(vendor, {}))
+
+	def Names(self, vendor: str, library: str) -> List[str]:
+		"""
+		Returns all names within a vendor's library.
+
+		:param vendor:  Vendor name.
+		:param library: Library name.
+		:returns:       Sorted list of names.
+		"""
+		return sorted(self._tree.get(vendor, {}).get(library, {}))
+
+	def _GetVersionList(self, vendor: str, library: str, name: str) -> Nullable[_VersionList]:
+		try:
+			return self._tree[vendor][library][name]
+		except KeyError:
+			return None
+
+	@staticmethod
+	def _ToVersion(version: Union[str, SemanticVersion]) -> SemanticVersion:
+		if isinstance(version, SemanticVersion):
+			return version
+
+		return SemanticVersion.Parse(version)
+
+
+@export
+class Repository(metaclass=ExtendedType, slots=True):
+	"""
+	A collection of loaded IP-XACT documents addressable by VLNV and by resolved file path.
+
+	It also records load errors, unsupported references and catalog reference cycles found while resolving.
+	"""
+
+	_documents:   Dict[Path, RootElement]                       #: Loaded documents by resolved path.
+	_index:       VLNVIndex                                     #: Loaded documents by VLNV.
+	_errors:      Dict[Path, Exception]                         #: Load errors by resolved path.
+	_unsupported: List[Tuple[str, IpxactFile]]                  #: References to document types not supported by this package.
+	_cycles:      List[Tuple[Path, ...]]                        #: Catalog reference cycles as chains of catalog paths.
+
+	def __init__(self) -> None:
+		self._documents =   {}
+		self._index =       VLNVIndex()
+		self._errors =      {}
+		self._unsupported = []
+		self._cycles =      []
+
+	@readonly
+	def Documents(self) -> Dict[Path, RootElement]:
+		return self._documents
+
+	@readonly
+	def Index(self) -> VLNVIndex:
+		return self._index
+
+	@readonly
+	def Errors(self) -> Dict[Path, Exception]:
+		return self._errors
+
+	@readonly
+	def Unsupported(self) -> List[Tuple[str, IpxactFile]]:
+		return self._unsupported
+
+	@readonly
+	def Cycles(self) -> List[Tuple[Path, ...]]:
+		return self._cycles
+
+	@readonly
+	def Catalogs(self) -> List[Catalog]:
+		return [document for document in self._documents.values() if isinstance(document, Catalog)]
+
+	@readonly
+	def Components(self) -> List[Component]:
+		return [document for document in self._documents.values() if isinstance(document, Component)]
+
+	@readonly
+	def Designs(self) -> List[Design]:
+		return [document for document in self._documents.values() if isinstance(document, Design)]
+
+	def __len__(self) -> int:
+		return len(self._documents)
+
+	def __iter__(self) -> Iterator[RootElement]:
+		return iter(self._documents.values())
+
+	def __contains__(self, vlnv: VLNV) -> bool:
+		return vlnv in self._index
+
+	def Add(self, document: RootElement, path: Nullable[Path] = None) -> None:
+		"""
+		Adds a document to the repository.
+
+		:param document:    Document to add.
+		:param path:        Resolved path of the document. If ``None``, the document's file is used.
+		:raises TypeError:  If parameter document is not a RootElement.
+		:raises ValueError: If a document with the same VLNV or path was already added.
+		"""
+		if not isinstance(document, RootElement):
+			ex = TypeError(f"Parameter 'document' is not a RootElement.")
+			if version_info >= (3, 11):  # pragma: no cover
+				ex.add_note(f"Got type '{getFullyQualifiedName(document)}'.")
+			raise ex
+
+		if path is None and document.File is not None:
+			path = document.File.resolve()
+
+		if path in self._documents:
+			raise ValueError(f"Duplicate document '{path}'.")
+
+		self._index.Add(document)
+		if path is not None:
+			self._documents[path] = document
+
+	def GetByVLNV(self, vlnv: VLNV) -> RootElement:
+		"""
+		Returns the document identified by a VLNV.
+
+		:param vlnv:     VLNV of the document.
+		:returns:        The document.
+		:raises KeyError: If no document with this VLNV exists.
+		"""
+		return self._index[vlnv]
+
+	def GetByPath(self, path: Path) -> RootElement:
+		"""
+		Returns the document loaded from a file.
+
+		:param path:      Path of the document.
+		:returns:         The document.
+		:raises KeyError: If no document was loaded from this path.
+		"""
+		return self._documents[path.resolve()]
+
+	def __str__(self) -> str:
+		return f"Repository: {len(self._documents)} documents, {len(self._errors)} errors, {len(self._cycles)} cycles"
+
+
+def _LoadDocument(
+	cls: Type[RootElement],
+	path: Path,
+	streaming: bool,
+	retention: TreeRetention,
+	validation: ValidationLevel,
+	archive: Nullable[Archive]
+) -> RootElement:
+	if archive is None:
+		return cls(path, parse=True, streaming=streaming, retention=retention, validation=validation)
+	else:
+		return archive.Load(archive.MemberOf(path), cls, streaming, retention, validation)
+
+
+@export
+class CatalogResolver(metaclass=ExtendedType, slots=True):
+	"""
+	Resolves a catalog graph into a fully populated :class:`Repository`.
+
+	Starting from a root catalog, all ``ipxactFile`` references are loaded concurrently in a thread pool. Referenced
+	catalogs are resolved recursively. References are deduplicated by VLNV and by resolved path, and catalog reference
+	cycles are detected and reported instead of being followed.
+
+	.. code-block:: python
+
+	   from pyEDAA.IPXACT.Repository import CatalogResolver
+
+	   repository = CatalogResolver(workers=16).ResolveFile(Path("ip/catalog.xml"))
+	   component = repository.GetByVLNV(VLNV("vendor", "library", "name", "1.0"))
+	"""
+
+	_workers:    int              #: Number of worker threads.
+	_streaming:  bool             #: Parse documents incrementally.
+	_retention:  TreeRetention    #: Retention policy for the lxml trees of loaded documents.
+	_validation: ValidationLevel  #: Validation level applied to loaded documents.
+
+	def __init__(
+		self,
+		workers: Nullable[int] = None,
+		streaming: bool = False,
+		retention: TreeRetention = TreeRetention.Drop,
+		validation: ValidationLevel = ValidationLevel.Full
+	) -> None:
+		"""
+		Initializes a catalog resolver.
+
+		:param workers:     Number of worker threads. If ``None``, the number of CPU cores is used.
+		:param streaming:   If true, parse documents incrementally.
+		:param retention:   Retention policy for the lxml trees of loaded documents.
+		:param validation:  Validation level applied to loaded documents.
+		:raises ValueError: If parameter workers is less than 1.
+		"""
+		if workers is None:
+			workers = cpu_count() or 1
+		elif workers < 1:
+			raise ValueError(f"Parameter 'workers' must be at least 1.")
+
+		self._workers =    workers
+		self._streaming =  streaming
+		self._retention =  retention
+		self._validation = validation
+
+	@readonly
+	def Workers(self) -> int:
+		return self._workers
+
+	def ResolveFile(self, catalogFile: Path) -> Repository:
+		"""
+		Loads a root catalog file and resolves all references.
+
+		:param catalogFile:      Path to the root catalog.
+		:returns:                The populated repository.
+		:raises IPXACTException: If the root catalog can't be loaded.
+		"""
+		return self.Resolve(Catalog(catalogFile, parse=True, streaming=self._streaming, retention=self._retention, validation=self._validation))
+
+	def ResolveArchive(self, archive: Archive, catalogMember: str) -> Repository:
+		"""
+		Loads a root catalog from an archive and resolves all references within this archive.
+
+		Only referenced members are decompressed. Documents are registered in the repository by their pseudo paths (see
+		:meth:`Archive.PathOf <pyEDAA.IPXACT.Archive.Archive.PathOf>`).
+
+		:param archive:          The archive containing the IP-XACT documents.
+		:param catalogMember:    Member name of the root catalog.
+		:returns:                The populated repository.
+		:raises IPXACTException: If the root catalog can't be loaded.
+		"""
+		catalog = archive.Load(catalogMember, Catalog, self._streaming, self._retention, self._validation)
+		return self._Resolve(catalog, archive.PathOf(catalogMember), archive)
+
+	def Resolve(self, catalog: Catalog) -> Repository:
+		"""
+		Resolves all references of a root catalog.
+
+		Relative file names in ``ipxactFile`` references are resolved relative to the referencing catalog.
+
+		:param catalog:          The root catalog. It must have been loaded from a file.
+		:returns:                The populated repository (including the root catalog).
+		:raises TypeError:       If parameter catalog is not a Catalog.
+		:raises IPXACTException: If the root catalog has no file.
+		"""
+		if not isinstance(catalog, Catalog):
+			ex = TypeError(f"Parameter 'catalog' is not a Catalog.")
+			if version_info >= (3, 11):  # pragma: no cover
+				ex.add_note(f"Got type '{getFullyQualifiedName(catalog)}'.")
+			raise ex
+		elif catalog.File is None:
+			raise IPXACTException(f"Root catalog '{catalog.VLNV.Name}' wasn't loaded from a file.")
+
+		return self._Resolve(catalog, catalog.File.resolve(), None)
+
+	async def ResolveFileAsync(self, catalogFile: Path, executor: Nullable[Executor] = None) -> Repository:
+		"""
+		Loads a root catalog file and resolves all references without blocking the running event loop.
+
+		See :meth:`ResolveAsync` for details.
+
+		:param catalogFile:      Path to the root catalog.
+		:param executor:         Thread pool executor. If ``None``, the event loop's default executor is used.
+		:returns:                The populated repository.
+		:raises IPXACTException: If the root catalog can't be loaded.
+		"""
+		catalog = await Catalog.LoadAsync(catalogFile, self._streaming, self._retention, executor, self._validation)
+		return await self._ResolveAsync(catalog, catalog.File.resolve(), executor)
+
+	async def ResolveAsync(self, catalog: Catalog, executor: Nullable[Executor] = None) -> Repository:
+		"""
+		Resolves all references of a root catalog without blocking the running event loop.
+
+		Documents are loaded in an executor. At most :attr:`Workers` documents are loaded at the same time. If the
+		awaiting task is cancelled, all pending loads are cancelled, too.
+
+		.. code-block:: python
+
+		   repository = await CatalogResolver(workers=16).ResolveFileAsync(Path("ip/catalog.xml"))
+
+		:param catalog:          The root catalog. It must have been loaded from a file.
+		:param executor:         Thread pool executor. If ``None``, the event loop's default executor is used.
+		:returns:                The populated repository (including the root catalog).
+		:raises TypeError:       If parameter catalog is not a Catalog.
+		:raises IPXACTException: If the root catalog has no file.
+		"""
+		if not isinstance(catalog, Catalog):
+			ex = TypeError(f"Parameter 'catalog' is not a Catalog.")
+			if version_info >= (3, 11):  # pragma: no cover
+				ex.add_note(f"Got type '{getFullyQualifiedName(catalog)}'.")
+			raise ex
+		elif catalog.File is None:
+			raise IPXACTException(f"Root catalog '{catalog.VLNV.Name}' wasn't loaded from a file.")
+
+		return await self._ResolveAsync(catalog, catalog.File.resolve(), executor)
+
+	def _Resolve(self, catalog: Catalog, rootPath: Path, archive: Nullable[Archive]) -> Repository:
+		repository = Repository()
+		repository.Add(catalog, rootPath)
+
+		seenPaths = {rootPath}
+		seenVLNVs = {catalog.VLNV}
+		pending: Dict[Future, Tuple[Path, Tuple[Path, ...]]] = {}
+
+		with ThreadPoolExecutor(max_workers=self._workers) as executor:
+			def schedule(referencingCatalog: Catalog, catalogPath: Path, ancestors: Tuple[Path, ...]) -> None:
+				for cls, path, pathAncestors in self._IterateReferences(repository, referencingCatalog, catalogPath, ancestors, seenPaths, seenVLNVs, archive):
+					future = executor.submit(_LoadDocument, cls, path, self._streaming, self._retention, self._validation, archive)
+					pending[future] = (path, pathAncestors)
+
+			schedule(catalog, rootPath, (rootPath, ))
+
+			while pending:
+				done, _ = wait(pending, return_when=FIRST_COMPLETED)
+				for future in done:
+					path, ancestors = pending.pop(future)
+					try:
+						document = future.result()
+					except Exception as ex:
+						repository._errors[path] = ex
+						continue
+
+					if self._AddDocument(repository, document, path):
+						schedule(document, path, ancestors)
+
+		return repository
+
+	async def _ResolveAsync(self, catalog: Catalog, rootPath: Path, executor: Nullable[Executor]) -> Repository:
+		repository = Repository()
+		repository.Add(catalog, rootPath)
+
+		seenPaths = {rootPath}
+		seenVLNVs = {catalog.VLNV}
+		loop = get_running_loop()
+		semaphore = Semaphore(self._workers)
+
+		# A task group cancels all pending loads, if the resolving task is cancelled.
+		async with TaskGroup() as group:
+			async def load(cls: Type[RootElement], path: Path, ancestors: Tuple[Path, ...]) -> None:
+				async with semaphore:
+					try:
+						document = await loop.run_in_executor(executor, _LoadDocument, cls, path, self._streaming, self._retention, self._validation, None)
+					except Exception as ex:
+						repository._errors[path] = ex
+						return
+
+				if self._AddDocument(repository, document, path):
+					schedule(document, path, ancestors)
+
+			def schedule(referencingCatalog: Catalog, catalogPath: Path, ancestors: Tuple[Path, ...]) -> None:
+				for cls, path, pathAncestors in self._IterateReferences(repository, referencingCatalog, catalogPath, ancestors, seenPaths, seenVLNVs, None):
+					group.create_task(load(cls, path, pathAncestors))
+
+			schedule(catalog, rootPath, (rootPath, ))
+
+		return repository
+
+	@staticmethod
+	def _IterateReferences(
+		repository: Repository,
+		referencingCatalog: Catalog,
+		catalogPath: Path,
+		ancestors: Tuple[Path, ...],
+		seenPaths: Set[Path],
+		seenVLNVs: Set[VLNV],
+		archive: Nullable[Archive]
+	) -> Iterator[Tuple[Type[RootElement], Path, Tuple[Path, ...]]]:
+		for section, ipxactFile in referencingCatalog.IterateReferences():
+			if archive is None:
+				path = (catalogPath.parent / ipxactFile.Name).resolve()
+			else:
+				try:
+					path = archive.PathOf(archive.Resolve(ipxactFile.Name, archive.MemberOf(catalogPath)))
+				except IPXACTException as ex:
+					repository._errors[catalogPath.parent / ipxactFile.Name] = ex
+					continue
+
+			cls = __SECTION_CLASSES__.get(section, None)
+			if cls is None:
+				repository._unsupported.append((section, ipxactFile))
+				continue
+			elif cls is Catalog and path in ancestors:
+				repository._cycles.append(ancestors + (path, ))
+				continue
+			elif path in seenPaths or ipxactFile.VLNV in seenVLNVs:
+				continue
+
+			seenPaths.add(path)
+			seenVLNVs.add(ipxactFile.VLNV)
+
+			yield cls, path, ancestors + (path, )
+
+	@staticmethod
+	def _AddDocument(repository: Repository, document: RootElement, path: Path) -> bool:
+		"""Adds a loaded document to the repository and returns true, if it's a catalog whose references must be followed."""
+		try:
+			repository.Add(document, path)
+		except ValueError as ex:
+			repository._errors[path] = ex
+			return False
+
+		return isinstance(document, Catalog)
@@ -0,0 +1,232 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___ ______  __    _    ____ _____                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    |_ _|  _ \ \/ /   / \  / ___|_   _|                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \    | || |_) \  /   / _ \| |     | |                                          #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ _ | ||  __//  \  / ___ \ |___  | |                                          #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___|_|  /_/\_\/_/   \_\____| |_|                                          #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2025 Patrick Lehmann - Bötzingen, Germany                                                             #
+# Copyright 2016-2016 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Resolving of remote XML schema URLs onto the XSD files bundled in :mod:`pyEDAA.IPXACT.Schema`.
+
+This module is imported on first use of :class:`SchemaResolver` or ``__SCHEMA_RESOLVER__``, so ``import pyEDAA.IPXACT``
+doesn't load lxml.
+"""
+from pathlib              import Path
+from threading            import RLock
+from typing               import Any, Dict, List, Optional as Nullable
+from urllib.parse         import urlparse
+from urllib.request       import url2pathname
+
+from lxml.etree           import Resolver
+from pyTooling.Decorators import export, readonly
+
+from pyEDAA.IPXACT        import __VERSION_TABLE__, __DEFAULT_SCHEMA__
+
+
+__W3C_XML_SCHEMA_URLS__ = (
+	"http://www.w3.org/2001/xml.xsd",
+	"http://www.w3.org/2009/01/xml.xsd",
+	"http://www.w3.org/XML/1998/namespace.xsd"
+)  #: URLs of the XML schema for namespace ``xml`` (``xml:lang``, ``xml:id``, ...), which is imported by IP-XACT schemas.
+
+
+@export
+class SchemaResolver(Resolver):
+	"""
+	An lxml resolver mapping remote XML schema URLs onto the XSD files bundled in :mod:`pyEDAA.IPXACT.Schema`.
+
+	Schema files are identified by their URL. A URL is mapped, if it's located below the schema URI or below the directory
+	of the schema URL of a known IP-XACT version, or if it refers to the W3C schema for namespace ``xml``. URLs, which
+	can't be mapped, are recorded in :attr:`Unmapped` and aren't loaded, because schemas are parsed with network access
+	disabled.
+
+	Local files (``file://`` URLs, e.g. of the relative includes and imports within the bundled schemas) and mapped files
+	are read once and then served from memory (see :meth:`Read`). Thus, compiling a schema again, e.g. in another thread,
+	parses the XSD files, but doesn't read them from disk.
+
+	Further mappings from URLs or URL prefixes (ending with ``/``) to local files or directories can be added by
+	:meth:`AddMapping`.
+	"""
+
+	# lxml's Resolver doesn't use __slots__, thus this class can't use ExtendedType with slots.
+	_lock:     RLock                        #: Lock protecting the mappings, the content cache and the statistics.
+	_prefixes: Nullable[Dict[str, Path]]    #: Local directories by URL prefix (without URL scheme).
+	_files:    Dict[str, Path]              #: Local files by URL (without URL scheme).
+	_contents: Dict[Path, bytes]            #: Content of resolved local files.
+	_unmapped: List[str]                    #: URLs, which couldn't be mapped.
+	_hits:     int                          #: Number of file reads served from memory.
+	_misses:   int                          #: Number of file reads, which required reading a file from disk.
+
+	def __init__(self) -> None:
+		"""
+		Initializes a schema resolver with mappings for all known IP-XACT versions.
+		"""
+		super().__init__()
+		self._lock =     RLock()
+		self._prefixes = None
+		self._files =    {}
+		self._contents = {}
+		self._unmapped = []
+		self._hits =     0
+		self._misses =   0
+
+	@readonly
+	def Unmapped(self) -> List[str]:
+		with self._lock:
+			return list(self._unmapped)
+
+	@readonly
+	def Hits(self) -> int:
+		return self._hits
+
+	@readonly
+	def Misses(self) -> int:
+		return self._misses
+
+	def AddMapping(self, url: str, path: Path) -> None:
+		"""
+		Maps a URL onto a local file or a URL prefix (ending with ``/``) onto a local directory.
+
+		:param url:  URL or URL prefix. The URL scheme (``http`` or ``https``) is ignored.
+		:param path: Local file or directory.
+		"""
+		with self._lock:
+			if url.endswith("/"):
+				self._GetPrefixes()[self._StripScheme(url)] = path
+			else:
+				self._files[self._StripScheme(url)] = path
+
+	def Map(self, url: str) -> Nullable[Path]:
+		"""
+		Maps a remote URL onto a local file.
+
+		:param url: Remote URL.
+		:returns:   Path to the local file or ``None``, if the URL can't be mapped.
+		"""
+		url = self._StripScheme(url)
+		with self._lock:
+			# The mappings must be computed first, as they add the files of the W3C schema for namespace 'xml'.
+			prefixes = self._GetPrefixes()
+			try:
+				return self._files[url]
+			except KeyError:
+				pass
+
+			for prefix, directory in prefixes.items():
+				if url.startswith(prefix):
+					return directory / url[len(prefix):]
+
+		return None
+
+	def resolve(self, url: str, pubid: Nullable[str], context: Any) -> Any:
+		"""
+		Called by lxml to resolve a URL. Local files are served from memory, remote URLs are mapped onto local files.
+
+		:param url:     URL to resolve.
+		:param pubid:   Public ID (unused).
+		:param context: lxml resolver context.
+		:returns:       The resolved document or ``None``.
+		"""
+		if url.startswith("file:"):
+			# Unreadable local files are left to lxml, which reports them.
+			path = Path(url2pathname(urlparse(url).path))
+			try:
+				content = self.Read(path)
+			except OSError:
+				return None
+		elif url.startswith(("http://", "https://", "ftp://")):
+			path = self.Map(url)
+			try:
+				content = None if path is None else self.Read(path)
+			except OSError:
+				content = None
+
+			if content is None:
+				with self._lock:
+					self._unmapped.append(url)
+				return None
+		else:
+			return None
+
+		return self.resolve_string(content, context, base_url=path.as_uri())
+
+	def Read(self, path: Path) -> bytes:
+		"""
+		Returns the content of a local schema file, which is read on first request and then served from memory.
+
+		:param path:     Path to the local file.
+		:returns:        Content of the file.
+		:raises OSError: If the file can't be read.
+		"""
+		with self._lock:
+			try:
+				content = self._contents[path]
+				self._hits += 1
+				return content
+			except KeyError:
+				pass
+
+			content = path.read_bytes()
+			self._contents[path] = content
+			self._misses += 1
+			return content
+
+	def Clear(self) -> None:
+		"""
+		Removes all cached contents, recorded unmapped URLs and statistics.
+		"""
+		with self._lock:
+			self._contents.clear()
+			self._unmapped.clear()
+			self._hits =   0
+			self._misses = 0
+
+	def _GetPrefixes(self) -> Dict[str, Path]:
+		# Mappings are computed on first use, because it resolves the local paths of all schemas.
+		if self._prefixes is None:
+			self._prefixes = {}
+			for ipxactSchema in __VERSION_TABLE__.values():
+				directory = ipxactSchema.LocalPath.parent
+				self._prefixes[self._StripScheme(ipxactSchema.SchemaUri.rstrip("/") + "/")] = directory
+				if ipxactSchema.SchemaUrl != "":
+					self._prefixes[self._StripScheme(ipxactSchema.SchemaUrl.rsplit("/", 1)[0] + "/")] = directory
+
+			xmlSchema = __DEFAULT_SCHEMA__.LocalPath.parent / "xml.xsd"
+			for url in __W3C_XML_SCHEMA_URLS__:
+				self._files.setdefault(self._StripScheme(url), xmlSchema)
+
+		return self._prefixes
+
+	@staticmethod
+	def _StripScheme(url: str) -> str:
+		return url.split("://", 1)[-1]
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} {len(self._contents)} files, {len(self._unmapped)} unmapped URLs>"
+
+
+__SCHEMA_RESOLVER__ = SchemaResolver()  #: Process-wide resolver mapping remote schema URLs onto bundled XSD files.
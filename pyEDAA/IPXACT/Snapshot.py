@@ -0,0 +1,337 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___ ______  __    _    ____ _____                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    |_ _|  _ \ \/ /   / \  / ___|_   _|                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \    | || |_) \  /   / _ \| |     | |                                          #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ _ | ||  __//  \  / ___ \ |___  | |                                          #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___|_|  /_/\_\/_/   \_\____| |_|                                          #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2025 Patrick Lehmann - Bötzingen, Germany                                                             #
+# Copyright 2016-2016 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+A binary snapshot format to reload a fully built IP-XACT object model without re-parsing and re-validating XML files.
+
+A snapshot file consists of a fixed-size header, a manifest and a payload:
+
+* The header contains a magic number, the snapshot format version and the sizes of manifest and payload.
+* The manifest records the package version and, for every source file, its path, modification time, size and SHA-256
+  hash.
+* The payload is the pickled object model. lxml trees and schemas are not stored.
+
+When reading a snapshot, the file is memory-mapped and the payload is unpickled directly from the mapping. A snapshot is
+only used, if it was written by the same format and package version and if all source files are unchanged.
+"""
+from hashlib              import sha256
+from io                   import BytesIO
+from mmap                 import mmap, ACCESS_READ
+from os                   import replace
+from pathlib              import Path
+from pickle               import Pickler, Unpickler, HIGHEST_PROTOCOL, PickleError, UnpicklingError
+from struct               import Struct, error as StructError
+from sys                  import version_info
+from typing               import Any, Dict, Iterable, List, Optional as Nullable, Tuple
+
+from lxml.etree           import _Element, XMLSchema
+from pyTooling.Decorators import export, readonly
+from pyTooling.MetaClasses import ExtendedType
+from pyTooling.Common     import getFullyQualifiedName
+
+from pyEDAA.IPXACT        import __version__, IPXACTException, RootElement
+
+
+__MAGIC__ =          b"IPXACTSN"
+__FORMAT_VERSION__ = 1
+__HEADER__ =         Struct("<8sHHIQ")  #: magic, format version, reserved, manifest size, payload size
+
+
+@export
+class SourceStamp(metaclass=ExtendedType, slots=True):
+	"""Identifies the state of a source file at the time a snapshot was written."""
+
+	_path:         Path  #: Path to the source file.
+	_modifiedTime: int   #: Modification time in nanoseconds.
+	_size:         int   #: File size in bytes.
+	_hash:         str   #: SHA-256 hash of the file's content as hex string.
+
+	def __init__(self, path: Path, modifiedTime: int, size: int, hash: str) -> None:
+		self._path =         path
+		self._modifiedTime = modifiedTime
+		self._size =         size
+		self._hash =         hash
+
+	@classmethod
+	def FromFile(cls, path: Path) -> "SourceStamp":
+		"""
+		Reads the current state of a source file.
+
+		:param path:            Path to the source file.
+		:returns:               Source stamp of the file.
+		:raises IPXACTException: If the file can't be read.
+		"""
+		try:
+			status = path.stat()
+			content = path.read_bytes()
+		except OSError as ex:
+			raise IPXACTException(f"Couldn't read source file '{path}'.") from ex
+
+		return cls(path, status.st_mtime_ns, status.st_size, sha256(content).hexdigest())
+
+	@readonly
+	def Path(self) -> Path:
+		return self._path
+
+	@readonly
+	def ModifiedTime(self) -> int:
+		return self._modifiedTime
+
+	@readonly
+	def Size(self) -> int:
+		return self._size
+
+	@readonly
+	def Hash(self) -> str:
+		return self._hash
+
+	def IsUpToDate(self) -> bool:
+		"""
+		Checks if the source file is unchanged.
+
+		If modification time and size are unchanged, the file is considered unchanged. Otherwise, the file's content is
+		hashed and compared, so touched but unmodified files don't invalidate a snapshot.
+
+		:returns: ``True``, if the source file is unchanged.
+		"""
+		try:
+			status = self._path.stat()
+			if status.st_size != self._size:
+				return False
+			elif status.st_mtime_ns == self._modifiedTime:
+				return True
+
+			return sha256(self._path.read_bytes()).hexdigest() == self._hash
+		except OSError:
+			return False
+
+	def __str__(self) -> str:
+		return f"{self._path} ({self._size} bytes, {self._hash[:12]})"
+
+
+class _SnapshotPickler(Pickler):
+	def persistent_id(self, obj: Any) -> Nullable[str]:
+		# lxml trees and schemas can't be pickled. Root elements re-read them on demand.
+		if isinstance(obj, (_Element, XMLSchema)):
+			return "lxml"
+
+		return None
+
+
+class _SnapshotUnpickler(Unpickler):
+	def persistent_load(self, pid: Any) -> None:
+		if pid == "lxml":
+			return None
+
+		raise UnpicklingError(f"Unsupported persistent ID '{pid}'.")
+
+
+def _CollectDocuments(content: Any) -> Iterable[RootElement]:
+	from pyEDAA.IPXACT.Repository import Repository
+
+	if isinstance(content, RootElement):
+		return (content, )
+	elif isinstance(content, Repository):
+		return content.Documents.values()
+	elif isinstance(content, (list, tuple)):
+		return [item for item in content if isinstance(item, RootElement)]
+	elif isinstance(content, dict):
+		return [item for item in content.values() if isinstance(item, RootElement)]
+	else:
+		return ()
+
+
+@export
+def WriteSnapshot(snapshotFile: Path, content: Any, sources: Nullable[Iterable[Path]] = None) -> List[SourceStamp]:
+	"""
+	Writes an object model into a snapshot file.
+
+	``content`` can be a root element, a :class:`~pyEDAA.IPXACT.Repository.Repository` or a list, tuple or dictionary of
+	root elements. Their source files are recorded automatically. Additional source files can be passed via ``sources``.
+	Deferred parts of the documents' object models are built before they're stored (see
+	:meth:`RootElement.Materialize <pyEDAA.IPXACT.RootElement.Materialize>`).
+
+	The snapshot is written into a temporary file, which then replaces ``snapshotFile`` atomically.
+
+	:param snapshotFile:     Path to the snapshot file.
+	:param content:          Object model to store.
+	:param sources:          Additional source files the snapshot depends on.
+	:returns:                List of recorded source stamps.
+	:raises TypeError:       If parameter 'snapshotFile' is not a Path.
+	:raises IPXACTException: If the object model can't be serialized or the snapshot can't be written.
+	"""
+	if not isinstance(snapshotFile, Path):
+		ex = TypeError(f"Parameter 'snapshotFile' is not a Path.")
+		if version_info >= (3, 11):  # pragma: no cover
+			ex.add_note(f"Got type '{getFullyQualifiedName(snapshotFile)}'.")
+		raise ex
+
+	documents = _CollectDocuments(content)
+	sourceFiles = {document.File.resolve(): None for document in documents if document.File is not None}
+	if sources is not None:
+		sourceFiles.update({path.resolve(): None for path in sources})
+
+	stamps = [SourceStamp.FromFile(path) for path in sourceFiles]
+	manifest = {
+		"version": __version__,
+		"sources": [(stamp.Path.as_posix(), stamp.ModifiedTime, stamp.Size, stamp.Hash) for stamp in stamps]
+	}
+
+	try:
+		# lxml trees aren't stored, thus deferred parts of the object model are built beforehand.
+		for document in documents:
+			document.Materialize()
+
+		manifestBuffer = BytesIO()
+		_SnapshotPickler(manifestBuffer, protocol=HIGHEST_PROTOCOL).dump(manifest)
+		payloadBuffer = BytesIO()
+		_SnapshotPickler(payloadBuffer, protocol=HIGHEST_PROTOCOL).dump(content)
+	except (PickleError, TypeError, AttributeError) as ex:
+		raise IPXACTException(f"Couldn't serialize object model of type '{getFullyQualifiedName(content)}'.") from ex
+
+	manifestBytes = manifestBuffer.getbuffer()
+	payloadBytes = payloadBuffer.getbuffer()
+
+	temporaryFile = snapshotFile.with_name(f"{snapshotFile.name}.tmp")
+	try:
+		snapshotFile.parent.mkdir(parents=True, exist_ok=True)
+		with temporaryFile.open("wb") as fileHandle:
+			fileHandle.write(__HEADER__.pack(__MAGIC__, __FORMAT_VERSION__, 0, len(manifestBytes), len(payloadBytes)))
+			fileHandle.write(manifestBytes)
+			fileHandle.write(payloadBytes)
+		replace(temporaryFile, snapshotFile)
+	except OSError as ex:
+		raise IPXACTException(f"Couldn't write snapshot file '{snapshotFile}'.") from ex
+
+	return stamps
+
+
+@export
+def ReadSnapshot(snapshotFile: Path, checkSources: bool = True) -> Nullable[Any]:
+	"""
+	Reads an object model from a snapshot file.
+
+	The snapshot file is memory-mapped and the object model is unpickled from the mapping. ``None`` is returned, if the
+	snapshot doesn't exist, was written by another format or package version, or if a source file changed. In this
+	case, the object model needs to be rebuilt from the source files.
+
+	:param snapshotFile:     Path to the snapshot file.
+	:param checkSources:     If true, check if all recorded source files are unchanged.
+	:returns:                The stored object model or ``None``, if the snapshot is missing or outdated.
+	:raises TypeError:       If parameter 'snapshotFile' is not a Path.
+	:raises IPXACTException: If the snapshot file is corrupted.
+	"""
+	if not isinstance(snapshotFile, Path):
+		ex = TypeError(f"Parameter 'snapshotFile' is not a Path.")
+		if version_info >= (3, 11):  # pragma: no cover
+			ex.add_note(f"Got type '{getFullyQualifiedName(snapshotFile)}'.")
+		raise ex
+
+	try:
+		fileHandle = snapshotFile.open("rb")
+	except FileNotFoundError:
+		return None
+	except OSError as ex:
+		raise IPXACTException(f"Couldn't open snapshot file '{snapshotFile}'.") from ex
+
+	with fileHandle:
+		try:
+			mapping = mmap(fileHandle.fileno(), 0, access=ACCESS_READ)
+		except (OSError, ValueError) as ex:
+			raise IPXACTException(f"Couldn't map snapshot file '{snapshotFile}'.") from ex
+
+		with mapping:
+			manifest, payloadRange = _ReadManifest(snapshotFile, mapping)
+			if manifest is None:
+				return None
+
+			if checkSources:
+				for path, modifiedTime, size, hash in manifest["sources"]:
+					if not SourceStamp(Path(path), modifiedTime, size, hash).IsUpToDate():
+						return None
+
+			# The unpickler reads the payload frame by frame from the mapping, so the payload isn't copied as a whole.
+			mapping.seek(payloadRange[0])
+			try:
+				return _SnapshotUnpickler(mapping).load()
+			except Exception as ex:
+				raise IPXACTException(f"Corrupted payload in snapshot file '{snapshotFile}'.") from ex
+
+
+@export
+def ReadSnapshotSources(snapshotFile: Path) -> Nullable[List[SourceStamp]]:
+	"""
+	Reads the source stamps recorded in a snapshot file without loading the object model.
+
+	:param snapshotFile:     Path to the snapshot file.
+	:returns:                List of source stamps or ``None``, if the snapshot is missing or of another version.
+	:raises IPXACTException: If the snapshot file is corrupted.
+	"""
+	try:
+		content = snapshotFile.read_bytes()
+	except FileNotFoundError:
+		return None
+	except OSError as ex:
+		raise IPXACTException(f"Couldn't open snapshot file '{snapshotFile}'.") from ex
+
+	manifest, _ = _ReadManifest(snapshotFile, content)
+	if manifest is None:
+		return None
+
+	return [SourceStamp(Path(path), modifiedTime, size, hash) for path, modifiedTime, size, hash in manifest["sources"]]
+
+
+def _ReadManifest(snapshotFile: Path, buffer: Any) -> Tuple[Nullable[Dict[str, Any]], Tuple[int, int]]:
+	try:
+		magic, formatVersion, _, manifestSize, payloadSize = __HEADER__.unpack_from(buffer, 0)
+	except StructError as ex:
+		raise IPXACTException(f"Snapshot file '{snapshotFile}' is truncated.") from ex
+
+	if magic != __MAGIC__:
+		raise IPXACTException(f"File '{snapshotFile}' is not a snapshot file.")
+	elif formatVersion != __FORMAT_VERSION__:
+		return None, (0, 0)
+
+	manifestStart = __HEADER__.size
+	payloadStart = manifestStart + manifestSize
+	payloadEnd = payloadStart + payloadSize
+	if payloadEnd != len(buffer):
+		raise IPXACTException(f"Snapshot file '{snapshotFile}' is truncated.")
+
+	try:
+		manifest = _SnapshotUnpickler(BytesIO(buffer[manifestStart:payloadStart])).load()
+	except Exception as ex:
+		raise IPXACTException(f"Corrupted manifest in snapshot file '{snapshotFile}'.") from ex
+
+	if manifest.get("version") != __version__:
+		return None, (0, 0)
+
+	return manifest, (payloadStart, payloadEnd)
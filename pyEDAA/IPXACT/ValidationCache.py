@@ -0,0 +1,299 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___ ______  __    _    ____ _____                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    |_ _|  _ \ \/ /   / \  / ___|_   _|                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \    | || |_) \  /   / _ \| |     | |                                          #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ _ | ||  __//  \  / ___ \ |___  | |                                          #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___|_|  /_/\_\/_/   \_\____| |_|                                          #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2025 Patrick Lehmann - Bötzingen, Germany                                                             #
+# Copyright 2016-2016 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+A persistent cache of successful XML schema validations.
+
+Documents are identified by the hash of their content. A cache entry records, that a document with this content was
+successfully validated against a schema URI by a specific version of this package. Loading identical bytes again can
+therefore skip XML schema validation.
+"""
+from contextlib           import contextmanager
+from hashlib              import sha256
+from pathlib              import Path
+from sqlite3              import connect, Connection, Error as SQLiteError
+from sys                  import version_info
+from threading            import RLock
+from time                 import time
+from typing               import Dict, Iterator, Tuple
+
+from pyTooling.Decorators import export, readonly
+from pyTooling.MetaClasses import ExtendedType
+from pyTooling.Common     import getFullyQualifiedName
+
+from pyEDAA.IPXACT        import __version__, IPXACTException
+
+
+@export
+class ValidationCache(metaclass=ExtendedType, slots=True):
+	"""
+	A size-bounded, SQLite based cache of successfully validated IP-XACT documents.
+
+	Entries are keyed by the SHA-256 hash of the document's content, the schema URI and the package version. Entries
+	created by other package versions are ignored and removed when the cache is opened. If the number of entries exceeds
+	``maxEntries``, the least recently used entries are evicted.
+
+	Lookups are read-only queries, so parallel loaders sharing the cache file don't wait for SQLite's write lock on hits.
+	The access times of hits are collected in memory and written in batches of ``accessBatchSize`` entries, before
+	entries are evicted and when the cache is closed (see :meth:`Flush`).
+
+	.. code-block:: python
+
+	   from pyEDAA.IPXACT                 import RootElement
+	   from pyEDAA.IPXACT.ValidationCache import ValidationCache
+
+	   RootElement.SetValidationCache(ValidationCache(Path(".cache/ipxact.sqlite")))
+	"""
+
+	_cacheFile:  Path        #: Path to the SQLite database file.
+	_maxEntries: int         #: Maximum number of cache entries.
+	_version:    str         #: Package version used as part of the key.
+	_lock:       RLock       #: Lock serializing database access.
+	_connection: Connection  #: SQLite database connection.
+	_hits:       int         #: Number of cache hits.
+	_misses:     int         #: Number of cache misses.
+	_accesses:   Dict[Tuple[str, str], float]  #: Access times of hits by hash and schema URI, which are not yet written.
+	_batchSize:  int         #: Number of collected access times, which triggers writing them.
+
+	def __init__(self, cacheFile: Path, maxEntries: int = 100_000, accessBatchSize: int = 256) -> None:
+		"""
+		Opens or creates a validation cache.
+
+		:param cacheFile:        Path to the SQLite database file. Parent directories are created if needed.
+		:param maxEntries:       Maximum number of cache entries.
+		:param accessBatchSize:  Number of hits, whose access times are collected before they're written.
+		:raises TypeError:       If parameter cacheFile is not a Path.
+		:raises ValueError:      If parameter maxEntries or accessBatchSize is less than 1.
+		:raises IPXACTException: If the database can't be opened.
+		"""
+		if not isinstance(cacheFile, Path):
+			ex = TypeError(f"Parameter 'cacheFile' is not a Path.")
+			if version_info >= (3, 11):  # pragma: no cover
+				ex.add_note(f"Got type '{getFullyQualifiedName(cacheFile)}'.")
+			raise ex
+
+		if maxEntries < 1:
+			raise ValueError(f"Parameter 'maxEntries' must be at least 1.")
+		if accessBatchSize < 1:
+			raise ValueError(f"Parameter 'accessBatchSize' must be at least 1.")
+
+		self._cacheFile =  cacheFile
+		self._maxEntries = maxEntries
+		self._version =    __version__
+		self._lock =       RLock()
+		self._hits =       0
+		self._misses =     0
+		self._accesses =   {}
+		self._batchSize =  accessBatchSize
+
+		try:
+			cacheFile.parent.mkdir(parents=True, exist_ok=True)
+			self._connection = connect(cacheFile, check_same_thread=False, isolation_level=None)
+			with self._Transaction():
+				self._connection.execute(
+					"CREATE TABLE IF NOT EXISTS validated ("
+					"hash TEXT NOT NULL, schemaUri TEXT NOT NULL, version TEXT NOT NULL, lastAccess REAL NOT NULL, "
+					"PRIMARY KEY (hash, schemaUri, version))"
+				)
+				self._connection.execute("CREATE INDEX IF NOT EXISTS validated_lastAccess ON validated (lastAccess)")
+				# The number of entries is maintained by triggers, so it's shared by all processes without counting the entries.
+				self._connection.execute("CREATE TABLE IF NOT EXISTS entryCount (count INTEGER NOT NULL)")
+				self._connection.execute("INSERT INTO entryCount SELECT COUNT(*) FROM validated WHERE NOT EXISTS (SELECT 1 FROM entryCount)")
+				self._connection.execute(
+					"CREATE TRIGGER IF NOT EXISTS validated_insert AFTER INSERT ON validated BEGIN UPDATE entryCount SET count = count + 1; END"
+				)
+				self._connection.execute(
+					"CREATE TRIGGER IF NOT EXISTS validated_delete AFTER DELETE ON validated BEGIN UPDATE entryCount SET count = count - 1; END"
+				)
+				self._connection.execute("DELETE FROM validated WHERE version != ?", (self._version, ))
+				self._Evict()
+		except (OSError, SQLiteError) as ex:
+			raise IPXACTException(f"Couldn't open validation cache '{cacheFile}'.") from ex
+
+	@readonly
+	def CacheFile(self) -> Path:
+		return self._cacheFile
+
+	@readonly
+	def MaxEntries(self) -> int:
+		return self._maxEntries
+
+	@readonly
+	def Hits(self) -> int:
+		return self._hits
+
+	@readonly
+	def Misses(self) -> int:
+		return self._misses
+
+	def __len__(self) -> int:
+		"""Returns the number of entries, including entries added by other processes sharing the cache file."""
+		with self._lock:
+			return self._connection.execute("SELECT count FROM entryCount").fetchone()[0]
+
+	@staticmethod
+	def ComputeHash(content: bytes) -> str:
+		"""
+		Computes the cache key for a document's content.
+
+		:param content: Raw bytes of the document.
+		:returns:       Hexadecimal SHA-256 digest.
+		"""
+		return sha256(content).hexdigest()
+
+	def Contains(self, contentHash: str, schemaUri: str) -> bool:
+		"""
+		Checks if a document was already validated successfully against a schema.
+
+		A hit records the entry's last access time, which is written with the next batch (see :meth:`Flush`).
+
+		:param contentHash: Hash of the document's content as returned by :meth:`ComputeHash`.
+		:param schemaUri:   IP-XACT schema URI.
+		:returns:           ``True``, if the document is known to be valid.
+		"""
+		with self._lock:
+			row = self._connection.execute(
+				"SELECT 1 FROM validated WHERE hash = ? AND schemaUri = ? AND version = ?",
+				(contentHash, schemaUri, self._version)
+			).fetchone()
+			if row is None:
+				self._misses += 1
+				return False
+
+			self._hits += 1
+			self._accesses[(contentHash, schemaUri)] = time()
+			if len(self._accesses) >= self._batchSize:
+				self.Flush()
+
+			return True
+
+	def Add(self, contentHash: str, schemaUri: str) -> None:
+		"""
+		Records a successful validation.
+
+		:param contentHash: Hash of the document's content as returned by :meth:`ComputeHash`.
+		:param schemaUri:   IP-XACT schema URI.
+		"""
+		with self._lock, self._Transaction():
+			self._WriteAccesses()
+			key = (contentHash, schemaUri, self._version)
+			cursor = self._connection.execute(
+				"UPDATE validated SET lastAccess = ? WHERE hash = ? AND schemaUri = ? AND version = ?", (time(), *key)
+			)
+			if cursor.rowcount == 0:
+				self._connection.execute(
+					"INSERT INTO validated (hash, schemaUri, version, lastAccess) VALUES (?, ?, ?, ?)", (*key, time())
+				)
+				self._Evict()
+
+	def Invalidate(self, contentHash: str) -> None:
+		"""
+		Removes all entries for a document's content.
+
+		:param contentHash: Hash of the document's content as returned by :meth:`ComputeHash`.
+		"""
+		with self._lock:
+			self._accesses = {key: accessTime for key, accessTime in self._accesses.items() if key[0] != contentHash}
+			self._connection.execute("DELETE FROM validated WHERE hash = ?", (contentHash, ))
+
+	def Clear(self) -> None:
+		"""
+		Removes all entries and resets the statistics.
+		"""
+		with self._lock:
+			self._accesses.clear()
+			self._connection.execute("DELETE FROM validated")
+			self._hits =   0
+			self._misses = 0
+
+	def Flush(self) -> None:
+		"""
+		Writes the collected access times of hits.
+		"""
+		with self._lock:
+			if len(self._accesses) > 0:
+				with self._Transaction():
+					self._WriteAccesses()
+
+	def Close(self) -> None:
+		"""
+		Writes the collected access times and closes the underlying database connection.
+		"""
+		with self._lock:
+			try:
+				self.Flush()
+			finally:
+				self._connection.close()
+
+	@contextmanager
+	def _Transaction(self) -> Iterator[None]:
+		"""
+		Runs statements in a write transaction.
+
+		The database is locked for writing at the start of the transaction, so the number of entries read while evicting
+		can't be changed by other processes sharing the cache file.
+		"""
+		self._connection.execute("BEGIN IMMEDIATE")
+		try:
+			yield
+		except BaseException:
+			self._connection.execute("ROLLBACK")
+			raise
+
+		self._connection.execute("COMMIT")
+
+	def _WriteAccesses(self) -> None:
+		# Entries evicted or invalidated by other processes in the meantime aren't updated.
+		self._connection.executemany(
+			"UPDATE validated SET lastAccess = MAX(lastAccess, ?) WHERE hash = ? AND schemaUri = ? AND version = ?",
+			[(accessTime, contentHash, schemaUri, self._version) for (contentHash, schemaUri), accessTime in self._accesses.items()]
+		)
+		self._accesses.clear()
+
+	def _Evict(self) -> None:
+		# The number of entries is read within the transaction, as other processes may have added or removed entries.
+		count = self._connection.execute("SELECT count FROM entryCount").fetchone()[0]
+		if count <= self._maxEntries:
+			return
+
+		self._connection.execute(
+			"DELETE FROM validated WHERE rowid IN (SELECT rowid FROM validated ORDER BY lastAccess LIMIT ?)",
+			(count - self._maxEntries, )
+		)
+
+	def __enter__(self) -> "ValidationCache":
+		return self
+
+	def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+		self.Close()
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} {self._cacheFile} {len(self)}/{self._maxEntries} entries>"
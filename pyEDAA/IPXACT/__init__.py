@@ -30,19 +30,35 @@
 # ==================================================================================================================== #
 #
 """A DOM based IP-XACT implementation for Python."""
-from pathlib  import Path
-from sys      import version_info
-from textwrap import dedent
-from typing   import Union, Dict, Tuple, Optional as Nullable, ClassVar
+from collections import OrderedDict
+from contextlib  import contextmanager, nullcontext
+from enum        import Enum
+from functools   import partial
+from importlib   import import_module
+from io          import BytesIO, IOBase, TextIOBase, TextIOWrapper
+from mmap        import mmap, ACCESS_READ
+from os          import fstat
+from pathlib     import Path
+from sys         import version_info
+from threading   import RLock, local
+from time        import perf_counter
+from typing      import Union, Dict, Tuple, Iterable, Iterator, Optional as Nullable, ClassVar, IO, Any, Callable, ContextManager, Type
+from typing      import TYPE_CHECKING
 
-from lxml.etree            import XMLParser, XML, XMLSchema, ElementTree, QName, _Element, _Comment
 from pyTooling.Decorators  import export, readonly
 from pyTooling.MetaClasses import ExtendedType, abstractmethod
-from pyTooling.Common      import getFullyQualifiedName
-from pyTooling.Versioning  import SemanticVersion, CalendarVersion
+from pyTooling.Common      import getFullyQualifiedName, getResourceFile
 
-from .       import Schema
-from .Schema import *
+# lxml and pyTooling.Versioning are imported where they're used, so importing this package stays cheap.
+if TYPE_CHECKING:  # pragma: no cover
+	from concurrent.futures import Executor
+
+	from lxml.etree            import XMLParser, XMLSchema, _Element
+	from pyTooling.Versioning  import SemanticVersion, CalendarVersion
+
+	from pyEDAA.IPXACT.Instrumentation import DocumentStatistics, LoadStatistics
+	from pyEDAA.IPXACT.Resolver        import SchemaResolver
+	from pyEDAA.IPXACT.ValidationCache import ValidationCache
 
 __author__ =    "Patrick Lehmann"
 __email__ =     "Paebbels@gmail.com"
@@ -60,44 +76,41 @@ class IPXACTException(Exception):
 class IPXACTSchema(metaclass=ExtendedType, slots=True):
 	"""Schema descriptor made of version, namespace prefix, URI, URL and local path."""
 
-	_version:         Union[SemanticVersion, CalendarVersion]  #: Schema version
+	_version:         Union["SemanticVersion", "CalendarVersion", str]  #: Schema version or version string to parse on first access
 	_namespacePrefix: str                                      #: XML namespace prefix
 	_schemaUri:       str                                      #: Schema URI
 	_schemaUrl:       str                                      #: Schema URL
-	_localPath:       Path                                     #: Local path
+	_localPath:       Union[Path, str]                         #: Local path or resource name in package :mod:`pyEDAA.IPXACT.Schema`
 
 	def __init__(
 		self,
-		version: Union[str, SemanticVersion, CalendarVersion],
+		version: Union[str, "SemanticVersion", "CalendarVersion"],
 		xmlNamespacePrefix: str,
 		schemaUri: str,
 		schemaUrl: str,
-		localPath: Path
+		localPath: Union[Path, str]
 	) -> None:
 		"""
 		Initializes an IP-XACT Schema description.
 
-		:param version:            Version of the IP-XACT Schema.
+		:param version:            Version of the IP-XACT Schema. Version strings are parsed on first access.
 		:param xmlNamespacePrefix: XML namespace prefix (``<prefix:element>``)
 		:param schemaUri:          IP-XACT schema URI
 		:param schemaUrl:          URL the IP-XACT schema definition file (XSD).
-		:param localPath:          Path to the local XSD file.
+		:param localPath:          Path to the local XSD file or name of an XSD file in resource package
+		                           :mod:`pyEDAA.IPXACT.Schema`. Resource names are resolved on first access.
 		"""
 		# TODO: add raises ... lines
 		if version is None:
 			raise ValueError(f"Parameter 'version' is None.")
-		elif isinstance(version, str):
-			if version.startswith("20"):
-				self._version = CalendarVersion.Parse(version)
-			else:
-				self._version = SemanticVersion.Parse(version)
-		elif isinstance(version, (SemanticVersion, CalendarVersion)):
-			self._version = version
-		else:
-			ex = TypeError(f"Parameter 'version' is neither a 'SemanticVersion', a 'CalendarVersion' nor a string.")
-			if version_info >= (3, 11):  # pragma: no cover
-				ex.add_note(f"Got type '{getFullyQualifiedName(version)}'.")
-			raise ex
+		elif not isinstance(version, str):
+			from pyTooling.Versioning import SemanticVersion, CalendarVersion
+
+			if not isinstance(version, (SemanticVersion, CalendarVersion)):
+				ex = TypeError(f"Parameter 'version' is neither a 'SemanticVersion', a 'CalendarVersion' nor a string.")
+				if version_info >= (3, 11):  # pragma: no cover
+					ex.add_note(f"Got type '{getFullyQualifiedName(version)}'.")
+				raise ex
 
 		if xmlNamespacePrefix is None:
 			raise ValueError(f"Parameter 'namespacePrefix' is None.")
@@ -125,19 +138,29 @@ class IPXACTSchema(metaclass=ExtendedType, slots=True):
 
 		if localPath is None:
 			raise ValueError(f"Parameter 'localPath' is None.")
-		elif not isinstance(localPath, Path):
-			ex = TypeError(f"Parameter 'localPath' is not a Path.")
+		elif not isinstance(localPath, (Path, str)):
+			ex = TypeError(f"Parameter 'localPath' is neither a Path nor a string.")
 			if version_info >= (3, 11):  # pragma: no cover
 				ex.add_note(f"Got type '{getFullyQualifiedName(localPath)}'.")
 			raise ex
 
+		self._version =         version
 		self._namespacePrefix = xmlNamespacePrefix
 		self._schemaUri =       schemaUri
 		self._schemaUrl =       schemaUrl
 		self._localPath =       localPath
 
 	@readonly
-	def Version(self) -> Union[SemanticVersion, CalendarVersion]:
+	def Version(self) -> Union["SemanticVersion", "CalendarVersion"]:
+		if isinstance(self._version, str):
+			# Importing pyTooling.Versioning is deferred until a schema version is needed.
+			from pyTooling.Versioning import SemanticVersion, CalendarVersion
+
+			if self._version.startswith("20"):
+				self._version = CalendarVersion.Parse(self._version)
+			else:
+				self._version = SemanticVersion.Parse(self._version)
+
 		return self._version
 
 	@readonly
@@ -154,24 +177,28 @@ class IPXACTSchema(metaclass=ExtendedType, slots=True):
 
 	@readonly
 	def LocalPath(self) -> Path:
+		if isinstance(self._localPath, str):
+			# Importing the resource package is deferred until a schema file is needed.
+			self._localPath = getResourceFile(import_module(f"{__name__}.Schema"), self._localPath)
+
 		return self._localPath
 
 	def __repr__(self) -> str:
-		return f"<{self.__class__.__name__} IP-XACT {self._version} {self._schemaUri} - {self._localPath}>"
+		return f"<{self.__class__.__name__} IP-XACT {self.Version} {self._schemaUri} - {self._localPath}>"
 
 	def __str__(self) -> str:
-		return f"IP-XACT {self._version}"
+		return f"IP-XACT {self.Version}"
 
 
 #                           version, xmlns,    URI                                                          URL,                                                              Local Path
-_IPXACT_10 =   IPXACTSchema("1.0", "spirit", "http://www.spiritconsortium.org/XMLSchema/SPIRIT/1.0", "", _IPXACT_10_INDEX)
-_IPXACT_11 =   IPXACTSchema("1.1", "spirit", "http://www.spiritconsortium.org/XMLSchema/SPIRIT/1.1", "", _IPXACT_11_INDEX)
-_IPXACT_12 =   IPXACTSchema("1.2", "spirit", "http://www.spiritconsortium.org/XMLSchema/SPIRIT/1.2", "", _IPXACT_12_INDEX)
-_IPXACT_14 =   IPXACTSchema("1.4", "spirit", "http://www.spiritconsortium.org/XMLSchema/SPIRIT/1.4", "", _IPXACT_14_INDEX)
-_IPXACT_15 =   IPXACTSchema("1.5", "spirit", "http://www.spiritconsortium.org/XMLSchema/SPIRIT/1.5", "", _IPXACT_15_INDEX)
-_IPXACT_2009 = IPXACTSchema("2009", "spirit", "http://www.spiritconsortium.org/XMLSchema/SPIRIT/1685-2009", "", _IPXACT_2009_INDEX)
-_IPXACT_2014 = IPXACTSchema("2014", "ipxact", "http://www.accellera.org/XMLSchema/IPXACT/1685-2014", "http://www.accellera.org/XMLSchema/IPXACT/1685-2014/index.xsd", _IPXACT_2014_INDEX)
-_IPXACT_2022 = IPXACTSchema("2022", "ipxact", "http://www.accellera.org/XMLSchema/IPXACT/1685-2022", "http://www.accellera.org/XMLSchema/IPXACT/1685-2022/index.xsd", _IPXACT_2022_INDEX)
+_IPXACT_10 =   IPXACTSchema("1.0", "spirit", "http://www.spiritconsortium.org/XMLSchema/SPIRIT/1.0", "", "ipxact-1.0/index.xsd")
+_IPXACT_11 =   IPXACTSchema("1.1", "spirit", "http://www.spiritconsortium.org/XMLSchema/SPIRIT/1.1", "", "ipxact-1.1/index.xsd")
+_IPXACT_12 =   IPXACTSchema("1.2", "spirit", "http://www.spiritconsortium.org/XMLSchema/SPIRIT/1.2", "", "ipxact-1.2/index.xsd")
+_IPXACT_14 =   IPXACTSchema("1.4", "spirit", "http://www.spiritconsortium.org/XMLSchema/SPIRIT/1.4", "", "ipxact-1.4/index.xsd")
+_IPXACT_15 =   IPXACTSchema("1.5", "spirit", "http://www.spiritconsortium.org/XMLSchema/SPIRIT/1.5", "", "ipxact-1.5/index.xsd")
+_IPXACT_2009 = IPXACTSchema("2009", "spirit", "http://www.spiritconsortium.org/XMLSchema/SPIRIT/1685-2009", "", "ieee-1685-2009/index.xsd")
+_IPXACT_2014 = IPXACTSchema("2014", "ipxact", "http://www.accellera.org/XMLSchema/IPXACT/1685-2014", "http://www.accellera.org/XMLSchema/IPXACT/1685-2014/index.xsd", "ieee-1685-2014/index.xsd")
+_IPXACT_2022 = IPXACTSchema("2022", "ipxact", "http://www.accellera.org/XMLSchema/IPXACT/1685-2022", "http://www.accellera.org/XMLSchema/IPXACT/1685-2022/index.xsd", "ieee-1685-2022/index.xsd")
 
 __VERSION_TABLE__: Dict[str, IPXACTSchema] = {
 	'1.0':   _IPXACT_10,
@@ -188,17 +215,710 @@ __URI_MAP__: Dict[str, IPXACTSchema] = {value.SchemaUri: value for key, value in
 __DEFAULT_VERSION__ = "2022"                                  #: IP-XACT default version
 __DEFAULT_SCHEMA__ =  __VERSION_TABLE__[__DEFAULT_VERSION__]  #: IP-XACT default Schema
 
+XMLSource = Union[Path, bytes, bytearray, memoryview, mmap, IO[bytes]]  #: Sources an IP-XACT document can be read from.
+
+__SUBMODULES__ = (
+	"AddressMap", "Archive", "Catalog", "Component", "Design", "DesignConfiguration", "GeneratorChain", "Instrumentation",
+	"Loader", "MemoryMap", "Repository", "Resolver", "Schema", "Snapshot", "ValidationCache"
+)  #: Submodules imported on first attribute access.
+__RESOLVER_NAMES__ = ("SchemaResolver", "__SCHEMA_RESOLVER__")  #: Names provided by :mod:`pyEDAA.IPXACT.Resolver`.
+
+
+def __getattr__(name: str) -> Any:
+	"""
+	Imports submodules (e.g. :mod:`pyEDAA.IPXACT.Component`), the schema resource names of :mod:`pyEDAA.IPXACT.Schema`
+	and the schema resolver of :mod:`pyEDAA.IPXACT.Resolver` on first access, so importing this package stays cheap.
+
+	:param name:           Name of the requested module attribute.
+	:returns:              The submodule, the schema resource or the schema resolver.
+	:raises AttributeError: If the module has no such attribute.
+	"""
+	if name in __SUBMODULES__:
+		return import_module(f"{__name__}.{name}")
+	elif name.startswith("_IPXACT_") and name.endswith("_INDEX"):
+		return getattr(import_module(f"{__name__}.Schema"), name)
+	elif name in __RESOLVER_NAMES__:
+		return getattr(import_module(f"{__name__}.Resolver"), name)
+
+	raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__() -> Iterable[str]:
+	return sorted(set(globals()) | set(__SUBMODULES__) | set(__RESOLVER_NAMES__))
+
+
+@export
+def EscapeXml(text: str) -> str:
+	"""
+	Escapes ``&``, ``<`` and ``>`` in XML text content.
+
+	:param text: Text to escape.
+	:returns:    Escaped text.
+	"""
+	return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+@export
+def QuoteXmlAttribute(value: str) -> str:
+	"""
+	Escapes and quotes an XML attribute value.
+
+	Double quotes are used, unless the value contains double quotes, but no single quotes.
+
+	:param value: Attribute value to quote.
+	:returns:     Quoted attribute value incl. the enclosing quotes.
+	"""
+	value = EscapeXml(value).replace("\n", "&#10;").replace("\r", "&#13;").replace("\t", "&#9;")
+	if '"' not in value:
+		return f'"{value}"'
+	elif "'" not in value:
+		return f"'{value}'"
+	else:
+		return '"' + value.replace('"', "&quot;") + '"'
+
+
+@export
+class TagTable(metaclass=ExtendedType, slots=True):
+	"""
+	Maps qualified XML tag names to handlers.
+
+	Handlers are registered by local name. The table precomputes the qualified names (``{namespace}localname``) for all
+	IP-XACT namespaces, so a handler is looked up directly by an lxml element's ``tag`` property without creating a
+	:class:`~lxml.etree.QName` per element. Elements in other namespaces (e.g. vendor extensions) can be registered for
+	an explicit namespace.
+
+	A handler of ``None`` marks a known element, which is accepted but not processed.
+	"""
+
+	_handlers: Dict[str, Any]  #: Handlers by qualified tag name.
+
+	def __init__(self, handlers: Nullable[Dict[str, Any]] = None) -> None:
+		"""
+		Initializes a tag table.
+
+		:param handlers: Optional dictionary of handlers by local name in any IP-XACT namespace.
+		"""
+		self._handlers = {}
+
+		if handlers is not None:
+			for localname, handler in handlers.items():
+				self.Register(localname, handler)
+
+	def Register(self, localname: str, handler: Any, namespace: Nullable[str] = None) -> None:
+		"""
+		Registers a handler for an element.
+
+		:param localname: Local name of the element.
+		:param handler:   Handler or ``None`` for accepted, but ignored elements.
+		:param namespace: Namespace URI. If ``None``, the handler is registered for all IP-XACT namespaces.
+		"""
+		if namespace is None:
+			for namespaceURI in __URI_MAP__:
+				self._handlers[f"{{{namespaceURI}}}{localname}"] = handler
+		else:
+			self._handlers[f"{{{namespace}}}{localname}"] = handler
+
+	def Unregister(self, localname: str, namespace: Nullable[str] = None) -> None:
+		"""
+		Removes the handler of an element.
+
+		:param localname: Local name of the element.
+		:param namespace: Namespace URI. If ``None``, the handler is removed for all IP-XACT namespaces.
+		"""
+		if namespace is None:
+			for namespaceURI in __URI_MAP__:
+				self._handlers.pop(f"{{{namespaceURI}}}{localname}", None)
+		else:
+			self._handlers.pop(f"{{{namespace}}}{localname}", None)
+
+	def Derive(self, handlers: Nullable[Dict[str, Any]] = None) -> "TagTable":
+		"""
+		Creates an independent copy of this table, optionally extended by further handlers.
+
+		:param handlers: Optional dictionary of additional handlers by local name in any IP-XACT namespace.
+		:returns:        New tag table.
+		"""
+		table = TagTable()
+		table._handlers.update(self._handlers)
+
+		if handlers is not None:
+			for localname, handler in handlers.items():
+				table.Register(localname, handler)
+
+		return table
+
+	def ParseChildren(self, target: Any, parentElement: "_Element", context: str) -> None:
+		"""
+		Dispatches all child elements of an lxml element to their handlers. Comments are skipped.
+
+		:param target:           First argument passed to each handler, e.g. a root element or a dictionary of fields.
+		:param parentElement:    Element whose children are dispatched.
+		:param context:          Location used in error messages.
+		:raises IPXACTException: If no handler is registered for a child element.
+		"""
+		from lxml.etree import _Comment, QName
+
+		handlers = self._handlers
+		for element in parentElement:
+			if isinstance(element, _Comment):
+				continue
+
+			try:
+				handler = handlers[element.tag]
+			except KeyError:
+				raise IPXACTException(f"Unsupported tag '{QName(element).localname}' at {context}.") from None
+
+			if handler is not None:
+				handler(target, element)
+
+	@staticmethod
+	def Set(field: str, factory: Callable[["_Element"], Any]) -> Callable[[Dict[str, Any], "_Element"], None]:
+		"""
+		Creates a handler storing an object created from an element in a dictionary of fields.
+
+		:param field:   Key in the dictionary of fields.
+		:param factory: Callable creating an object from an element, e.g. a ``FromXml`` class method.
+		:returns:       Handler.
+		"""
+		def handler(fields: Dict[str, Any], element: "_Element") -> None:
+			fields[field] = factory(element)
+
+		return handler
+
+	@staticmethod
+	def Text(field: str) -> Callable[[Dict[str, Any], "_Element"], None]:
+		"""
+		Creates a handler storing an element's text in a dictionary of fields.
+
+		:param field: Key in the dictionary of fields.
+		:returns:     Handler.
+		"""
+		def handler(fields: Dict[str, Any], element: "_Element") -> None:
+			fields[field] = element.text
+
+		return handler
+
+	@staticmethod
+	def Append(field: str, factory: Callable[["_Element"], Any]) -> Callable[[Dict[str, Any], "_Element"], None]:
+		"""
+		Creates a handler appending an object created from an element to a list in a dictionary of fields.
+
+		:param field:   Key of the list in the dictionary of fields.
+		:param factory: Callable creating an object from an element, e.g. a ``FromXml`` class method.
+		:returns:       Handler.
+		"""
+		def handler(fields: Dict[str, Any], element: "_Element") -> None:
+			fields.setdefault(field, []).append(factory(element))
+
+		return handler
+
+	def Get(self, tag: str, default: Any = None) -> Any:
+		"""
+		Returns the handler for a qualified tag name or a default value.
+
+		:param tag:     Qualified tag name (``{namespace}localname``).
+		:param default: Value returned, if no handler is registered.
+		:returns:       Registered handler or default value.
+		"""
+		return self._handlers.get(tag, default)
+
+	@readonly
+	def Lookup(self) -> Callable[[str, Any], Any]:
+		"""
+		Read-only property to access a bound lookup function, which behaves like :meth:`Get`.
+
+		Parsers call it in their inner loops to avoid a method call per element. Later registrations are reflected.
+
+		:returns: Function returning the handler for a qualified tag name or a default value.
+		"""
+		return self._handlers.get
+
+	def __getitem__(self, tag: str) -> Any:
+		"""
+		Returns the handler for a qualified tag name.
+
+		:param tag:       Qualified tag name (``{namespace}localname``).
+		:returns:         Registered handler.
+		:raises KeyError: If no handler is registered.
+		"""
+		return self._handlers[tag]
+
+	def __contains__(self, tag: str) -> bool:
+		return tag in self._handlers
+
+	def __len__(self) -> int:
+		return len(self._handlers)
+
+	def __repr__(self) -> str:
+		return f"<TagTable {len(self._handlers)} entries>"
+
+
+__HEADER_TABLE__ = TagTable({"vendor": "vendor", "library": "library", "name": "name", "version": "version", "description": "description"})  #: Header elements of root elements.
+
+
+@export
+class ParserCache(metaclass=ExtendedType, slots=True):
+	"""
+	Provides one reusable XML parser per thread.
+
+	An lxml parser must not be used by multiple threads at the same time, but it can be reused by the thread which created
+	it. Reusing it avoids the setup of a parser context per document. lxml releases the GIL while parsing and validating,
+	thus threads using their own parser and compiled schemas (see :class:`SchemaCache`) run concurrently.
+	"""
+
+	_local:   local  #: Thread-local storage holding each thread's parser.
+	_lock:    RLock  #: Lock protecting the statistics.
+	_created: int    #: Number of parsers created.
+
+	def __init__(self) -> None:
+		"""
+		Initializes an empty parser cache.
+		"""
+		self._local =   local()
+		self._lock =    RLock()
+		self._created = 0
+
+	@readonly
+	def Created(self) -> int:
+		return self._created
+
+	def GetParser(self) -> "XMLParser":
+		"""
+		Returns the XML parser of the calling thread.
+
+		The parser is created on first request of a thread.
+
+		:returns: XML parser removing blank text.
+		"""
+		try:
+			return self._local.parser
+		except AttributeError:
+			pass
+
+		from lxml.etree import XMLParser
+
+		parser = XMLParser(remove_blank_text=True, encoding="utf-8")
+		self._local.parser = parser
+		with self._lock:
+			self._created += 1
+
+		return parser
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} {self._created} parsers>"
+
+
+__PARSER_CACHE__ = ParserCache()  #: Process-wide cache of per-thread XML parsers.
+
+
+@export
+class SchemaCache(metaclass=ExtendedType, slots=True):
+	"""
+	A thread-safe cache of compiled XML schemas keyed by IP-XACT schema URI.
+
+	Reading, parsing and compiling an IP-XACT XSD is much more expensive than validating a document against it. Each
+	schema is therefore compiled once on first use and then reused by all documents using the same namespace URI.
+
+	An lxml schema object records the errors of a validation in its own error log, thus concurrent validations with one
+	schema object could report each other's errors. Like :class:`ParserCache`, the cache therefore holds one compiled
+	schema per thread. The schema files, incl. the files included or imported by a schema, are read only once by the
+	:class:`~pyEDAA.IPXACT.Resolver.SchemaResolver` and are served from memory for further compilations. Each thread
+	still parses and compiles them.
+
+	Schemas are compiled without network access. Imports and includes of remote schemas are mapped onto bundled files by
+	a :class:`~pyEDAA.IPXACT.Resolver.SchemaResolver`.
+	"""
+
+	_lock:        RLock           #: Lock protecting the statistics.
+	_resolver:    Nullable["SchemaResolver"]  #: Resolver mapping remote schema URLs onto local files or ``None`` for the process-wide resolver.
+	_local:       local           #: Thread-local storage holding each thread's compiled schemas by schema URI.
+	_generation:  int             #: Incremented by :meth:`Clear`, so all threads discard their compiled schemas.
+	_hits:        int             #: Number of requests served from the cache.
+	_misses:      int             #: Number of requests which required a schema compilation.
+	_compileTime: float           #: Accumulated schema compilation time in seconds.
+
+	def __init__(self, resolver: Nullable["SchemaResolver"] = None) -> None:
+		"""
+		Initializes an empty schema cache.
+
+		:param resolver: Resolver for remote schema URLs. If ``None``, the process-wide resolver is used.
+		"""
+		self._lock =        RLock()
+		self._resolver =    resolver
+		self._local =       local()
+		self._generation =  0
+		self._hits =        0
+		self._misses =      0
+		self._compileTime = 0.0
+
+	@readonly
+	def Hits(self) -> int:
+		return self._hits
+
+	@readonly
+	def Misses(self) -> int:
+		return self._misses
+
+	@readonly
+	def CompileTime(self) -> float:
+		return self._compileTime
+
+	def __len__(self) -> int:
+		"""Returns the number of schemas compiled for the calling thread."""
+		return len(self._GetSchemas())
+
+	def __contains__(self, ipxactSchema: IPXACTSchema) -> bool:
+		"""Checks if a schema is compiled for the calling thread."""
+		return ipxactSchema.SchemaUri in self._GetSchemas()
+
+	def GetSchema(self, ipxactSchema: IPXACTSchema) -> "XMLSchema":
+		"""
+		Returns the compiled XML schema of the calling thread for an IP-XACT schema description.
+
+		The schema is compiled on a thread's first request.
+
+		:param ipxactSchema:    IP-XACT schema description.
+		:returns:               Compiled XML schema.
+		:raises IPXACTException: If the schema file can't be read or compiled.
+		"""
+		schemas = self._GetSchemas()
+		try:
+			xmlSchema = schemas[ipxactSchema.SchemaUri]
+		except KeyError:
+			return self._CompileAndAdd(schemas, ipxactSchema)
+
+		with self._lock:
+			self._hits += 1
+		return xmlSchema
+
+	def WarmUp(self, versions: Nullable[Iterable[str]] = None) -> None:
+		"""
+		Compiles schemas ahead of time for the calling thread.
+
+		Further threads compile their own schemas on first use, but the schema files are then served from memory.
+
+		:param versions:        Versions as listed in ``__VERSION_TABLE__``. If ``None``, all known schemas are compiled.
+		:raises IPXACTException: If a version is unknown.
+		"""
+		if versions is None:
+			versions = __VERSION_TABLE__.keys()
+
+		for version in versions:
+			try:
+				ipxactSchema = __VERSION_TABLE__[version]
+			except KeyError as ex:
+				raise IPXACTException(f"Unknown IP-XACT version '{version}'.") from ex
+
+			schemas = self._GetSchemas()
+			if ipxactSchema.SchemaUri not in schemas:
+				self._CompileAndAdd(schemas, ipxactSchema)
+
+	def Clear(self) -> None:
+		"""
+		Removes the compiled schemas of all threads and resets the statistics.
+		"""
+		with self._lock:
+			self._generation += 1
+			self._hits =        0
+			self._misses =      0
+			self._compileTime = 0.0
+
+	def _GetSchemas(self) -> Dict[str, "XMLSchema"]:
+		local = self._local
+		try:
+			if local.generation == self._generation:
+				return local.schemas
+		except AttributeError:
+			pass
+
+		local.schemas = {}
+		local.generation = self._generation
+		return local.schemas
+
+	def _CompileAndAdd(self, schemas: Dict[str, "XMLSchema"], ipxactSchema: IPXACTSchema) -> "XMLSchema":
+		startTime = perf_counter()
+		xmlSchema = self._Compile(ipxactSchema)
+		with self._lock:
+			self._compileTime += perf_counter() - startTime
+			self._misses += 1
+
+		schemas[ipxactSchema.SchemaUri] = xmlSchema
+		return xmlSchema
+
+	def _Compile(self, ipxactSchema: IPXACTSchema) -> "XMLSchema":
+		from lxml.etree             import XMLParser, XML, XMLSchema, ElementTree
+		from pyEDAA.IPXACT.Resolver import __SCHEMA_RESOLVER__
+
+		resolver = __SCHEMA_RESOLVER__ if self._resolver is None else self._resolver
+		try:
+			schema = resolver.Read(ipxactSchema.LocalPath)
+		except OSError as ex:
+			raise IPXACTException(f"Couldn't open IP-XACT schema '{ipxactSchema.LocalPath}' for {ipxactSchema.SchemaUri}.") from ex
+
+		# The resolver is attached to the parser, because lxml resolves the schema's imports and includes via the parser of
+		# the schema document.
+		xmlParser = XMLParser(remove_blank_text=True, encoding="utf-8", no_network=True)
+		xmlParser.resolvers.add(resolver)
+		unmappedCount = len(resolver.Unmapped)
+
+		schemaRoot = XML(schema, parser=xmlParser, base_url=ipxactSchema.LocalPath.as_uri())
+		schemaTree = ElementTree(schemaRoot)
+
+		try:
+			return XMLSchema(schemaTree)
+		except Exception as ex:
+			newException = IPXACTException(f"Couldn't compile IP-XACT schema '{ipxactSchema.LocalPath}' for {ipxactSchema.SchemaUri}.")
+			if version_info >= (3, 11):  # pragma: no cover
+				for url in resolver.Unmapped[unmappedCount:]:
+					newException.add_note(f"Couldn't map remote schema URL '{url}' onto a local file.")
+			raise newException from ex
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} {len(self)} schemas, {self._hits} hits, {self._misses} misses>"
+
+
+__SCHEMA_CACHE__ = SchemaCache()  #: Process-wide cache of compiled IP-XACT schemas.
+
+
+@export
+class Compression(Enum):
+	"""
+	Compression formats of IP-XACT files.
+
+	Compressed files are detected by their magic bytes and are decompressed while being parsed. Zstandard is only
+	supported, if Python's ``compression.zstd`` module (Python 3.14+) or the ``zstandard`` package is available.
+	"""
+
+	Uncompressed = 0  #: Plain XML file.
+	Gzip =         1  #: gzip compressed file (``*.gz``).
+	Bzip2 =        2  #: bzip2 compressed file (``*.bz2``).
+	Xz =           3  #: xz/LZMA compressed file (``*.xz``).
+	Zstd =         4  #: Zstandard compressed file (``*.zst``).
+
+	@classmethod
+	def Detect(cls, file: Path) -> "Compression":
+		"""
+		Detects the compression format of a file by its magic bytes.
+
+		:param file:             Path to the file.
+		:returns:                Detected compression format.
+		:raises IPXACTException: If the file can't be read.
+		"""
+		try:
+			with file.open("rb") as fileHandle:
+				return cls.FromMagic(fileHandle.read(6))
+		except OSError as ex:
+			raise IPXACTException(f"Couldn't open '{file}'.") from ex
+
+	@classmethod
+	def FromMagic(cls, magic: bytes) -> "Compression":
+		"""
+		Detects the compression format by the first bytes of a file's content.
+
+		:param magic: First (at least 6) bytes of the content.
+		:returns:     Detected compression format.
+		"""
+		for magicBytes, compression in __COMPRESSION_MAGIC__:
+			if magic.startswith(magicBytes):
+				return compression
+
+		return cls.Uncompressed
+
+	@classmethod
+	def FromSuffix(cls, file: Path) -> "Compression":
+		"""
+		Returns the compression format matching a file's suffix.
+
+		:param file: Path to the file.
+		:returns:    Compression format or :attr:`Uncompressed`, if the suffix is unknown.
+		"""
+		return __COMPRESSION_SUFFIXES__.get(file.suffix.lower(), cls.Uncompressed)
+
+	def Open(self, file: Union[Path, IO[bytes]], mode: str = "rb") -> IO[bytes]:
+		"""
+		Opens a file or wraps a binary file object for streaming (de)compression.
+
+		:param file:             Path or binary file object.
+		:param mode:             ``"rb"`` or ``"wb"``.
+		:returns:                Binary file object.
+		:raises IPXACTException: If Zstandard is requested, but not available.
+		"""
+		if self is Compression.Uncompressed:
+			return file.open(mode) if isinstance(file, Path) else file
+		# Compression modules are imported on first use.
+		elif self is Compression.Gzip:
+			from gzip import open as openGzip
+			return openGzip(file, mode)
+		elif self is Compression.Bzip2:
+			from bz2 import open as openBzip2
+			return openBzip2(file, mode)
+		elif self is Compression.Xz:
+			from lzma import open as openXz
+			return openXz(file, mode)
+
+		try:
+			from compression.zstd import open as openZstd  # Python >=3.14
+		except ImportError:  # pragma: no cover
+			try:
+				from zstandard import open as openZstd
+			except ImportError:
+				raise IPXACTException("Zstandard compressed files require Python 3.14 or package 'zstandard'.") from None
+
+		return openZstd(file, mode)
+
+
+__COMPRESSION_MAGIC__ = (
+	(b"\x1f\x8b",         Compression.Gzip),
+	(b"BZh",              Compression.Bzip2),
+	(b"\xfd7zXZ\x00",     Compression.Xz),
+	(b"\x28\xb5\x2f\xfd", Compression.Zstd)
+)  #: Magic bytes of compressed files.
+
+__COMPRESSION_SUFFIXES__ = {
+	".gz":  Compression.Gzip,
+	".bz2": Compression.Bzip2,
+	".xz":  Compression.Xz,
+	".zst": Compression.Zstd
+}  #: File suffixes of compressed files.
+
+
+@export
+class TreeRetention(Enum):
+	"""
+	Retention policy for the lxml tree of a parsed IP-XACT document.
+
+	After :meth:`RootElement.Parse` has built the Python object model, the lxml tree is usually not needed anymore. The
+	policy defines what happens to the tree and how raw access via :attr:`RootElement.XmlRoot` is served.
+	"""
+
+	Keep = 0  #: Keep the tree as long as the root element exists. Memory: object model plus the complete lxml tree.
+	Drop = 1  #: Release the tree after parsing. Memory: object model only. Raw access re-reads the file each time.
+	Cached = 2  #: Hand the tree to the bounded, process-wide :class:`TreeCache`. Memory: object model plus at most :attr:`TreeCache.Capacity` trees shared by all root elements. Evicted trees are re-read on access. Documents not read from a path keep their tree like :attr:`Keep`.
+
+
+@export
+class ValidationLevel(Enum):
+	"""
+	Validation level applied while loading an IP-XACT document.
+
+	The root element's tag and namespace are checked at every level, because they select the document type and schema.
+	For trusted input, e.g. files generated by a known tool, the XML schema validation can be replaced by lightweight
+	checks, which run while the object model is built.
+	"""
+
+	Full =       0  #: Validate the document against the IP-XACT XML schema.
+	Structural = 1  #: Check that all root-level elements are in the root's namespace, that they are known and that the VLNV fields are present.
+	Trusted =    2  #: No checks beyond the root element. Errors in the document surface as parser errors or incomplete models.
+
+
+@export
+class TreeCache(metaclass=ExtendedType, slots=True):
+	"""
+	A thread-safe, size-bounded LRU cache of lxml trees keyed by file path.
+
+	It backs :attr:`TreeRetention.Cached`. lxml elements don't support weak references (``weakref.ref(element)`` raises
+	a :exc:`TypeError`), thus trees can't be released on memory pressure. Instead, the cache holds the only strong
+	reference and releases the least recently used trees when its capacity is exceeded. The capacity of the process-wide
+	cache is adjusted via ``__TREE_CACHE__.Capacity``.
+	"""
+
+	_lock:     RLock                           #: Lock protecting the tree dictionary.
+	_trees:    "OrderedDict[Path, _Element]"   #: Cached trees in LRU order.
+	_capacity: int                             #: Maximum number of cached trees.
+
+	def __init__(self, capacity: int = 64) -> None:
+		"""
+		Initializes an empty tree cache.
+
+		:param capacity:    Maximum number of cached trees.
+		:raises ValueError: If parameter capacity is less than 1.
+		"""
+		if capacity < 1:
+			raise ValueError(f"Parameter 'capacity' must be at least 1.")
+
+		self._lock =     RLock()
+		self._trees =    OrderedDict()
+		self._capacity = capacity
+
+	@property
+	def Capacity(self) -> int:
+		return self._capacity
+
+	@Capacity.setter
+	def Capacity(self, value: int) -> None:
+		if value < 1:
+			raise ValueError(f"Parameter 'value' must be at least 1.")
+
+		with self._lock:
+			self._capacity = value
+			self._Evict()
+
+	def __len__(self) -> int:
+		return len(self._trees)
+
+	def Get(self, file: Path) -> Nullable["_Element"]:
+		"""
+		Returns a cached tree and marks it as most recently used.
+
+		:param file: Path of the parsed file.
+		:returns:    The tree's root element or ``None``, if not cached.
+		"""
+		with self._lock:
+			try:
+				self._trees.move_to_end(file)
+			except KeyError:
+				return None
+
+			return self._trees[file]
+
+	def Put(self, file: Path, xmlRoot: "_Element") -> None:
+		"""
+		Adds or replaces a tree and evicts the least recently used trees, if the capacity is exceeded.
+
+		:param file:    Path of the parsed file.
+		:param xmlRoot: The tree's root element.
+		"""
+		with self._lock:
+			self._trees[file] = xmlRoot
+			self._trees.move_to_end(file)
+			self._Evict()
+
+	def Clear(self) -> None:
+		"""
+		Removes all cached trees.
+		"""
+		with self._lock:
+			self._trees.clear()
+
+	def _Evict(self) -> None:
+		while len(self._trees) > self._capacity:
+			self._trees.popitem(last=False)
+
+
+__TREE_CACHE__ = TreeCache()  #: Process-wide cache of lxml trees for :attr:`TreeRetention.Cached`.
+__SEMANTIC_VERSION__: Nullable[Type["SemanticVersion"]] = None  #: :class:`pyTooling.Versioning.SemanticVersion`, imported on the first :class:`VLNV` construction.
+
 
 @export
 class VLNV(metaclass=ExtendedType, slots=True):
-	"""VLNV data structure (Vendor, Library, Name, Version) as a unique identifier in IP-XACT."""
+	"""
+	VLNV data structure (Vendor, Library, Name, Version) as a unique identifier in IP-XACT.
+
+	VLNVs are compared, hashed and ordered by value. Ordering is by vendor, library, name and then version.
+
+	Optionally, VLNVs created by :meth:`Create` (e.g. while parsing) are interned, so identical VLNVs share one instance.
+	"""
 
 	_vendor:  str              #: Vendor name in a VLNV unique identifier
 	_library: str              #: Library name in a VLNV unique identifier
 	_name:    str              #: Component name in a VLNV unique identifier
-	_version: SemanticVersion  #: Version in a VLNV unique identifier
+	_version: "SemanticVersion"  #: Version in a VLNV unique identifier
+	_hash:    int              #: Cached hash value
+
+	_internTable: ClassVar[Nullable[Dict["VLNV", "VLNV"]]] = None  #: Intern table, if interning is enabled.
+	_internKeys:  ClassVar[Nullable[Dict[Tuple[str, str, str, str], "VLNV"]]] = None  #: Interned VLNVs by field strings as passed to :meth:`Create`.
 
-	def __init__(self, vendor: str, library: str, name: str, version: Union[str, SemanticVersion]) -> None:
+	def __init__(self, vendor: str, library: str, name: str, version: Union[str, "SemanticVersion"]) -> None:
 		"""
 		Initializes the VLNV data structure.
 
@@ -232,6 +952,11 @@ class VLNV(metaclass=ExtendedType, slots=True):
 				ex.add_note(f"Got type '{getFullyQualifiedName(name)}'.")
 			raise ex
 
+		global __SEMANTIC_VERSION__
+		if __SEMANTIC_VERSION__ is None:
+			from pyTooling.Versioning import SemanticVersion as __SEMANTIC_VERSION__
+		SemanticVersion = __SEMANTIC_VERSION__
+
 		if version is None:
 			raise ValueError(f"Parameter 'version' is None.")
 		elif isinstance(version, str):
@@ -247,6 +972,131 @@ class VLNV(metaclass=ExtendedType, slots=True):
 		self._vendor =   vendor
 		self._library =  library
 		self._name =     name
+		# pyTooling caches a version's hash, which is pickled with it, thus only the version's numbers are hashed.
+		self._hash =     hash((vendor, library, name, self._version.Major, self._version.Minor, self._version.Micro))
+
+	@classmethod
+	def EnableInterning(cls) -> None:
+		"""
+		Enables interning of VLNVs created by :meth:`Create`.
+		"""
+		if VLNV._internTable is None:
+			VLNV._internTable = {}
+			VLNV._internKeys =  {}
+
+	@classmethod
+	def DisableInterning(cls) -> None:
+		"""
+		Disables interning and releases the intern table.
+		"""
+		VLNV._internTable = None
+		VLNV._internKeys =  None
+
+	@classmethod
+	def InternTableSize(cls) -> int:
+		"""
+		Returns the number of interned VLNVs.
+
+		:returns: Number of entries in the intern table or 0, if interning is disabled.
+		"""
+		return 0 if VLNV._internTable is None else len(VLNV._internTable)
+
+	@classmethod
+	def Create(cls, vendor: str, library: str, name: str, version: str) -> "VLNV":
+		"""
+		Creates a VLNV or returns the interned instance for these values, if interning is enabled.
+
+		A lookup in the intern table is cheaper than parsing the version string, thus interning speeds up loading of
+		repositories with many references to the same VLNVs. VLNVs are interned by value, so versions spelled differently,
+		but comparing equal (e.g. ``1.0`` and ``1.0.0``), share one instance.
+
+		:param vendor:  Vendor name in a VLNV unique identifier
+		:param library: Library name in a VLNV unique identifier
+		:param name:    Component name in a VLNV unique identifier
+		:param version: Version in a VLNV unique identifier
+		:returns:       A new or an interned VLNV.
+		"""
+		internKeys = VLNV._internKeys
+		if internKeys is None:
+			return cls(vendor, library, name, version)
+
+		key = (vendor, library, name, version)
+		try:
+			return internKeys[key]
+		except KeyError:
+			return internKeys.setdefault(key, cls(vendor, library, name, version).Intern())
+
+	@classmethod
+	def FromXml(cls, element: "_Element") -> "VLNV":
+		"""
+		Creates a VLNV from an element carrying the VLNV as attributes (e.g. ``<vlnv vendor=".." library=".." .../>``).
+
+		:param element: lxml element.
+		:returns:       A new or an interned VLNV.
+		"""
+		return cls.Create(element.get("vendor"), element.get("library"), element.get("name"), element.get("version"))
+
+	def Intern(self) -> "VLNV":
+		"""
+		Returns the interned instance equal to this VLNV.
+
+		If interning is disabled or no equal VLNV was interned yet, this instance is returned (and interned, if enabled).
+
+		:returns: The interned VLNV.
+		"""
+		internTable = VLNV._internTable
+		if internTable is None:
+			return self
+
+		return internTable.setdefault(self, self)
+
+	def __reduce__(self) -> Tuple[type, Tuple[str, str, str, "SemanticVersion"]]:
+		# The cached hash is derived from randomized string hashes, thus it's recomputed when unpickled in another process.
+		return self.__class__, (self._vendor, self._library, self._name, self._version)
+
+	def __hash__(self) -> int:
+		return self._hash
+
+	def __eq__(self, other: object) -> bool:
+		if self is other:
+			return True
+		elif not isinstance(other, VLNV):
+			return NotImplemented
+
+		return (
+			self._name == other._name and
+			self._library == other._library and
+			self._vendor == other._vendor and
+			self._version == other._version
+		)
+
+	def __ne__(self, other: object) -> bool:
+		result = self.__eq__(other)
+		return result if result is NotImplemented else not result
+
+	def __lt__(self, other: "VLNV") -> bool:
+		if not isinstance(other, VLNV):
+			return NotImplemented
+
+		return (self._vendor, self._library, self._name, self._version) < (other._vendor, other._library, other._name, other._version)
+
+	def __le__(self, other: "VLNV") -> bool:
+		if not isinstance(other, VLNV):
+			return NotImplemented
+
+		return (self._vendor, self._library, self._name, self._version) <= (other._vendor, other._library, other._name, other._version)
+
+	def __gt__(self, other: "VLNV") -> bool:
+		if not isinstance(other, VLNV):
+			return NotImplemented
+
+		return (self._vendor, self._library, self._name, self._version) > (other._vendor, other._library, other._name, other._version)
+
+	def __ge__(self, other: "VLNV") -> bool:
+		if not isinstance(other, VLNV):
+			return NotImplemented
+
+		return (self._vendor, self._library, self._name, self._version) >= (other._vendor, other._library, other._name, other._version)
 
 	@readonly
 	def Vendor(self) -> str:
@@ -261,9 +1111,15 @@ class VLNV(metaclass=ExtendedType, slots=True):
 		return self._name
 
 	@readonly
-	def Version(self) -> SemanticVersion:
+	def Version(self) -> "SemanticVersion":
 		return self._version
 
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} {self}>"
+
+	def __str__(self) -> str:
+		return f"{self._vendor}:{self._library}:{self._name}:{self._version}"
+
 	def ToXml(self, indent=1, schema: IPXACTSchema = __DEFAULT_SCHEMA__, isVersionedIdentifier=False) -> str:
 		"""
 		Converts the object's data into XML format.
@@ -282,14 +1138,14 @@ class VLNV(metaclass=ExtendedType, slots=True):
 		xmlns = schema.NamespacePrefix
 
 		if isVersionedIdentifier:
-			return dedent(f"""\
-				{indent}<{xmlns}:vendor>{self._vendor}</{xmlns}:vendor>
-				{indent}<{xmlns}:library>{self._library}</{xmlns}:library>
-				{indent}<{xmlns}:name>{self._name}</{xmlns}:name>
-				{indent}<{xmlns}:version>{self._version}</{xmlns}:version>
-			""")
+			return (
+				f"{indent}<{xmlns}:vendor>{EscapeXml(self._vendor)}</{xmlns}:vendor>\n"
+				f"{indent}<{xmlns}:library>{EscapeXml(self._library)}</{xmlns}:library>\n"
+				f"{indent}<{xmlns}:name>{EscapeXml(self._name)}</{xmlns}:name>\n"
+				f"{indent}<{xmlns}:version>{self._version}</{xmlns}:version>\n"
+			)
 		else:
-			return f"""{indent}<{xmlns}:vlnv vendor="{self._vendor}" library="{self._library}" name="{self._name}" version="{self._version}"/>"""
+			return f"""{indent}<{xmlns}:vlnv vendor={QuoteXmlAttribute(self._vendor)} library={QuoteXmlAttribute(self._library)} name={QuoteXmlAttribute(self._name)} version="{self._version}"/>\n"""
 
 
 @export
@@ -301,6 +1157,19 @@ class Element(metaclass=ExtendedType, slots=True):
 		Initializes the Element class.
 		"""
 
+	def IterateXml(self, indent: int = 0, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> Iterator[str]:
+		"""
+		Converts the object's data into XML format and yields it in chunks.
+
+		The default implementation yields the result of ``ToXml`` as a single chunk. Elements with many children override
+		it to yield one chunk per child.
+
+		:param indent: Level of indentations.
+		:param schema: XML schema.
+		:returns:      An iterator of XML formatted strings.
+		"""
+		yield self.ToXml(indent, schema)
+
 
 @export
 class NamedElement(Element):
@@ -334,44 +1203,434 @@ class RootElement(NamedElement):
 
 	_file:        Nullable[Path]
 	_rootTagName: ClassVar[str] = ""
-	_xmlRoot:     Nullable[_Element]
-	_xmlSchema:   Nullable[_Element]
+	_xmlRoot:     Nullable["_Element"]
+	_xmlSchema:   Nullable["XMLSchema"]
+	_retention:   TreeRetention
+	_validation:  ValidationLevel
+	_statistics:  Nullable["DocumentStatistics"]
+
+	_validationCache: ClassVar[Nullable["ValidationCache"]] = None  #: Optional cache of successful validations.
+	_instrumentation: ClassVar[Nullable["LoadStatistics"]] = None   #: Optional aggregator of load statistics.
+	_tagTable:        ClassVar[TagTable] = TagTable({                #: Handlers for root-level elements.
+		"vendorExtensions": lambda self, element: self.ParseVendorExtensions(element)
+	})
+	_vendorTable:     ClassVar[TagTable] = TagTable()                #: Handlers for elements within ``vendorExtensions``.
 
 	_description: str
 
-	def __init__(self, file: Nullable[Path] = None, parse: bool = False, vlnv: Nullable[VLNV] = None, description: Nullable[str] = None) -> None:
+	def __init__(
+		self,
+		file: Nullable[XMLSource] = None,
+		parse: bool = False,
+		vlnv: Nullable[VLNV] = None,
+		description: Nullable[str] = None,
+		streaming: bool = False,
+		retention: TreeRetention = TreeRetention.Keep,
+		validation: ValidationLevel = ValidationLevel.Full
+	) -> None:
+		"""
+		Initializes an IP-XACT root element either from a file or from a VLNV and description.
+
+		Besides a path, the document can be read from an in-memory buffer (``bytes``, ``bytearray``, ``memoryview``,
+		``mmap``) or from a binary file object. lxml parses buffers in place without an additional copy. Because such
+		sources can't be re-read, :attr:`XmlRoot` is only available afterwards with :attr:`TreeRetention.Keep`.
+
+		:param file:        Path to an IP-XACT file, a buffer or a binary file object.
+		:param parse:       If true, read, validate and parse the file.
+		:param vlnv:        VLNV unique identifier, if not read from file.
+		:param description: Description, if not read from file.
+		:param streaming:   If true, parse the file incrementally in bounded memory (see :meth:`OpenAndParseIncremental`).
+		:param retention:   Retention policy for the lxml tree after parsing.
+		:param validation:  Validation level applied while loading (see :class:`ValidationLevel`).
+		"""
+		if not isinstance(retention, TreeRetention):
+			ex = TypeError(f"Parameter 'retention' is not a TreeRetention.")
+			if version_info >= (3, 11):  # pragma: no cover
+				ex.add_note(f"Got type '{getFullyQualifiedName(retention)}'.")
+			raise ex
+		if not isinstance(validation, ValidationLevel):
+			ex = TypeError(f"Parameter 'validation' is not a ValidationLevel.")
+			if version_info >= (3, 11):  # pragma: no cover
+				ex.add_note(f"Got type '{getFullyQualifiedName(validation)}'.")
+			raise ex
+
 		self._description = description
+		self._xmlRoot =     None
+		self._xmlSchema =   None
+		self._retention =   retention
+		self._validation =  validation
+		self._statistics =  None
 
 		if file is None:
 			super().__init__(vlnv)
 			self._file = None
-		elif isinstance(file, Path):
-			self._file = file
+		elif isinstance(file, (Path, bytes, bytearray, memoryview, mmap)) or (isinstance(file, IOBase) and not isinstance(file, TextIOBase)):
+			self._file = file if isinstance(file, Path) else None
 			vlnv = None
 			if parse:
-				self.OpenAndValidate()
-				vlnv, self._description = self.ParseVLNVAndDescription()
+				instrumentation = self._instrumentation
+				if instrumentation is not None:
+					self._statistics = instrumentation.CreateDocumentStatistics(self._file)
+
+				try:
+					if streaming:
+						vlnv, self._description = self.OpenAndParseIncremental(file)
+					else:
+						self.OpenAndValidate(file)
+						with self._Phase("model"):
+							vlnv, self._description = self.ParseVLNVAndDescription()
+						self._ReleaseXmlRoot()
+				except Exception:
+					if instrumentation is not None:
+						self._statistics.MarkFailed()
+						instrumentation.Add(self._statistics)
+					raise
+
+				if instrumentation is not None:
+					instrumentation.Add(self._statistics)
 
 			super().__init__(vlnv)
 		else:
-			ex = TypeError(f"Parameter 'file' is not a Path.")
+			ex = TypeError(f"Parameter 'file' is neither a Path, a buffer nor a binary file object.")
 			if version_info >= (3, 11):  # pragma: no cover
 				ex.add_note(f"Got type '{getFullyQualifiedName(file)}'.")
 			raise ex
 
-	def OpenAndValidate(self) -> None:
-		if not self._file.exists():
-			raise IPXACTException(f"IPXACT file '{self._file}' not found.") from FileNotFoundError(str(self._file))
+	@classmethod
+	async def LoadAsync(
+		cls,
+		file: XMLSource,
+		streaming: bool = False,
+		retention: TreeRetention = TreeRetention.Keep,
+		executor: Nullable["Executor"] = None,
+		validation: ValidationLevel = ValidationLevel.Full
+	) -> "RootElement":
+		"""
+		Reads, validates and parses an IP-XACT document without blocking the running event loop.
 
-		try:
-			with self._file.open("rb") as fileHandle:
-				content = fileHandle.read()
-		except OSError as ex:
-			raise IPXACTException(f"Couldn't open '{self._file}'.") from ex
+		Reading the file, parsing and validation run in an executor. lxml releases the GIL while parsing and validating, so
+		the event loop stays responsive. If the awaiting task is cancelled, the load already running in the executor is
+		finished, but its result is discarded.
+
+		.. code-block:: python
+
+		   component = await Component.LoadAsync(Path("ip/component.xml"))
+
+		:param file:       Path to an IP-XACT file, a buffer or a binary file object.
+		:param streaming:  If true, parse the file incrementally in bounded memory.
+		:param retention:  Retention policy for the lxml tree after parsing.
+		:param executor:   Thread pool executor. If ``None``, the event loop's default executor is used.
+		:param validation: Validation level applied while loading.
+		:returns:          The loaded root element.
+		"""
+		from asyncio import get_running_loop  # asyncio is imported on first use, as it's expensive to import.
+
+		loop = get_running_loop()
+		return await loop.run_in_executor(executor, partial(cls, file, parse=True, streaming=streaming, retention=retention, validation=validation))
+
+	@readonly
+	def File(self) -> Nullable[Path]:
+		return self._file
+
+	@readonly
+	def Retention(self) -> TreeRetention:
+		return self._retention
+
+	@readonly
+	def Validation(self) -> ValidationLevel:
+		"""
+		Read-only property to access the validation level the document was loaded with.
+
+		:returns: The validation level.
+		"""
+		return self._validation
+
+	@readonly
+	def Statistics(self) -> Nullable["DocumentStatistics"]:
+		"""
+		Read-only property to access the statistics recorded while loading the document.
+
+		:returns: The document's load statistics or ``None``, if no instrumentation was installed while loading.
+		"""
+		return self._statistics
+
+	@readonly
+	def XmlRoot(self) -> Nullable["_Element"]:
+		"""
+		Read-only property to access the document's lxml tree.
+
+		Depending on the retention policy, the tree is served from this object, from the process-wide tree cache or it's
+		re-read from file (without validation).
+
+		:returns: Root element of the lxml tree or ``None``, if this root element wasn't created from a file.
+		"""
+		if self._xmlRoot is not None:
+			return self._xmlRoot
+		elif self._file is None:
+			return None
+
+		if self._retention is TreeRetention.Cached:
+			xmlRoot = __TREE_CACHE__.Get(self._file)
+			if xmlRoot is None:
+				xmlRoot = self._ReadXmlRoot()
+				__TREE_CACHE__.Put(self._file, xmlRoot)
+		else:
+			xmlRoot = self._ReadXmlRoot()
+			if self._retention is TreeRetention.Keep:
+				self._xmlRoot = xmlRoot
+
+		return xmlRoot
+
+	def Materialize(self) -> None:
+		"""
+		Builds all parts of the object model, whose construction was deferred while loading.
+
+		The object model doesn't depend on the lxml tree afterwards, e.g. before it's pickled. The base implementation does
+		nothing.
+		"""
+
+	def _AssignFile(self, file: Path) -> None:
+		"""
+		Records the path of a document, which was loaded from a buffer holding the file's content.
+
+		Afterwards, raw access via :attr:`XmlRoot` re-reads the file according to the retention policy. A kept tree is handed
+		to the tree cache, if the policy is :attr:`TreeRetention.Cached`.
+
+		:param file: Path of the file the buffer was read from.
+		"""
+		self._file = file
+		if self._statistics is not None:
+			self._statistics._file = file
+
+		if self._xmlRoot is not None:
+			self._ReleaseXmlRoot()
+
+	def _ReadXmlRoot(self) -> "_Element":
+		xmlRoot, _ = self._ParseXml(self._file, account=False)
+		return xmlRoot
+
+	def _ReleaseXmlRoot(self) -> None:
+		if self._retention is TreeRetention.Drop:
+			self._xmlRoot = None
+		elif self._retention is TreeRetention.Cached and self._file is not None:
+			# Documents read from buffers, file objects or mmaps have no path to key the cache by and to re-read the tree from,
+			# thus they keep their tree.
+			__TREE_CACHE__.Put(self._file, self._xmlRoot)
+			self._xmlRoot = None
+
+	def _ParseXml(self, source: XMLSource, computeHash: Nullable[Callable[[Any], str]] = None, account: bool = True) -> Tuple["_Element", Nullable[str]]:
+		"""
+		Parses a source into an lxml tree without validating it.
+
+		Files are memory-mapped and buffers are parsed in place. Compressed content is detected by its magic bytes and is
+		decompressed while being parsed. Binary file objects are parsed chunk-wise. If instrumented, elements are counted
+		from the parser's events (see :meth:`_ParseXmlCounting`) and the time and bytes read are accounted.
+
+		:param source:           Path, buffer or binary file object.
+		:param computeHash:      Optional function computing a hash of the (raw) content.
+		:param account:          If false, nothing is accounted in the document's statistics, e.g. when a tree is re-read
+		                         after loading.
+		:returns:                A tuple of the tree's root element and the content's hash or ``None``.
+		:raises IPXACTException: If the file doesn't exist or can't be read.
+		"""
+		from lxml.etree import XML, parse as parseXML
+
+		xmlParser = __PARSER_CACHE__.GetParser()
+		baseURL =   self._file.resolve().as_uri() if self._file is not None else None  # - relative paths are not supported
+		countElements = account and self._statistics is not None
+
+		if computeHash is None and isinstance(source, IOBase):
+			with self._Phase("parse", account):
+				if countElements:
+					return self._ParseXmlCounting(source, baseURL), None
+
+				return parseXML(source, parser=xmlParser, base_url=baseURL).getroot(), None
+
+		with self._OpenBuffer(source, account) as buffer, self._Phase("parse", account):
+			compression = Compression.FromMagic(bytes(buffer[:6]))
+			if compression is Compression.Uncompressed:
+				if countElements:
+					xmlRoot = self._ParseXmlCounting(buffer, baseURL)
+				else:
+					xmlRoot = XML(buffer, parser=xmlParser, base_url=baseURL)
+			else:
+				with compression.Open(buffer if isinstance(buffer, mmap) else BytesIO(buffer)) as stream:
+					if countElements:
+						xmlRoot = self._ParseXmlCounting(stream, baseURL)
+					else:
+						xmlRoot = parseXML(stream, parser=xmlParser, base_url=baseURL).getroot()
+
+			return xmlRoot, (None if computeHash is None else computeHash(buffer))
 
-		xmlParser =     XMLParser(remove_blank_text=True, encoding="utf-8")
-		self._xmlRoot = XML(content, parser=xmlParser, base_url=self._file.resolve().as_uri())  # - relative paths are not supported
-		rootTag =       QName(self._xmlRoot.tag)
+	def _ParseXmlCounting(self, source: Union[IO[bytes], Any], baseURL: Nullable[str], chunkSize: int = 1024 * 1024) -> "_Element":
+		"""
+		Parses a buffer or binary file object into an lxml tree and counts its elements per tag while parsing.
+
+		The content is fed chunk-wise into a pull parser, whose start events are counted after each chunk. Thus, no
+		additional walk over the tree is needed and at most one chunk of the content is copied at a time.
+
+		:param source:    Buffer or binary file object.
+		:param baseURL:   Base URL of the document.
+		:param chunkSize: Number of bytes fed at once.
+		:returns:         The tree's root element.
+		"""
+		from lxml.etree import XMLPullParser
+
+		elementCounts = self._statistics._elementCounts
+		parser = XMLPullParser(events=("start", ), remove_blank_text=True, encoding="utf-8", base_url=baseURL)
+
+		def feed(chunk) -> None:
+			parser.feed(chunk)
+			for _, element in parser.read_events():
+				elementCounts[element.tag] += 1
+
+		if isinstance(source, IOBase):
+			for chunk in iter(partial(source.read, chunkSize), b""):
+				feed(chunk)
+		else:
+			# The feed parser requires bytes, thus each chunk is copied. The view must be released before a memory-mapped
+			# buffer is closed.
+			with memoryview(source) as view:
+				for offset in range(0, len(view), chunkSize):
+					feed(view[offset:offset + chunkSize].tobytes())
+
+		xmlRoot = parser.close()
+		for _, element in parser.read_events():
+			elementCounts[element.tag] += 1
+
+		return xmlRoot
+
+	@contextmanager
+	def _OpenBuffer(self, source: XMLSource, account: bool = True) -> Iterator[Any]:
+		"""
+		Provides the content of a source as a buffer without copying it, if possible.
+
+		Files are memory-mapped, buffers are passed through. Binary file objects are read completely.
+
+		:param source:           Source to provide as buffer.
+		:param account:          If false, the time and bytes read aren't accounted in the document's statistics.
+		:returns:                A context manager yielding a buffer.
+		:raises IPXACTException: If the file doesn't exist or can't be read.
+		"""
+		if isinstance(source, Path):
+			if not source.exists():
+				raise IPXACTException(f"IPXACT file '{source}' not found.") from FileNotFoundError(str(source))
+
+			try:
+				with self._Phase("read", account):
+					fileHandle = source.open("rb")
+			except OSError as ex:
+				raise IPXACTException(f"Couldn't open '{source}'.") from ex
+
+			with fileHandle:
+				try:
+					with self._Phase("read", account):
+						# Empty files can't be memory-mapped.
+						buffer = b"" if fstat(fileHandle.fileno()).st_size == 0 else mmap(fileHandle.fileno(), 0, access=ACCESS_READ)
+				except OSError as ex:
+					raise IPXACTException(f"Couldn't open '{source}'.") from ex
+
+				try:
+					self._CountBytesRead(len(buffer), account)
+					yield buffer
+				finally:
+					if isinstance(buffer, mmap):
+						buffer.close()
+		elif isinstance(source, (bytes, bytearray, memoryview, mmap)):
+			self._CountBytesRead(source.nbytes if isinstance(source, memoryview) else len(source), account)
+			yield source
+		else:
+			with self._Phase("read", account):
+				content = source.read()
+			self._CountBytesRead(len(content), account)
+			yield content
+
+	def _Phase(self, name: str, account: bool = True) -> ContextManager[None]:
+		"""Returns a context manager accounting the time spent in a with-statement to a load phase, if instrumented."""
+		return nullcontext() if self._statistics is None or not account else self._statistics.Phase(name)
+
+	def _CountBytesRead(self, count: int, account: bool = True) -> None:
+		if self._statistics is not None and account:
+			self._statistics.AddBytesRead(count)
+
+	@contextmanager
+	def _OpenStream(self, source: XMLSource) -> Iterator[IO[bytes]]:
+		"""
+		Provides the content of a source as a binary file object.
+
+		Compressed files and buffers are detected by their magic bytes and are decompressed while being read.
+
+		:param source:           Source to provide as file object.
+		:returns:                A context manager yielding a binary file object positioned at the start of the document.
+		:raises IPXACTException: If the file doesn't exist or can't be read.
+		"""
+		if isinstance(source, Path):
+			if not source.exists():
+				raise IPXACTException(f"IPXACT file '{source}' not found.") from FileNotFoundError(str(source))
+
+			try:
+				with source.open("rb") as fileHandle:
+					compression = Compression.FromMagic(fileHandle.read(6))
+					fileHandle.seek(0)
+					with compression.Open(fileHandle) as stream:
+						yield stream
+			except OSError as ex:
+				raise IPXACTException(f"Couldn't open '{source}'.") from ex
+		elif isinstance(source, (bytes, bytearray, memoryview, mmap)):
+			stream = source if isinstance(source, mmap) else BytesIO(source)
+			stream.seek(0)
+			compression = Compression.FromMagic(bytes(source[:6]))
+			if compression is Compression.Uncompressed:
+				yield stream
+			else:
+				with compression.Open(stream) as decompressedStream:
+					yield decompressedStream
+		else:
+			yield source
+
+	@classmethod
+	def SetValidationCache(cls, cache: Nullable["ValidationCache"]) -> None:
+		"""
+		Enables or disables the persistent validation cache for all IP-XACT root elements.
+
+		If enabled, documents whose content was already validated successfully against the same schema by the same package
+		version are not validated again.
+
+		:param cache: A :class:`~pyEDAA.IPXACT.ValidationCache.ValidationCache` or ``None`` to disable caching.
+		"""
+		RootElement._validationCache = cache
+
+	@classmethod
+	def SetInstrumentation(cls, statistics: Nullable["LoadStatistics"]) -> None:
+		"""
+		Installs or removes an aggregator of load statistics for all IP-XACT root elements.
+
+		While installed, loading a document records per-phase timing and counters (see
+		:class:`~pyEDAA.IPXACT.Instrumentation.DocumentStatistics`). If removed, loading isn't instrumented.
+
+		:param statistics: A :class:`~pyEDAA.IPXACT.Instrumentation.LoadStatistics` or ``None`` to disable instrumentation.
+		"""
+		RootElement._instrumentation = statistics
+
+	def OpenAndValidate(self, source: Nullable[XMLSource] = None) -> None:
+		"""
+		Reads and validates the document.
+
+		Files are memory-mapped and buffers are parsed in place, so the document's content isn't copied into a Python
+		object. Binary file objects are parsed chunk-wise. The XML schema validation is only applied for
+		:attr:`ValidationLevel.Full`.
+
+		:param source:           Path, buffer or binary file object to read. If ``None``, the root element's file is read.
+		:raises IPXACTException: If the file doesn't exist, can't be read, isn't of the expected type or isn't valid.
+		"""
+		from lxml.etree import QName
+
+		if source is None:
+			source = self._file
+
+		validationCache = self._validationCache if self._validation is ValidationLevel.Full else None
+		self._xmlRoot, contentHash = self._ParseXml(source, None if validationCache is None else validationCache.ComputeHash)
+		rootTag = QName(self._xmlRoot.tag)
 
 		if rootTag.localname != self._rootTagName:
 			raise IPXACTException(f"The input IP-XACT file is not a {self._rootTagName} file.")
@@ -383,65 +1642,324 @@ class RootElement(NamedElement):
 		else:
 			raise IPXACTException(f"The input IP-XACT file uses an unsupported namespace: '{namespaceURI}'.")
 
-		try:
-			with ipxactSchema.LocalPath.open("rb") as fileHandle:
-				schema = fileHandle.read()
-		except OSError as ex:
-			raise IPXACTException(f"Couldn't open IP-XACT schema '{ipxactSchema.LocalPath}' for {namespacePrefix} ({namespaceURI}).") from ex
+		if self._validation is not ValidationLevel.Full:
+			self._xmlSchema = None
+			return
 
-		schemaRoot =      XML(schema, parser=xmlParser, base_url=ipxactSchema.LocalPath.as_uri())
-		schemaTree =      ElementTree(schemaRoot)
-		self._xmlSchema = XMLSchema(schemaTree)
+		if validationCache is not None:
+			if validationCache.Contains(contentHash, namespaceURI):
+				self._xmlSchema = None
+				return
+
+		with self._Phase("schema"):
+			self._xmlSchema = __SCHEMA_CACHE__.GetSchema(ipxactSchema)
 
 		try:
-			self._xmlSchema.assertValid(self._xmlRoot)
+			with self._Phase("validate"):
+				self._xmlSchema.assertValid(self._xmlRoot)
 		except Exception as ex:
 			raise IPXACTException(f"The input IP-XACT file is not valid according to XML schema {namespaceURI}.") from ex
 
+		if validationCache is not None:
+			validationCache.Add(contentHash, namespaceURI)
+
+	def OpenAndParseIncremental(self, source: Nullable[XMLSource] = None) -> Tuple[VLNV, str]:
+		"""
+		Reads, validates and parses the document incrementally.
+
+		The document is parsed with :func:`lxml.etree.iterparse` while being validated against the IP-XACT schema (or
+		checked according to the :class:`ValidationLevel`). Each
+		top-level section is handed to :meth:`Parse` as soon as it's complete and is discarded afterwards. Thus, peak
+		memory is bounded by the largest section instead of by the whole document. The XML tree isn't retained.
+
+		The document is read twice: first to detect the schema, then to parse it. Binary file objects, which aren't
+		seekable, are therefore read into memory first.
+
+		:param source:           Path, buffer or binary file object to read. If ``None``, the root element's file is read.
+		:returns:                VLNV and description read from the document.
+		:raises IPXACTException: If the file doesn't exist, can't be read, isn't of the expected type or isn't valid.
+		"""
+		from lxml.etree import QName, XMLSyntaxError, iterparse
+
+		if source is None:
+			source = self._file
+		if isinstance(source, IOBase) and not source.seekable():
+			source = source.read()
+
+		sourceName = self._file if self._file is not None else "<buffer>"
+		header = {"vendor": None, "library": None, "name": None, "version": None, "description": None}
+		# Decompressing readers can't always seek backwards, thus owned sources are reopened for the second pass.
+		start = source.tell() if isinstance(source, IOBase) else None
+		with self._OpenStream(source) as fileHandle, self._Phase("parse"):
+			try:
+				for _, rootElement in iterparse(fileHandle, events=("start", )):
+					break
+				else:
+					raise IPXACTException(f"The input IP-XACT file '{sourceName}' contains no root element.")
+				rootTag =         QName(rootElement.tag)
+				namespacePrefix = rootElement.prefix
+				namespaceURI =    rootElement.nsmap[namespacePrefix]
+			except XMLSyntaxError as ex:
+				raise IPXACTException(f"The input IP-XACT file '{sourceName}' is not well-formed.") from ex
+			except OSError as ex:
+				raise IPXACTException(f"Couldn't read '{sourceName}'.") from ex
+
+		if rootTag.localname != self._rootTagName:
+			raise IPXACTException(f"The input IP-XACT file is not a {self._rootTagName} file.")
+
+		if namespaceURI in __URI_MAP__:
+			ipxactSchema = __URI_MAP__[namespaceURI]
+		else:
+			raise IPXACTException(f"The input IP-XACT file uses an unsupported namespace: '{namespaceURI}'.")
+
+		if self._validation is ValidationLevel.Full:
+			with self._Phase("schema"):
+				self._xmlSchema = __SCHEMA_CACHE__.GetSchema(ipxactSchema)
+
+		structural = self._validation is ValidationLevel.Structural
+		namespace =  f"{{{namespaceURI}}}"
+		if start is not None:
+			source.seek(start)
+		elementCounts = None if self._statistics is None else self._statistics.ElementCounts
+		with self._OpenStream(source) as fileHandle, self._Phase("parse"):
+			depth = 0
+			rootElement = None
+			try:
+				for event, element in iterparse(fileHandle, events=("start", "end"), schema=self._xmlSchema, remove_blank_text=True):
+					if event == "start":
+						if rootElement is None:
+							rootElement = element
+						depth += 1
+						continue
+
+					depth -= 1
+					if elementCounts is not None:
+						elementCounts[element.tag] += 1
+					if depth != 1:
+						continue
+
+					if structural and not element.tag.startswith(namespace):
+						self._RaiseForeignElement(element, namespaceURI)
+					if (field := __HEADER_TABLE__.Get(element.tag)) is not None:
+						header[field] = element.text
+					else:
+						with self._Phase("model"):
+							self.Parse(element)
+
+					# Release the processed section and all preceding siblings (incl. comments).
+					element.clear()
+					while element.getprevious() is not None:
+						del rootElement[0]
+			except XMLSyntaxError as ex:
+				raise IPXACTException(f"The input IP-XACT file is not valid according to XML schema {namespaceURI}.") from ex
+			except OSError as ex:
+				raise IPXACTException(f"Couldn't read '{sourceName}'.") from ex
+
+			self._CountBytesRead(fileHandle.tell())
+
+		if structural:
+			self._CheckHeader(header)
+		vlnv = VLNV.Create(vendor=header["vendor"], library=header["library"], name=header["name"], version=header["version"])
+		return vlnv, header["description"]
+
 	def ParseVLNVAndDescription(self) -> Tuple[VLNV, str]:
-		vendor = None
-		library = None
-		name = None
-		version = None
-		description = None
+		"""
+		Reads the VLNV and description and parses all other root-level elements in a single pass over the lxml tree.
+
+		For :attr:`ValidationLevel.Structural`, the structural checks are applied in the same pass.
+
+		:returns:                VLNV and description read from the document.
+		:raises IPXACTException: If a structural check fails.
+		"""
+		from lxml.etree import QName, _Comment
+
+		structural = self._validation is ValidationLevel.Structural
+		namespaceURI = QName(self._xmlRoot).namespace
+		namespace = f"{{{namespaceURI}}}"
 
-		found = 0
+		header = {}
 		i = iter(self._xmlRoot)
 		for element in i:
 			if isinstance(element, _Comment):
 				continue
 
-			elementLocalname = QName(element).localname
-			if elementLocalname == "vendor":
-				found |= 1
-				vendor = element.text
-			elif elementLocalname == "library":
-				found |= 2
-				library = element.text
-			elif elementLocalname == "name":
-				found |= 4
-				name = element.text
-			elif elementLocalname == "version":
-				found |= 8
-				version = element.text
-			elif elementLocalname == "description":
-				found |= 16
-				description = element.text
+			if structural and not element.tag.startswith(namespace):
+				self._RaiseForeignElement(element, namespaceURI)
+			if (field := __HEADER_TABLE__.Get(element.tag)) is not None:
+				header[field] = element.text
 			else:
 				self.Parse(element)
 
-			if found == 31:
+			if len(header) == 5:
 				break
 
 		for element in i:
 			if isinstance(element, _Comment):
 				continue
 
+			if structural and not element.tag.startswith(namespace):
+				self._RaiseForeignElement(element, namespaceURI)
 			self.Parse(element)
 
-		vlnv = VLNV(vendor=vendor, library=library, name=name, version=version)
-		return vlnv, description
+		if structural:
+			self._CheckHeader(header)
+		vlnv = VLNV.Create(vendor=header.get("vendor"), library=header.get("library"), name=header.get("name"), version=header.get("version"))
+		return vlnv, header.get("description")
+
+	def _RaiseForeignElement(self, element: "_Element", namespaceURI: str) -> None:
+		from lxml.etree import QName
+
+		ex = IPXACTException(f"Root-level element '{QName(element).localname}' isn't in the document's namespace.")
+		if version_info >= (3, 11):  # pragma: no cover
+			ex.add_note(f"Expected namespace '{namespaceURI}', got '{QName(element).namespace}'.")
+		raise ex
+
+	def _CheckHeader(self, header: Dict[str, Nullable[str]]) -> None:
+		missing = [field for field in ("vendor", "library", "name", "version") if header.get(field) is None]
+		if len(missing) > 0:
+			ex = IPXACTException(f"The input IP-XACT file misses mandatory VLNV fields of its {self._rootTagName}.")
+			if version_info >= (3, 11):  # pragma: no cover
+				ex.add_note(f"Missing fields: {', '.join(missing)}")
+			raise ex
+
+	def Parse(self, element: "_Element") -> None:
+		"""
+		Parses a root-level element by dispatching it to the handler registered in the class' tag table.
+
+		:param element:          Root-level element to parse.
+		:raises IPXACTException: If no handler is registered for this element.
+		"""
+		try:
+			handler = self._tagTable[element.tag]
+		except KeyError:
+			from lxml.etree import QName
+
+			raise IPXACTException(f"Unsupported tag '{QName(element).localname}' at root-level.") from None
+
+		if handler is not None:
+			handler(self, element)
+		elif self._statistics is not None:
+			self._statistics.SkipSection(element.tag)
+
+	def ParseVendorExtensions(self, element: "_Element") -> None:
+		"""
+		Parses a ``vendorExtensions`` element by dispatching its children to handlers registered via
+		:meth:`RegisterVendorExtensionHandler`.
+
+		Vendor extensions without a registered handler are ignored.
+
+		:param element: The ``vendorExtensions`` element.
+		"""
+		vendorTable = self._vendorTable
+		for extensionElement in element:
+			if (handler := vendorTable.Get(extensionElement.tag)) is not None:
+				handler(self, extensionElement)
+
+	@classmethod
+	def RegisterElementHandler(cls, localname: str, handler: Nullable[Callable[["RootElement", "_Element"], None]], namespace: Nullable[str] = None) -> None:
+		"""
+		Registers a handler for a root-level element of this root element class and its subclasses defined afterwards.
+
+		The class' tag table is copied on first registration, so base-classes aren't affected.
+
+		:param localname: Local name of the element.
+		:param handler:   Handler called with the root element and the lxml element, or ``None`` to ignore the element.
+		:param namespace: Namespace URI. If ``None``, the handler is registered for all IP-XACT namespaces.
+		"""
+		if "_tagTable" not in cls.__dict__:
+			cls._tagTable = cls._tagTable.Derive()
+
+		cls._tagTable.Register(localname, handler, namespace)
+
+	@classmethod
+	def RegisterVendorExtensionHandler(cls, namespace: str, localname: str, handler: Callable[["RootElement", "_Element"], None]) -> None:
+		"""
+		Registers a handler for a vendor specific element within ``vendorExtensions``.
+
+		The class' vendor extension table is copied on first registration, so base-classes aren't affected.
+
+		:param namespace: Namespace URI of the vendor.
+		:param localname: Local name of the element.
+		:param handler:   Handler called with the root element and the lxml element.
+		"""
+		if "_vendorTable" not in cls.__dict__:
+			cls._vendorTable = cls._vendorTable.Derive()
+
+		cls._vendorTable.Register(localname, handler, namespace)
 
 	@abstractmethod
-	def Parse(self, element: _Element) -> None:
-		pass
+	def IterateXml(self, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> Iterator[str]:
+		"""
+		Converts the object's data into XML format and yields it in chunks.
+
+		:param schema: XML schema.
+		:returns:      An iterator of XML formatted strings.
+		"""
+
+	def ToXml(self, schema: IPXACTSchema = __DEFAULT_SCHEMA__) -> str:
+		"""
+		Converts the object's data into XML format.
+
+		:param schema: XML schema.
+		:returns:      XML formatted string representation.
+		"""
+		return "".join(self.IterateXml(schema))
+
+	def WriteXml(
+		self,
+		file: Union[Path, IO[Any]],
+		schema: IPXACTSchema = __DEFAULT_SCHEMA__,
+		compression: Nullable[Compression] = None
+	) -> None:
+		"""
+		Converts the object's data into XML format and writes it chunk by chunk into a file.
+
+		The document is never held completely in memory. Output can be compressed while it's written.
+
+		:param file:        Path of the output file, or a text or binary file object. Binary output is UTF-8 encoded.
+		:param schema:      XML schema.
+		:param compression: Compression format for paths and binary file objects. If ``None``, it's derived from the
+		                    path's suffix (e.g. ``*.xml.gz``), respectively binary file objects aren't compressed.
+		"""
+		if isinstance(file, Path):
+			if compression is None:
+				compression = Compression.FromSuffix(file)
+
+			with compression.Open(file, "wb") as binaryHandle:
+				with TextIOWrapper(binaryHandle, encoding="utf-8", newline="\n") as fileHandle:
+					fileHandle.writelines(self.IterateXml(schema))
+		elif isinstance(file, TextIOBase):
+			file.writelines(self.IterateXml(schema))
+		elif compression is None or compression is Compression.Uncompressed:
+			for chunk in self.IterateXml(schema):
+				file.write(chunk.encode("utf-8"))
+		else:
+			with compression.Open(file, "wb") as binaryHandle:
+				for chunk in self.IterateXml(schema):
+					binaryHandle.write(chunk.encode("utf-8"))
+
+	def _IterateXmlStart(self, schema: IPXACTSchema, displayName: Nullable[str] = None) -> Iterator[str]:
+		xmlns = schema.NamespacePrefix
+		yield (
+			f"""<?xml version="1.0" encoding="UTF-8"?>\n"""
+			f"""<{xmlns}:{self._rootTagName}\n"""
+			f"""\txmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"\n"""
+			f"""\txmlns:{xmlns}="{schema.SchemaUri}"\n"""
+			f"""\txsi:schemaLocation="{schema.SchemaUri} {schema.SchemaUrl}">\n"""
+		)
+		yield self._vlnv.ToXml(1, schema, isVersionedIdentifier=True)
+		if displayName is not None:
+			yield f"\t<{xmlns}:displayName>{EscapeXml(displayName)}</{xmlns}:displayName>\n"
+		if self._description is not None:
+			yield f"\t<{xmlns}:description>{EscapeXml(self._description)}</{xmlns}:description>\n"
+
+	@staticmethod
+	def _IterateXmlSection(tagName: str, items: Iterable[Element], schema: IPXACTSchema) -> Iterator[str]:
+		xmlns = schema.NamespacePrefix
+		yield f"\t<{xmlns}:{tagName}>\n"
+		for item in items:
+			yield from item.IterateXml(2, schema)
+		yield f"\t</{xmlns}:{tagName}>\n"
+
+	def _IterateXmlEnd(self, schema: IPXACTSchema) -> Iterator[str]:
+		yield f"</{schema.NamespacePrefix}:{self._rootTagName}>\n"
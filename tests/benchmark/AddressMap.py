@@ -0,0 +1,107 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___ ______  __    _    ____ _____                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    |_ _|  _ \ \/ /   / \  / ___|_   _|                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \    | || |_) \  /   / _ \| |     | |                                          #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ _ | ||  __//  \  / ___ \ |___  | |                                          #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___|_|  /_/\_\/_/   \_\____| |_|                                          #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2025 Patrick Lehmann - Bötzingen, Germany                                                             #
+# Copyright 2016-2016 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Benchmark the address map checker on a synthetic SoC address space.
+
+Many components with adjacent address blocks are placed in one address space. Some address blocks overlap their
+successor. The sorted sweep of the checker is compared with a pairwise check of all address blocks.
+"""
+from itertools    import combinations
+from time         import perf_counter
+from unittest     import TestCase
+
+from pyEDAA.IPXACT            import VLNV
+from pyEDAA.IPXACT.AddressMap import ConflictKind, AddressMapChecker
+from pyEDAA.IPXACT.MemoryMap  import MemoryMapTable
+
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+COMPONENTS = 256
+BLOCKS =     16
+REGISTERS =  64
+PAIRWISE =   128  #: Number of components, whose address blocks are checked pairwise.
+
+
+def CreateChecker(components: int, registers: int) -> AddressMapChecker:
+	checker = AddressMapChecker()
+	for component in range(components):
+		table = MemoryMapTable()
+		memoryMap = table.AddMemoryMap("map")
+		for block in range(BLOCKS):
+			# Every 7th address block overlaps its successor by one register.
+			table.AddAddressBlock(f"block{block}", block * 4 * REGISTERS, 4 * REGISTERS + (4 if block % 7 == 6 else 0), 32)
+			for register in range(registers):
+				table.AddRegister(f"reg{register}", 4 * register, 32)
+
+		checker.AddMemoryMap(memoryMap, component * BLOCKS * 4 * REGISTERS, VLNV("Vendor", "Library", f"ip{component}", "1.0"))
+
+	return checker
+
+
+class AddressMap(TestCase):
+	def test_Check(self) -> None:
+		checker = CreateChecker(COMPONENTS, REGISTERS)
+
+		startTime = perf_counter()
+		conflicts = checker.Check()
+		sweepTime = perf_counter() - startTime
+
+		self.assertEqual(COMPONENTS * (BLOCKS // 7), len(conflicts))
+		self.assertTrue(all(conflict.Kind is ConflictKind.BlockOverlap for conflict in conflicts))
+
+		checker = CreateChecker(PAIRWISE, 0)
+		startTime = perf_counter()
+		sweepOverlaps = {conflict.Start for conflict in checker.Check()}
+		blockSweepTime = perf_counter() - startTime
+
+		startTime = perf_counter()
+		blocks = [
+			(baseAddress + block.BaseAddress, baseAddress + block.BaseAddress + block.Range)
+			for _, table, mapIndex, baseAddress in checker._placements
+			for block in table.MemoryMaps[mapIndex].AddressBlocks
+		]
+		pairwiseOverlaps = {max(start1, start2) for (start1, end1), (start2, end2) in combinations(blocks, 2) if start1 < end2 and start2 < end1}
+		pairwiseTime = perf_counter() - startTime
+
+		self.assertEqual(pairwiseOverlaps, sweepOverlaps)
+
+		print()
+		print(f"address blocks: {COMPONENTS * BLOCKS}  registers: {COMPONENTS * BLOCKS * REGISTERS}")
+		print(f"sweep:          {sweepTime * 1e3:8.1f} ms")
+		print(f"address blocks: {PAIRWISE * BLOCKS}  registers: 0")
+		print(f"sweep:          {blockSweepTime * 1e3:8.1f} ms")
+		print(f"pairwise:       {pairwiseTime * 1e3:8.1f} ms")
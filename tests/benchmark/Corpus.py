@@ -0,0 +1,198 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___ ______  __    _    ____ _____                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    |_ _|  _ \ \/ /   / \  / ___|_   _|                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \    | || |_) \  /   / _ \| |     | |                                          #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ _ | ||  __//  \  / ___ \ |___  | |                                          #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___|_|  /_/\_\/_/   \_\____| |_|                                          #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2025 Patrick Lehmann - Bötzingen, Germany                                                             #
+# Copyright 2016-2016 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Deterministic generator for synthetic IP-XACT corpora used by the benchmarks."""
+from pathlib  import Path
+from random   import Random
+from typing   import Dict, List
+
+from pyEDAA.IPXACT import __VERSION_TABLE__, IPXACTSchema
+
+
+FILE_TYPES = ("vhdlSource", "verilogSource", "systemVerilogSource", "cSource", "tclSource", "unknown")
+
+
+class CorpusGenerator:
+	"""
+	Writes synthetic components, designs and catalogs for IP-XACT 2009, 2014 or 2022.
+
+	The output depends only on the parameters and the seed, thus benchmark runs are comparable.
+	"""
+
+	_directory: Path
+	_version:   str
+	_schema:    IPXACTSchema
+	_random:    Random
+	_vendor:    str
+	_library:   str
+
+	def __init__(self, directory: Path, version: str = "2022", seed: int = 0) -> None:
+		self._directory = directory
+		self._version =   version
+		self._schema =    __VERSION_TABLE__[version]
+		self._random =    Random(seed)
+		self._vendor =    "pyEDAA"
+		self._library =   f"Bench{version}"
+
+	@property
+	def Schema(self) -> IPXACTSchema:
+		return self._schema
+
+	def _Header(self, rootTag: str, name: str) -> str:
+		prefix = self._schema.NamespacePrefix
+		return (
+			f"""<?xml version="1.0" encoding="UTF-8"?>\n"""
+			f"""<{prefix}:{rootTag} xmlns:{prefix}="{self._schema.SchemaUri}">\n"""
+			f"""\t<{prefix}:vendor>{self._vendor}</{prefix}:vendor>\n"""
+			f"""\t<{prefix}:library>{self._library}</{prefix}:library>\n"""
+			f"""\t<{prefix}:name>{name}</{prefix}:name>\n"""
+			f"""\t<{prefix}:version>1.0</{prefix}:version>\n"""
+		)
+
+	def _VLNVAttributes(self, name: str) -> str:
+		# IP-XACT 2009 uses namespace qualified VLNV attributes.
+		prefix = f"{self._schema.NamespacePrefix}:" if self._version == "2009" else ""
+		return f"""{prefix}vendor="{self._vendor}" {prefix}library="{self._library}" {prefix}name="{name}" {prefix}version="1.0\""""
+
+	def WriteComponent(self, name: str, fileSets: int, files: int) -> Path:
+		"""Writes a component with ``fileSets`` file sets of ``files`` files each."""
+		prefix = self._schema.NamespacePrefix
+		lines = [self._Header("component", name), f"\t<{prefix}:fileSets>\n"]
+		for i in range(fileSets):
+			lines.append(f"\t\t<{prefix}:fileSet>\n\t\t\t<{prefix}:name>fileSet{i}</{prefix}:name>\n")
+			for j in range(files):
+				fileType = self._random.choice(FILE_TYPES)
+				lines.append(
+					f"\t\t\t<{prefix}:file>\n"
+					f"\t\t\t\t<{prefix}:name>src/set{i}/file{j}_{self._random.randrange(1 << 32):08x}.src</{prefix}:name>\n"
+					f"\t\t\t\t<{prefix}:fileType>{fileType}</{prefix}:fileType>\n"
+					f"\t\t\t</{prefix}:file>\n"
+				)
+			lines.append(f"\t\t</{prefix}:fileSet>\n")
+		lines.append(f"\t</{prefix}:fileSets>\n</{prefix}:component>\n")
+
+		return self._Write(name, lines)
+
+	def WriteMemoryMap(self, name: str, blocks: int, registers: int, fields: int) -> Path:
+		"""
+		Writes a component with one memory map of ``blocks`` adjacent address blocks with ``registers`` 32-bit registers of
+		``fields`` fields each.
+		"""
+		prefix = self._schema.NamespacePrefix
+		bitWidth = 32 // fields
+		lines = [self._Header("component", name), f"\t<{prefix}:memoryMaps>\n\t\t<{prefix}:memoryMap>\n\t\t\t<{prefix}:name>map</{prefix}:name>\n"]
+		for i in range(blocks):
+			lines.append(
+				f"\t\t\t<{prefix}:addressBlock>\n"
+				f"\t\t\t\t<{prefix}:name>block{i}</{prefix}:name>\n"
+				f"\t\t\t\t<{prefix}:baseAddress>0x{i * registers * 4:X}</{prefix}:baseAddress>\n"
+				f"\t\t\t\t<{prefix}:range>{registers * 4}</{prefix}:range>\n"
+				f"\t\t\t\t<{prefix}:width>32</{prefix}:width>\n"
+			)
+			for j in range(registers):
+				resets = [self._random.randrange(1 << bitWidth) for _ in range(fields)]
+				lines.append(
+					f"\t\t\t\t<{prefix}:register>\n"
+					f"\t\t\t\t\t<{prefix}:name>reg{j}</{prefix}:name>\n"
+					f"\t\t\t\t\t<{prefix}:addressOffset>0x{j * 4:X}</{prefix}:addressOffset>\n"
+					f"\t\t\t\t\t<{prefix}:size>32</{prefix}:size>\n"
+				)
+				if self._version == "2009":
+					# IP-XACT 2009 defines reset values per register.
+					reset = sum(value << (k * bitWidth) for k, value in enumerate(resets))
+					lines.append(f"\t\t\t\t\t<{prefix}:reset><{prefix}:value>0x{reset:X}</{prefix}:value></{prefix}:reset>\n")
+				for k, value in enumerate(resets):
+					reset = "" if self._version == "2009" else f"<{prefix}:resets><{prefix}:reset><{prefix}:value>{value}</{prefix}:value></{prefix}:reset></{prefix}:resets>"
+					width = f"<{prefix}:bitWidth>{bitWidth}</{prefix}:bitWidth>"
+					lines.append(
+						f"\t\t\t\t\t<{prefix}:field><{prefix}:name>f{k}</{prefix}:name><{prefix}:bitOffset>{k * bitWidth}</{prefix}:bitOffset>"
+						f"{width + reset if self._version == '2022' else reset + width}</{prefix}:field>\n"
+					)
+				lines.append(f"\t\t\t\t</{prefix}:register>\n")
+			lines.append(f"\t\t\t</{prefix}:addressBlock>\n")
+		lines.append(f"\t\t</{prefix}:memoryMap>\n\t</{prefix}:memoryMaps>\n</{prefix}:component>\n")
+
+		return self._Write(name, lines)
+
+	def WriteDesign(self, name: str, instances: int, components: List[str]) -> Path:
+		"""Writes a design with ``instances`` component instances referring to randomly chosen components."""
+		prefix = self._schema.NamespacePrefix
+		lines = [self._Header("design", name), f"\t<{prefix}:componentInstances>\n"]
+		for i in range(instances):
+			lines.append(
+				f"\t\t<{prefix}:componentInstance>\n"
+				f"\t\t\t<{prefix}:instanceName>inst{i}</{prefix}:instanceName>\n"
+				f"\t\t\t<{prefix}:componentRef {self._VLNVAttributes(self._random.choice(components))}/>\n"
+				f"\t\t</{prefix}:componentInstance>\n"
+			)
+		lines.append(f"\t</{prefix}:componentInstances>\n</{prefix}:design>\n")
+
+		return self._Write(name, lines)
+
+	def WriteCatalog(self, name: str, components: List[str]) -> Path:
+		"""Writes a catalog referring to components. Catalogs were introduced with IP-XACT 2014."""
+		if self._version == "2009":
+			raise ValueError("IP-XACT 2009 has no catalogs.")
+
+		prefix = self._schema.NamespacePrefix
+		lines = [self._Header("catalog", name), f"\t<{prefix}:components>\n"]
+		for component in components:
+			lines.append(
+				f"\t\t<{prefix}:ipxactFile>\n"
+				f"\t\t\t<{prefix}:vlnv {self._VLNVAttributes(component)}/>\n"
+				f"\t\t\t<{prefix}:name>{component}.xml</{prefix}:name>\n"
+				f"\t\t</{prefix}:ipxactFile>\n"
+			)
+		lines.append(f"\t</{prefix}:components>\n</{prefix}:catalog>\n")
+
+		return self._Write(name, lines)
+
+	def Generate(self, components: int, fileSets: int, files: int, instances: int) -> Dict[str, List[Path]]:
+		"""
+		Writes a corpus of components, one design instantiating them and (since 2014) one catalog listing them.
+
+		:returns: Generated files by document type.
+		"""
+		names = [f"component{i:04}" for i in range(components)]
+		corpus = {
+			"component": [self.WriteComponent(name, fileSets, files) for name in names],
+			"design":    [self.WriteDesign("design", instances, names)],
+			"catalog":   []
+		}
+		if self._version != "2009":
+			corpus["catalog"].append(self.WriteCatalog("catalog", names))
+
+		return corpus
+
+	def _Write(self, name: str, lines: List[str]) -> Path:
+		file = self._directory / f"{name}.xml"
+		file.write_text("".join(lines), encoding="utf-8")
+		return file
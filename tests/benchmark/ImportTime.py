@@ -0,0 +1,80 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___ ______  __    _    ____ _____                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    |_ _|  _ \ \/ /   / \  / ___|_   _|                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \    | || |_) \  /   / _ \| |     | |                                          #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ _ | ||  __//  \  / ___ \ |___  | |                                          #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___|_|  /_/\_\/_/   \_\____| |_|                                          #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2025 Patrick Lehmann - Bötzingen, Germany                                                             #
+# Copyright 2016-2016 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Benchmark guarding the import time of ``pyEDAA.IPXACT`` against a startup budget."""
+from os           import environ
+from subprocess   import run
+from sys          import executable
+from unittest     import TestCase
+
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+BUDGET =  float(environ.get("PYEDAA_IPXACT_IMPORT_BUDGET", "150"))  #: Import time budget in milliseconds.
+REPEAT =  5
+DEFERRED = (
+	"lxml.etree", "pyTooling.Versioning", "asyncio", "concurrent.futures", "xml.sax.saxutils", "urllib.request",
+	"pyEDAA.IPXACT.Schema", "pyEDAA.IPXACT.Resolver", "pyEDAA.IPXACT.Component", "pyEDAA.IPXACT.Design", "pyEDAA.IPXACT.Catalog"
+)  #: Modules, which must not be imported by ``import pyEDAA.IPXACT``.
+
+
+def MeasureImport() -> float:
+	"""Imports the package in a fresh interpreter and returns its cumulative import time in milliseconds."""
+	result = run([executable, "-X", "importtime", "-c", "import pyEDAA.IPXACT"], capture_output=True, text=True, check=True)
+	for line in result.stderr.splitlines():
+		_, cumulative, module = line.split("|")
+		if module.strip() == "pyEDAA.IPXACT":
+			return int(cumulative) / 1e3
+
+	raise AssertionError("No import time reported for 'pyEDAA.IPXACT'.")
+
+
+class ImportTime(TestCase):
+	def test_DeferredModules(self) -> None:
+		result = run(
+			[executable, "-c", "import sys, pyEDAA.IPXACT; print('\\n'.join(sys.modules))"],
+			capture_output=True, text=True, check=True
+		)
+		modules = set(result.stdout.splitlines())
+
+		for module in DEFERRED:
+			self.assertNotIn(module, modules)
+
+	def test_Budget(self) -> None:
+		importTime = min(MeasureImport() for _ in range(REPEAT))
+
+		print()
+		print(f"import pyEDAA.IPXACT: {importTime:6.1f} ms (budget {BUDGET:.0f} ms)")
+		self.assertLess(importTime, BUDGET)
@@ -0,0 +1,86 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___ ______  __    _    ____ _____                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    |_ _|  _ \ \/ /   / \  / ___|_   _|                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \    | || |_) \  /   / _ \| |     | |                                          #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ _ | ||  __//  \  / ___ \ |___  | |                                          #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___|_|  /_/\_\/_/   \_\____| |_|                                          #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2025 Patrick Lehmann - Bötzingen, Germany                                                             #
+# Copyright 2016-2016 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Benchmark the load time of components with lazily built sections.
+
+Components are loaded with the lxml tree kept, so their sections are deferred (lazy), and by a component class, which
+builds all sections while loading (eager). The XML schema validation is skipped, so the model build dominates the load
+time.
+"""
+from pathlib      import Path
+from tempfile     import TemporaryDirectory
+from time         import perf_counter
+from unittest     import TestCase
+
+from pyEDAA.IPXACT           import TreeRetention, ValidationLevel
+from pyEDAA.IPXACT.Component import Component
+
+from tests.benchmark.Corpus import CorpusGenerator
+
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+COMPONENTS = 64
+FILESETS =   16
+FILES =      32
+
+
+class EagerComponent(Component):
+	"""A component, which builds its sections while loading instead of deferring them."""
+
+	_tagTable = Component._tagTable.Derive({name: builder for name, builder in Component._sectionTable.items()})
+
+
+class LazySections(TestCase):
+	def test_LoadTime(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			files = CorpusGenerator(Path(tempDirectory)).Generate(COMPONENTS, FILESETS, FILES, 0)["component"]
+
+			durations = []
+			for componentClass in (Component, EagerComponent):
+				startTime = perf_counter()
+				for file in files:
+					component = componentClass(file, parse=True, retention=TreeRetention.Keep, validation=ValidationLevel.Trusted)
+
+					self.assertEqual(componentClass is EagerComponent, len(component.PendingSections) == 0)
+				durations.append(perf_counter() - startTime)
+
+				self.assertEqual(FILESETS, len(component.FileSets))
+
+			lazy, eager = durations
+			print()
+			print("    lazy       eager    savings")
+			print(f"{lazy * 1e3:7.1f} ms  {eager * 1e3:7.1f} ms  {(1 - lazy / eager) * 100:6.1f} %")
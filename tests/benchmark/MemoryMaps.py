@@ -0,0 +1,103 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___ ______  __    _    ____ _____                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    |_ _|  _ \ \/ /   / \  / ___|_   _|                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \    | || |_) \  /   / _ \| |     | |                                          #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ _ | ||  __//  \  / ___ \ |___  | |                                          #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___|_|  /_/\_\/_/   \_\____| |_|                                          #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2025 Patrick Lehmann - Bötzingen, Germany                                                             #
+# Copyright 2016-2016 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Benchmark the column-wise memory map model on a synthetic component with many registers and fields.
+
+The retained memory of the model is compared with the size of the XML file, and computing all register addresses via
+columns is compared with computing them via view objects.
+"""
+from pathlib      import Path
+from tempfile     import TemporaryDirectory
+from time         import perf_counter
+from tracemalloc  import start, stop, get_traced_memory
+from unittest     import TestCase
+
+from lxml.etree   import parse
+
+from pyEDAA.IPXACT           import __PARSER_CACHE__
+from pyEDAA.IPXACT.MemoryMap import MemoryMapTable
+
+from tests.benchmark.Corpus import CorpusGenerator
+
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+BLOCKS =    16
+REGISTERS = 256
+FIELDS =    8
+
+
+class MemoryMaps(TestCase):
+	def test_Columns(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			file = CorpusGenerator(Path(tempDirectory)).WriteMemoryMap("soc", BLOCKS, REGISTERS, FIELDS)
+			fileSize = file.stat().st_size
+			memoryMapsElement = parse(str(file), parser=__PARSER_CACHE__.GetParser()).getroot()[4]
+
+		startTime = perf_counter()
+		table = MemoryMapTable.FromXml(memoryMapsElement)
+		buildTime = perf_counter() - startTime
+
+		# Tracing allocations slows down building the table, thus the retained memory is measured in a second pass.
+		del table
+		start()
+		table = MemoryMapTable.FromXml(memoryMapsElement)
+		retained, _ = get_traced_memory()
+		stop()
+
+		self.assertEqual(BLOCKS * REGISTERS, table.RegisterCount)
+		self.assertEqual(BLOCKS * REGISTERS * FIELDS, table.FieldCount)
+		self.assertLess(retained, fileSize)
+
+		startTime = perf_counter()
+		baseAddresses = table.Column("addressBlock.baseAddress")
+		offsets = table.Column("register.addressOffset")
+		columnAddresses = [baseAddresses[block] + offset for block, offset in zip(table.Column("register.addressBlock"), offsets)]
+		columnTime = perf_counter() - startTime
+
+		startTime = perf_counter()
+		viewAddresses = [register.Address for memoryMap in table.MemoryMaps for block in memoryMap.AddressBlocks for register in block.Registers]
+		viewTime = perf_counter() - startTime
+
+		self.assertEqual(viewAddresses, columnAddresses)
+
+		print()
+		print(f"registers: {table.RegisterCount}  fields: {table.FieldCount}")
+		print(f"XML file:      {fileSize / 2**20:7.2f} MiB")
+		print(f"columns:       {table.ByteSize / 2**20:7.2f} MiB ({table.ByteSize / table.FieldCount:5.1f} bytes per field)")
+		print(f"retained:      {retained / 2**20:7.2f} MiB")
+		print(f"build:         {buildTime * 1e3:7.1f} ms ({buildTime / table.FieldCount * 1e6:5.2f} us per field)")
+		print(f"addresses:     {columnTime * 1e3:7.1f} ms via columns, {viewTime * 1e3:7.1f} ms via views")
@@ -0,0 +1,139 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___ ______  __    _    ____ _____                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    |_ _|  _ \ \/ /   / \  / ___|_   _|                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \    | || |_) \  /   / _ \| |     | |                                          #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ _ | ||  __//  \  / ___ \ |___  | |                                          #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___|_|  /_/\_\/_/   \_\____| |_|                                          #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2025 Patrick Lehmann - Bötzingen, Germany                                                             #
+# Copyright 2016-2016 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""
+Benchmark suite timing the phases of loading and writing synthetic IP-XACT corpora.
+
+Read, parse, validate, model build and ``ToXml`` are timed separately for IP-XACT 2009, 2014 and 2022. The results are
+printed and, if environment variable ``PYEDAA_IPXACT_BENCHMARK`` names a file, written as JSON into this file.
+"""
+from json         import dump
+from os           import environ
+from pathlib      import Path
+from platform     import python_version
+from tempfile     import TemporaryDirectory
+from time         import perf_counter
+from typing       import Dict
+from unittest     import TestCase
+
+from lxml.etree   import XML, QName, LXML_VERSION
+
+from pyEDAA.IPXACT           import __URI_MAP__, __SCHEMA_CACHE__, __PARSER_CACHE__, __version__, VLNV
+from pyEDAA.IPXACT.Component import Component
+from pyEDAA.IPXACT.Loader    import DetectDocumentType
+
+from tests.benchmark.Corpus import CorpusGenerator
+
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+VERSIONS =   ("2009", "2014", "2022")
+COMPONENTS = 32
+FILESETS =   4
+FILES =      16
+INSTANCES =  256
+PHASES =     ("read", "parse", "validate", "model", "toXml")
+
+
+def MeasureFile(file: Path, times: Dict[str, float]) -> None:
+	"""Loads and writes a file phase by phase and accumulates the phases' durations."""
+	cls = DetectDocumentType(file)
+
+	startTime = perf_counter()
+	content = file.read_bytes()
+	readTime = perf_counter()
+	root = XML(content, parser=__PARSER_CACHE__.GetParser())
+	parseTime = perf_counter()
+	schema = __URI_MAP__[QName(root).namespace]
+	__SCHEMA_CACHE__.GetSchema(schema).assertValid(root)
+	validateTime = perf_counter()
+	document = cls(vlnv=VLNV("benchmark", "benchmark", "benchmark", "1.0"))
+	document._xmlRoot = root
+	document._vlnv, _ = document.ParseVLNVAndDescription()
+	if isinstance(document, Component):
+		document.Materialize()
+	modelTime = perf_counter()
+	document.ToXml(schema)
+	toXmlTime = perf_counter()
+
+	times["read"] +=     readTime - startTime
+	times["parse"] +=    parseTime - readTime
+	times["validate"] += validateTime - parseTime
+	times["model"] +=    modelTime - validateTime
+	times["toXml"] +=    toXmlTime - modelTime
+	times["bytes"] +=    len(content)
+	times["files"] +=    1
+
+
+class Phases(TestCase):
+	def test_Deterministic(self) -> None:
+		with TemporaryDirectory() as tempDirectory1, TemporaryDirectory() as tempDirectory2:
+			file1 = CorpusGenerator(Path(tempDirectory1), "2022", seed=1).WriteComponent("component", 2, 4)
+			file2 = CorpusGenerator(Path(tempDirectory2), "2022", seed=1).WriteComponent("component", 2, 4)
+
+			self.assertEqual(file1.read_bytes(), file2.read_bytes())
+
+	def test_Phases(self) -> None:
+		results = {
+			"pyEDAA.IPXACT": __version__,
+			"python":        python_version(),
+			"lxml":          ".".join(str(part) for part in LXML_VERSION),
+			"corpus":        {"components": COMPONENTS, "fileSets": FILESETS, "files": FILES, "instances": INSTANCES},
+			"versions":      {}
+		}
+
+		print()
+		print("version  document   files    bytes  " + "  ".join(f"{phase:>9}" for phase in PHASES))
+		for version in VERSIONS:
+			__SCHEMA_CACHE__.WarmUp([version])
+			versionResults = results["versions"][version] = {}
+
+			with TemporaryDirectory() as tempDirectory:
+				corpus = CorpusGenerator(Path(tempDirectory), version).Generate(COMPONENTS, FILESETS, FILES, INSTANCES)
+
+				for documentType, files in corpus.items():
+					if len(files) == 0:
+						continue
+
+					times = versionResults[documentType] = dict.fromkeys(PHASES + ("bytes", "files"), 0)
+					for file in files:
+						MeasureFile(file, times)
+
+					self.assertEqual(len(files), times["files"])
+					print(f"{version:7}  {documentType:9}  {times['files']:5}  {times['bytes']:7}  " + "  ".join(f"{times[phase] * 1e3:6.2f} ms" for phase in PHASES))
+
+		if (resultFile := environ.get("PYEDAA_IPXACT_BENCHMARK", None)) is not None:
+			with Path(resultFile).open("w", encoding="utf-8") as fileHandle:
+				dump(results, fileHandle, indent=2)
@@ -0,0 +1,90 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___ ______  __    _    ____ _____                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    |_ _|  _ \ \/ /   / \  / ___|_   _|                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \    | || |_) \  /   / _ \| |     | |                                          #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ _ | ||  __//  \  / ___ \ |___  | |                                          #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___|_|  /_/\_\/_/   \_\____| |_|                                          #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2025 Patrick Lehmann - Bötzingen, Germany                                                             #
+# Copyright 2016-2016 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Micro-benchmark comparing ``QName`` based if/elif dispatch with :class:`~pyEDAA.IPXACT.TagTable` dispatch."""
+from pathlib      import Path
+from timeit       import repeat
+from unittest     import TestCase
+
+from lxml.etree   import QName, parse, _Comment
+
+from pyEDAA.IPXACT.Component import Component
+
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+LOCALNAMES = (
+	"busInterfaces", "indirectInterfaces", "channels", "remapStates", "addressSpaces", "memoryMaps", "model",
+	"componentGenerators", "choices", "fileSets", "whiteboxElements", "cpus", "otherClockDrivers", "resetTypes",
+	"parameters", "assertions"
+)
+
+
+def ChainDispatch(elements) -> int:
+	count = 0
+	for element in elements:
+		elementLocalname = QName(element).localname
+		for localname in LOCALNAMES:
+			if elementLocalname == localname:
+				count += 1
+				break
+
+	return count
+
+
+def TableDispatch(elements) -> int:
+	count = 0
+	table = Component._tagTable
+	for element in elements:
+		if element.tag in table:
+			count += 1
+
+	return count
+
+
+class TagDispatch(TestCase):
+	def test_PerElementOverhead(self) -> None:
+		root = parse(str(Path("tests/Examples/tudortimi-ipxact/SampleComponent.xml"))).getroot()
+		elements = [element for element in root if not isinstance(element, _Comment)] * 1000
+
+		self.assertEqual(ChainDispatch(elements), TableDispatch(elements))
+
+		chain = min(repeat(lambda: ChainDispatch(elements), number=5, repeat=5)) / (5 * len(elements))
+		table = min(repeat(lambda: TableDispatch(elements), number=5, repeat=5)) / (5 * len(elements))
+
+		print()
+		print(f"if/elif chain: {chain * 1e9:6.1f} ns/element")
+		print(f"tag table:     {table * 1e9:6.1f} ns/element")
+		self.assertLess(table, chain)
@@ -0,0 +1,72 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___ ______  __    _    ____ _____                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    |_ _|  _ \ \/ /   / \  / ___|_   _|                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \    | || |_) \  /   / _ \| |     | |                                          #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ _ | ||  __//  \  / ___ \ |___  | |                                          #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___|_|  /_/\_\/_/   \_\____| |_|                                          #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2025 Patrick Lehmann - Bötzingen, Germany                                                             #
+# Copyright 2016-2016 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Benchmark loading a synthetic corpus with 1, 4 and 16 worker threads."""
+from pathlib      import Path
+from tempfile     import TemporaryDirectory
+from time         import perf_counter
+from unittest     import TestCase
+
+from pyEDAA.IPXACT        import __SCHEMA_CACHE__
+from pyEDAA.IPXACT.Loader import BulkLoader
+
+from tests.benchmark.Corpus import CorpusGenerator
+
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+COMPONENTS = 128
+FILESETS =   4
+FILES =      16
+THREADS =    (1, 4, 16)
+
+
+class ThreadedLoading(TestCase):
+	def test_Threads(self) -> None:
+		__SCHEMA_CACHE__.WarmUp(["2022"])
+
+		with TemporaryDirectory() as tempDirectory:
+			files = CorpusGenerator(Path(tempDirectory)).Generate(COMPONENTS, FILESETS, FILES, 0)["component"]
+
+			print()
+			for threads in THREADS:
+				loader = BulkLoader(workers=threads, useProcesses=False)
+
+				startTime = perf_counter()
+				result = loader.Load(files)
+				duration = perf_counter() - startTime
+
+				self.assertEqual(COMPONENTS, len(result))
+				print(f"{threads:2} threads: {duration * 1e3:7.1f} ms ({COMPONENTS / duration:6.0f} files/s)")
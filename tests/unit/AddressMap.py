@@ -0,0 +1,134 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___ ______  __    _    ____ _____                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    |_ _|  _ \ \/ /   / \  / ___|_   _|                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \    | || |_) \  /   / _ \| |     | |                                          #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ _ | ||  __//  \  / ___ \ |___  | |                                          #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___|_|  /_/\_\/_/   \_\____| |_|                                          #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2025 Patrick Lehmann - Bötzingen, Germany                                                             #
+# Copyright 2016-2016 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Testcases for the address map checker."""
+from pathlib      import Path
+from unittest     import TestCase
+
+from pyEDAA.IPXACT            import VLNV, IPXACTException
+from pyEDAA.IPXACT.AddressMap import ConflictKind, AddressMapChecker
+from pyEDAA.IPXACT.Component  import Component
+from pyEDAA.IPXACT.MemoryMap  import MemoryMapTable
+
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Checker(TestCase):
+	def test_Conflicts(self) -> None:
+		table = MemoryMapTable()
+		memoryMap = table.AddMemoryMap("map")
+		table.AddAddressBlock("a", 0x000, 0x100, 32)
+		table.AddRegister("r0", 0x0, 32)
+		table.AddRegister("r1", 0x2, 32)
+		table.AddRegister("r2", 0xFE, 32)
+		table.AddRegister("r3", "OFFSET", 32)
+		table.AddAddressBlock("b", 0x080, 0x100, 32)
+		table.AddAddressBlock("c", 0x400, 0x100, 32)
+		table.AddAddressBlock("d", "BASE", 0x100, 32)
+
+		vlnv = VLNV("VHDL", "PoC", "PoC", "1.0")
+		checker = AddressMapChecker()
+		checker.AddMemoryMap(memoryMap, 0x1000, vlnv)
+		conflicts = checker.Check()
+
+		self.assertEqual(
+			[ConflictKind.BlockOverlap, ConflictKind.RegisterOverlap, ConflictKind.RegisterOutsideBlock, ConflictKind.Gap],
+			[conflict.Kind for conflict in conflicts]
+		)
+		blockOverlap, registerOverlap, outside, gap = conflicts
+		self.assertEqual((0x1080, 0x1100, "map/b", "map/a"), (blockOverlap.Start, blockOverlap.End, blockOverlap.Path, blockOverlap.OtherPath))
+		self.assertEqual((0x1002, 0x1004, "map/a/r1", "map/a/r0"), (registerOverlap.Start, registerOverlap.End, registerOverlap.Path, registerOverlap.OtherPath))
+		self.assertEqual((0x1100, 0x1102, "map/a/r2"), (outside.Start, outside.End, outside.Path))
+		self.assertEqual((0x1180, 0x1400, "map/c", "map/b"), (gap.Start, gap.End, gap.Path, gap.OtherPath))
+		self.assertIs(vlnv, blockOverlap.VLNV)
+		self.assertIn(str(vlnv), str(blockOverlap))
+
+		self.assertEqual(3, len(checker.Check(gaps=False)))
+
+	def test_Components(self) -> None:
+		tables = []
+		for index in range(3):
+			table = MemoryMapTable()
+			table.AddMemoryMap("map")
+			table.AddAddressBlock("registers", 0, 0x1000, 32)
+			tables.append(table)
+
+		checker = AddressMapChecker()
+		vlnvs = [VLNV("VHDL", "PoC", f"ip{index}", "1.0") for index in range(3)]
+		for index, baseAddress in enumerate((0x0000, 0x1000, 0x1800)):
+			checker.AddMemoryMap(tables[index].MemoryMaps[0], baseAddress, vlnvs[index])
+
+		conflicts = checker.Check()
+		self.assertEqual(1, len(conflicts))
+		self.assertEqual((vlnvs[2], vlnvs[1]), (conflicts[0].VLNV, conflicts[0].OtherVLNV))
+
+	def test_AddressUnits(self) -> None:
+		table = MemoryMapTable()
+		memoryMap = table.AddMemoryMap("map", 32)
+
+		with self.assertRaises(IPXACTException):
+			AddressMapChecker().AddMemoryMap(memoryMap)
+		with self.assertRaises(TypeError):
+			AddressMapChecker().AddMemoryMap(table)
+
+		# A 64-bit register spans two 32-bit address units.
+		table.AddAddressBlock("block", 0, 2, 32)
+		table.AddRegister("r0", 0, 64)
+		table.AddRegister("r1", 1, 32)
+		checker = AddressMapChecker(32)
+		checker.AddMemoryMap(memoryMap)
+		self.assertEqual([ConflictKind.RegisterOverlap], [conflict.Kind for conflict in checker.Check()])
+
+	def test_UnresolvedAddressUnits(self) -> None:
+		with self.assertRaises(TypeError):
+			AddressMapChecker(None)
+		with self.assertRaises(TypeError):
+			AddressMapChecker("8")
+		with self.assertRaises(ValueError):
+			AddressMapChecker(0)
+
+		table = MemoryMapTable()
+		memoryMap = table.AddMemoryMap("map", "AUB")
+		self.assertIsNone(memoryMap.AddressUnitBits)
+
+		component = Component(vlnv=VLNV("VHDL", "PoC", "PoC", "1.0"), description="A component.")
+		component.MemoryMaps.append(memoryMap)
+		with self.assertRaises(IPXACTException):
+			AddressMapChecker.CheckComponent(component)
+
+	def test_SampleComponent(self) -> None:
+		component = Component(Path("tests/Examples/tudortimi-ipxact/SampleComponent.xml"), parse=True)
+
+		self.assertEqual([], AddressMapChecker.CheckComponent(component))
@@ -0,0 +1,142 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___ ______  __    _    ____ _____                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    |_ _|  _ \ \/ /   / \  / ___|_   _|                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \    | || |_) \  /   / _ \| |     | |                                          #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ _ | ||  __//  \  / ___ \ |___  | |                                          #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___|_|  /_/\_\/_/   \_\____| |_|                                          #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2025 Patrick Lehmann - Bötzingen, Germany                                                             #
+# Copyright 2016-2016 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Testcases for ``Archive``."""
+from concurrent.futures import ThreadPoolExecutor
+from pathlib            import Path
+from tarfile            import open as openTar
+from tempfile           import TemporaryDirectory
+from unittest           import TestCase
+from zipfile            import ZipFile, ZIP_DEFLATED
+
+from pyEDAA.IPXACT            import IPXACTException
+from pyEDAA.IPXACT.Archive    import Archive
+from pyEDAA.IPXACT.Component  import Component
+from pyEDAA.IPXACT.Repository import CatalogResolver
+
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+EXAMPLES = Path("tests/Examples/tudortimi-ipxact")
+
+
+class Archives(TestCase):
+	def test_ResolveZip(self) -> None:
+		expected = CatalogResolver().ResolveFile(EXAMPLES / "SampleCatalog.xml")
+
+		with TemporaryDirectory() as tempDirectory:
+			archiveFile = Path(tempDirectory) / "ip.zip"
+			with ZipFile(archiveFile, "w", ZIP_DEFLATED) as zipFile:
+				for file in EXAMPLES.glob("*.xml"):
+					zipFile.write(file, f"ip/{file.name}")
+
+			with Archive(archiveFile) as archive:
+				repository = CatalogResolver().ResolveArchive(archive, "ip/SampleCatalog.xml")
+
+				self.assertEqual(len(expected), len(repository))
+				self.assertEqual(sorted(document.VLNV for document in expected), sorted(document.VLNV for document in repository))
+				self.assertIs(repository.Components[0], repository.GetByPath(archive.PathOf("ip/SampleComponent.xml")))
+				self.assertEqual(0, archive.Hits)
+				self.assertLess(archive.Misses, len(archive))
+
+	def test_ConcurrentReads(self) -> None:
+		files = sorted(EXAMPLES.glob("*.xml"))
+
+		with TemporaryDirectory() as tempDirectory:
+			for archiveFile, mode in ((Path(tempDirectory) / "ip.zip", None), (Path(tempDirectory) / "ip.tar.gz", "w:gz")):
+				if mode is None:
+					with ZipFile(archiveFile, "w", ZIP_DEFLATED) as zipFile:
+						for file in files:
+							zipFile.write(file, f"ip/{file.name}")
+				else:
+					with openTar(archiveFile, mode) as tarFile:
+						for file in files:
+							tarFile.add(file, f"ip/{file.name}")
+
+				with Archive(archiveFile) as archive, ThreadPoolExecutor(max_workers=4) as executor:
+					members = [f"ip/{file.name}" for file in files] * 4
+					contents = list(executor.map(archive.Read, members))
+
+					self.assertEqual([file.read_bytes() for file in files] * 4, contents)
+					self.assertEqual(len(members), archive.Hits + archive.Misses)
+					self.assertEqual(sum(file.stat().st_size for file in files), archive.CacheSize)
+
+	def test_ReadTar(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			archiveFile = Path(tempDirectory) / "ip.tar.gz"
+			with openTar(archiveFile, "w:gz") as tarFile:
+				tarFile.add(EXAMPLES / "SampleComponent.xml", "ip/rtl/SampleComponent.xml")
+				tarFile.add(EXAMPLES / "SampleCatalog.xml", "ip/SampleCatalog.xml")
+
+			with Archive(archiveFile) as archive:
+				component = archive.Load("ip/rtl/SampleComponent.xml")
+				self.assertIsInstance(component, Component)
+
+				archive.Read("ip/rtl/SampleComponent.xml")
+				archive.Read("ip/rtl/SampleComponent.xml")
+				self.assertEqual(1, archive.Misses)
+				self.assertEqual(2, archive.Hits)
+
+				file = component.FileSets["VerilogFiles"].Files[0]
+				self.assertEqual("ip/src/component.v", archive.Resolve(str(file.Path), "ip/rtl/SampleComponent.xml"))
+				self.assertEqual(archive.PathOf("ip/src/component.v"), file.Location)
+				self.assertEqual("ip/src/component.v", archive.MemberOf(file.Location))
+				with self.assertRaises(IPXACTException):
+					archive.Resolve("../../outside.xml", "ip/SampleCatalog.xml")
+				with self.assertRaises(IPXACTException):
+					archive.Read("ip/missing.xml")
+
+				# Tar members share the archive's file object, thus interleaved reads must not disturb each other.
+				with archive.Open("ip/SampleCatalog.xml") as catalogStream, archive.Open("ip/rtl/SampleComponent.xml") as componentStream:
+					catalogContent = b""
+					componentContent = b""
+					for _ in range(1000):
+						catalogContent += catalogStream.read(64)
+						componentContent += componentStream.read(64)
+				self.assertEqual((EXAMPLES / "SampleCatalog.xml").read_bytes(), catalogContent)
+				self.assertEqual((EXAMPLES / "SampleComponent.xml").read_bytes(), componentContent)
+
+				# Streamed members are parsed in two passes, thus they must be seekable instead of being read into memory.
+				with archive.Open("ip/rtl/SampleComponent.xml") as componentStream:
+					self.assertTrue(componentStream.seekable())
+					head = componentStream.read(64)
+					componentStream.seek(0)
+					self.assertEqual(0, componentStream.tell())
+					self.assertEqual(head, componentStream.read(64))
+
+				streamed = archive.Load("ip/rtl/SampleComponent.xml", streaming=True)
+				self.assertEqual(archive.PathOf("ip/src/component.v"), streamed.FileSets["VerilogFiles"].Files[0].Location)
+
+				self.assertEqual(["ip/SampleCatalog.xml"], [archive.MemberOf(header.File) for header in archive.ScanHeaders() if header.RootTagName == "catalog"])
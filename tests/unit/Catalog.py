@@ -30,11 +30,14 @@
 # ==================================================================================================================== #
 #
 """Testcase for ``Catalog``."""
+from io       import StringIO
 from pathlib  import Path
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
-from pyEDAA.IPXACT         import VLNV
-from pyEDAA.IPXACT.Catalog import IpxactFile, Catalog
+from pyEDAA.IPXACT           import VLNV
+from pyEDAA.IPXACT.Catalog   import IpxactFile, Catalog
+from pyEDAA.IPXACT.Component import Component
 
 
 if __name__ == "__main__": # pragma: no cover
@@ -56,6 +59,24 @@ class Catalogs(TestCase):
 		self.assertIs(vlnv, catalog.VLNV)
 		self.assertEqual(3, len(catalog.Catalogs))
 
+	def test_AddComponent(self) -> None:
+		catalog = Catalog(Path("tests/Examples/tudortimi-ipxact/SampleCatalog.xml"), parse=True)
+		component = Component(Path("tests/Examples/tudortimi-ipxact/SampleComponent.xml"), parse=True)
+		catalog.AddItem(component)
+		self.assertEqual([component], catalog.Components)
+		self.assertEqual(1, len(catalog.ComponentFiles))
+
+		vlnv = VLNV("VHDL", "PoC", "PoC.io.uart.RX", "1.0")
+		catalog.AddItem(Component(vlnv=vlnv, description="A UART receiver."))
+		references = {ipxactFile.VLNV: ipxactFile.Name for section, ipxactFile in catalog.IterateReferences() if section == "components"}
+		self.assertEqual("SampleComponent.xml", references[component.VLNV])
+		self.assertEqual("PoC.io.uart.RX.xml", references[vlnv])
+
+		catalog = Catalog(Path("tests/Examples/Catalog.xml"), parse=True)
+		catalog.AddItem(component)
+		references = {ipxactFile.VLNV: ipxactFile.Name for section, ipxactFile in catalog.IterateReferences() if section == "components"}
+		self.assertEqual("tudortimi-ipxact/SampleComponent.xml", references[component.VLNV])
+
 	# @mark.xfail(reason="This has a known issue.")
 	def test_ReadFromFile(self) -> None:
 		filePath = Path("tests/Examples/Catalog.xml")
@@ -66,3 +87,29 @@ class Catalogs(TestCase):
 		self.assertEqual("PoC", catalog.VLNV.Name)
 		self.assertEqual("1.0", catalog.VLNV.Version)
 		self.assertEqual(3, len(catalog.Catalogs))
+
+	def test_Sections(self) -> None:
+		filePath = Path("tests/Examples/tudortimi-ipxact/SampleCatalog.xml")
+		catalog = Catalog(filePath, parse=True)
+
+		self.assertEqual(2, len(catalog.AbstractionDefinitions))
+		self.assertEqual(1, len(catalog.ComponentFiles))
+		self.assertEqual(0, len(catalog.Components))
+		self.assertEqual(1, len(catalog.Designs))
+		self.assertEqual(8, len(list(catalog.IterateReferences())))
+
+	def test_WriteXml(self) -> None:
+		filePath = Path("tests/Examples/Catalog.xml")
+		catalog = Catalog(filePath, parse=True)
+
+		buffer = StringIO()
+		catalog.WriteXml(buffer)
+		self.assertEqual(catalog.ToXml(), buffer.getvalue())
+
+		with TemporaryDirectory() as directory:
+			outputPath = Path(directory) / "Catalog.xml"
+			catalog.WriteXml(outputPath)
+			reloaded = Catalog(outputPath, parse=True)
+
+		self.assertEqual(catalog.VLNV, reloaded.VLNV)
+		self.assertEqual(list(catalog.Catalogs), list(reloaded.Catalogs))
@@ -30,11 +30,16 @@
 # ==================================================================================================================== #
 #
 """Testcase for ``VLNV``."""
+from os           import environ
+from pickle       import dumps
+from subprocess   import run
+from sys          import executable
 from unittest     import TestCase
 
 from pyTooling.Versioning import SemanticVersion
 
-from pyEDAA.IPXACT import VLNV
+import pyEDAA.IPXACT
+from pyEDAA.IPXACT import VLNV, EscapeXml, QuoteXmlAttribute
 
 
 if __name__ == "__main__": # pragma: no cover
@@ -56,3 +61,76 @@ class VLNVs(TestCase):
 		self.assertEqual(name, vlnv.Name)
 		self.assertEqual(version, vlnv.Version)
 		self.assertIsInstance(vlnv.Version, SemanticVersion)
+
+	def test_Equality(self) -> None:
+		vlnv1 = VLNV("EDA²", "pyEDAA", "IPXACT", "1.0")
+		vlnv2 = VLNV("EDA²", "pyEDAA", "IPXACT", "1.0.0")
+		vlnv3 = VLNV("EDA²", "pyEDAA", "IPXACT", "1.1")
+
+		self.assertEqual(vlnv1, vlnv2)
+		self.assertEqual(hash(vlnv1), hash(vlnv2))
+		self.assertNotEqual(vlnv1, vlnv3)
+		self.assertEqual(1, len({vlnv1: 1, vlnv2: 2}))
+		self.assertNotEqual(vlnv1, "EDA²:pyEDAA:IPXACT:1.0")
+
+	def test_Ordering(self) -> None:
+		vlnvs = [
+			VLNV("B", "lib", "name", "1.0"),
+			VLNV("A", "lib", "name", "2.0"),
+			VLNV("A", "lib", "name", "1.10"),
+			VLNV("A", "lib", "name", "1.2"),
+		]
+
+		self.assertEqual(["1.2", "1.10", "2.0", "1.0"], [str(vlnv.Version) for vlnv in sorted(vlnvs)])
+		self.assertLess(vlnvs[1], vlnvs[0])
+		self.assertGreaterEqual(vlnvs[0], vlnvs[0])
+
+	def test_Interning(self) -> None:
+		VLNV.EnableInterning()
+		try:
+			vlnv1 = VLNV.Create("EDA²", "pyEDAA", "IPXACT", "1.0")
+			vlnv2 = VLNV.Create("EDA²", "pyEDAA", "IPXACT", "1.0")
+			vlnv3 = VLNV("EDA²", "pyEDAA", "IPXACT", "1.0")
+
+			self.assertIs(vlnv1, vlnv2)
+			self.assertIsNot(vlnv1, vlnv3)
+			self.assertIs(vlnv1, vlnv3.Intern())
+			self.assertIs(vlnv1, VLNV.Create("EDA²", "pyEDAA", "IPXACT", "1.0.0"))
+			self.assertEqual(1, VLNV.InternTableSize())
+		finally:
+			VLNV.DisableInterning()
+
+		self.assertIsNot(VLNV.Create("EDA²", "pyEDAA", "IPXACT", "1.0"), VLNV.Create("EDA²", "pyEDAA", "IPXACT", "1.0"))
+
+
+	def test_PickleAcrossProcesses(self) -> None:
+		# String hashes are randomized per process, so the unpickling process uses another hash seed.
+		script = (
+			"import sys, pickle\n"
+			"from pyEDAA.IPXACT import VLNV\n"
+			"vlnv = pickle.loads(sys.stdin.buffer.read())\n"
+			"fresh = VLNV('EDA²', 'pyEDAA', 'IPXACT', '1.0')\n"
+			"print(vlnv == fresh, hash(vlnv) == hash(fresh), {fresh: True}.get(vlnv, False))\n"
+		)
+		for seed in ("1", "2"):
+			with self.subTest(PYTHONHASHSEED=seed):
+				result = run(
+					[executable, "-c", script], input=dumps(VLNV("EDA²", "pyEDAA", "IPXACT", "1.0")), capture_output=True,
+					env={**environ, "PYTHONHASHSEED": seed}, check=True
+				)
+				self.assertEqual(b"True True True", result.stdout.strip())
+
+
+class Package(TestCase):
+	def test_LazySubmodules(self) -> None:
+		self.assertEqual("pyEDAA.IPXACT.Component", pyEDAA.IPXACT.Component.__name__)
+		self.assertTrue(pyEDAA.IPXACT._IPXACT_2022_INDEX.exists())
+
+		with self.assertRaises(AttributeError):
+			_ = pyEDAA.IPXACT.Unknown
+
+	def test_Escaping(self) -> None:
+		self.assertEqual("a &lt;b&gt; &amp; c", EscapeXml("a <b> & c"))
+		self.assertEqual('"a&#10;b"', QuoteXmlAttribute("a\nb"))
+		self.assertEqual("'a\"b'", QuoteXmlAttribute('a"b'))
+		self.assertEqual('"a&quot;b\'c"', QuoteXmlAttribute("a\"b'c"))
@@ -30,9 +30,15 @@
 # ==================================================================================================================== #
 #
 """Testcase for ``Catalog``."""
-from unittest     import TestCase
+from gzip         import compress
+from io           import BytesIO, RawIOBase
+from mmap         import mmap, ACCESS_READ
+from pathlib      import Path
+from tempfile     import TemporaryDirectory
+from unittest     import IsolatedAsyncioTestCase, TestCase
 
-from pyEDAA.IPXACT           import VLNV
+from pyEDAA.IPXACT           import VLNV, Compression, ValidationLevel, IPXACTException, TreeRetention
+from pyEDAA.IPXACT.Loader    import ReadDocumentHeader
 from pyEDAA.IPXACT.Component import Component
 
 
@@ -47,3 +53,191 @@ class Components(TestCase):
 		vlnv = VLNV("VHDL", "PoC", "PoC", "1.0")
 
 		component = Component(vlnv=vlnv, description="PoC.io.uart.RX")
+
+	def test_WriteXml(self) -> None:
+		component = Component(Path("tests/Examples/tudortimi-ipxact/SampleComponent.xml"), parse=True)
+
+		chunks = list(component.IterateXml())
+		self.assertGreater(len(chunks), 1)
+
+		buffer = BytesIO()
+		component.WriteXml(buffer)
+		self.assertEqual("".join(chunks).encode("utf-8"), buffer.getvalue())
+		self.assertIn(b"<ipxact:fileType>verilogSource</ipxact:fileType>", buffer.getvalue())
+
+
+class AsyncLoading(IsolatedAsyncioTestCase):
+	async def test_LoadAsync(self) -> None:
+		component = await Component.LoadAsync(Path("tests/Examples/tudortimi-ipxact/SampleComponent.xml"))
+
+		self.assertIsInstance(component, Component)
+		self.assertEqual("SampleComponent", component.VLNV.Name)
+		self.assertEqual(2, len(component.FileSets))
+
+
+class _NonSeekableStream(RawIOBase):
+	def __init__(self, content: bytes) -> None:
+		self._stream = BytesIO(content)
+
+	def readable(self) -> bool:
+		return True
+
+	def readinto(self, buffer) -> int:
+		return self._stream.readinto(buffer)
+
+
+class Sources(TestCase):
+	_path = Path("tests/Examples/tudortimi-ipxact/SampleComponent.xml")
+
+	def test_Buffers(self) -> None:
+		content = self._path.read_bytes()
+
+		for source in (content, bytearray(content), memoryview(content), BytesIO(content)):
+			with self.subTest(type(source).__name__):
+				component = Component(source, parse=True)
+
+				self.assertIsNone(component.File)
+				self.assertEqual("SampleComponent", component.VLNV.Name)
+				self.assertEqual(2, len(component.FileSets))
+				self.assertIsNotNone(component.XmlRoot)
+
+	def test_MemoryMap(self) -> None:
+		with self._path.open("rb") as fileHandle:
+			with mmap(fileHandle.fileno(), 0, access=ACCESS_READ) as buffer:
+				component = Component(buffer, parse=True)
+				streamedComponent = Component(buffer, parse=True, streaming=True)
+
+		self.assertEqual(component.VLNV, streamedComponent.VLNV)
+		self.assertEqual(list(component.FileSets), list(streamedComponent.FileSets))
+
+	def test_Streams(self) -> None:
+		component = Component(_NonSeekableStream(self._path.read_bytes()), parse=True, streaming=True)
+		self.assertEqual("SampleComponent", component.VLNV.Name)
+
+		with self.assertRaises(TypeError):
+			Component(str(self._path), parse=True)
+
+
+class Compressed(TestCase):
+	_path = Path("tests/Examples/tudortimi-ipxact/SampleComponent.xml")
+
+	def test_RoundTrip(self) -> None:
+		component = Component(self._path, parse=True)
+
+		with TemporaryDirectory() as directory:
+			for suffix, compression in ((".gz", Compression.Gzip), (".bz2", Compression.Bzip2), (".xz", Compression.Xz)):
+				with self.subTest(compression.name):
+					file = Path(directory) / f"SampleComponent.xml{suffix}"
+					component.WriteXml(file)
+					self.assertIs(compression, Compression.Detect(file))
+
+					loadedComponent = Component(file, parse=True)
+					streamedComponent = Component(file, parse=True, streaming=True)
+
+					self.assertEqual(component.VLNV, loadedComponent.VLNV)
+					self.assertEqual(component.VLNV, streamedComponent.VLNV)
+					self.assertEqual(list(component.FileSets), list(streamedComponent.FileSets))
+					self.assertEqual(component.VLNV, ReadDocumentHeader(file).VLNV)
+
+	def test_Buffer(self) -> None:
+		component = Component(compress(self._path.read_bytes()), parse=True)
+
+		self.assertEqual("SampleComponent", component.VLNV.Name)
+
+
+class Validation(TestCase):
+	_path = Path("tests/Examples/tudortimi-ipxact/SampleComponent.xml")
+
+	def test_Levels(self) -> None:
+		reference = Component(self._path, parse=True)
+		self.assertIs(ValidationLevel.Full, reference.Validation)
+
+		for level in ValidationLevel:
+			for streaming in (False, True):
+				with self.subTest(f"{level.name}, streaming={streaming}"):
+					component = Component(self._path, parse=True, streaming=streaming, validation=level)
+
+					self.assertIs(level, component.Validation)
+					self.assertEqual(reference.VLNV, component.VLNV)
+					self.assertEqual(list(reference.FileSets), list(component.FileSets))
+
+		with self.assertRaises(TypeError):
+			Component(self._path, parse=True, validation="full")
+
+	def test_SchemaOrder(self) -> None:
+		content = self._path.read_bytes()
+		vendor =  b"<ipxact:vendor>accellera.org</ipxact:vendor>"
+		library = b"<ipxact:library>Sample</ipxact:library>"
+		content = content.replace(vendor, b"@").replace(library, vendor).replace(b"@", library)
+
+		with self.assertRaises(IPXACTException):
+			Component(content, parse=True)
+
+		component = Component(content, parse=True, validation=ValidationLevel.Structural)
+		self.assertEqual("accellera.org", component.VLNV.Vendor)
+
+	def test_MissingField(self) -> None:
+		content = self._path.read_bytes().replace(b"<ipxact:library>Sample</ipxact:library>", b"")
+
+		for streaming in (False, True):
+			with self.subTest(f"streaming={streaming}"):
+				with self.assertRaises(IPXACTException):
+					Component(content, parse=True, streaming=streaming, validation=ValidationLevel.Structural)
+
+	def test_ForeignNamespace(self) -> None:
+		content = self._path.read_bytes().replace(
+			b"<ipxact:version>1.0</ipxact:version>",
+			b"<ipxact:version>1.0</ipxact:version><ipxact2022:description xmlns:ipxact2022=\"http://www.accellera.org/XMLSchema/IPXACT/1685-2022\">Foreign</ipxact2022:description>"
+		)
+
+		for streaming in (False, True):
+			with self.subTest(f"streaming={streaming}"):
+				with self.assertRaises(IPXACTException):
+					Component(content, parse=True, streaming=streaming, validation=ValidationLevel.Structural)
+
+
+class LazySections(TestCase):
+	_path = Path("tests/Examples/tudortimi-ipxact/SampleComponent.xml")
+
+	def test_OnAccess(self) -> None:
+		for source in (self._path, self._path.read_bytes()):
+			with self.subTest(type(source).__name__):
+				component = Component(source, parse=True, retention=TreeRetention.Keep)
+				self.assertEqual(["memoryMaps", "fileSets"], component.PendingSections)
+
+				fileSets = component.FileSets
+				self.assertEqual(["memoryMaps"], component.PendingSections)
+				self.assertEqual(["VerilogFiles", "SystemCFiles"], list(fileSets))
+				self.assertIs(fileSets, component.FileSets)
+
+	def test_Eager(self) -> None:
+		for retention in TreeRetention:
+			for source in (self._path, self._path.read_bytes()):
+				with self.subTest(f"{retention.name}, streaming, {type(source).__name__}"):
+					component = Component(source, parse=True, streaming=True, retention=retention)
+					self.assertEqual([], component.PendingSections)
+					self.assertEqual(["VerilogFiles", "SystemCFiles"], list(component.FileSets))
+
+		# Sections aren't built from a re-read file, if the tree isn't kept.
+		for retention in (TreeRetention.Drop, TreeRetention.Cached):
+			for source in (self._path, self._path.read_bytes()):
+				with self.subTest(f"{retention.name}, {type(source).__name__}"):
+					component = Component(source, parse=True, retention=retention)
+					self.assertEqual([], component.PendingSections)
+					self.assertEqual(2, len(component.FileSets))
+
+	def test_Materialize(self) -> None:
+		component = Component(self._path.read_bytes(), parse=True, retention=TreeRetention.Keep)
+		self.assertEqual(["memoryMaps", "fileSets"], component.PendingSections)
+		component.Materialize()
+
+		self.assertEqual([], component.PendingSections)
+		self.assertEqual(2, len(component.FileSets))
+
+	def test_Unavailable(self) -> None:
+		component = Component(self._path.read_bytes(), parse=True, retention=TreeRetention.Keep)
+		component._xmlRoot = None
+
+		with self.assertRaises(IPXACTException):
+			_ = component.FileSets
+		self.assertEqual(["memoryMaps", "fileSets"], component.PendingSections)
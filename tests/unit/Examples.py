@@ -32,7 +32,11 @@
 """Testcases for parsing IP-XACT example files."""
 from pathlib   import Path
 from unittest  import TestCase
+from weakref   import ref
 
+from lxml.etree              import QName
+
+from pyEDAA.IPXACT           import IPXACTException, TreeRetention
 from pyEDAA.IPXACT.Catalog   import Catalog
 from pyEDAA.IPXACT.Component import Component
 from pyEDAA.IPXACT.Design    import Design
@@ -59,3 +63,67 @@ class Tudortimi(TestCase):
 	def test_SampleDesign(self) -> None:
 		ipxactFile = Path("tests/Examples/tudortimi-ipxact/SampleDesign.xml")
 		design = Design(ipxactFile, parse=True)
+
+
+class Streaming(TestCase):
+	def test_SampleCatalog(self) -> None:
+		ipxactFile = Path("tests/Examples/tudortimi-ipxact/SampleCatalog.xml")
+		catalog = Catalog(ipxactFile, parse=True, streaming=True)
+
+		self.assertEqual("SampleCatalog", catalog.VLNV.Name)
+
+	def test_SampleComponent(self) -> None:
+		ipxactFile = Path("tests/Examples/tudortimi-ipxact/SampleComponent.xml")
+		component = Component(ipxactFile, parse=True, streaming=True)
+
+		self.assertEqual("SampleComponent", component.VLNV.Name)
+		self.assertEqual(2, len(component.FileSets))
+		for fs in component.FileSets.values():
+			self.assertEqual(1, len(fs.Files))
+
+	def test_WrongRootElement(self) -> None:
+		ipxactFile = Path("tests/Examples/tudortimi-ipxact/SampleDesign.xml")
+
+		with self.assertRaises(IPXACTException):
+			Component(ipxactFile, parse=True, streaming=True)
+
+
+class Retention(TestCase):
+	def test_Keep(self) -> None:
+		ipxactFile = Path("tests/Examples/tudortimi-ipxact/SampleComponent.xml")
+		component = Component(ipxactFile, parse=True)
+
+		self.assertIs(TreeRetention.Keep, component.Retention)
+		self.assertIs(component.XmlRoot, component.XmlRoot)
+
+	def test_Drop(self) -> None:
+		ipxactFile = Path("tests/Examples/tudortimi-ipxact/SampleComponent.xml")
+		component = Component(ipxactFile, parse=True, retention=TreeRetention.Drop)
+
+		self.assertIsNone(component._xmlRoot)
+		self.assertEqual("component", QName(component.XmlRoot).localname)
+		self.assertIsNone(component._xmlRoot)
+
+	def test_Cached(self) -> None:
+		ipxactFile = Path("tests/Examples/tudortimi-ipxact/SampleComponent.xml")
+		component = Component(ipxactFile, parse=True, retention=TreeRetention.Cached)
+
+		self.assertIsNone(component._xmlRoot)
+		self.assertIs(component.XmlRoot, component.XmlRoot)
+
+		# The tree cache holds strong references, because lxml elements can't be weakly referenced.
+		with self.assertRaises(TypeError):
+			ref(component.XmlRoot)
+
+	def test_CachedBuffer(self) -> None:
+		ipxactFile = Path("tests/Examples/tudortimi-ipxact/SampleComponent.xml")
+		component = Component(ipxactFile.read_bytes(), parse=True, retention=TreeRetention.Cached)
+
+		# Without a path, the tree can't be cached nor re-read, thus it's kept.
+		self.assertIsNotNone(component._xmlRoot)
+		xmlRoot = component.XmlRoot
+		self.assertIs(xmlRoot, component.XmlRoot)
+
+		component._AssignFile(ipxactFile)
+		self.assertIsNone(component._xmlRoot)
+		self.assertIs(xmlRoot, component.XmlRoot)
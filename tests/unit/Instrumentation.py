@@ -0,0 +1,129 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___ ______  __    _    ____ _____                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    |_ _|  _ \ \/ /   / \  / ___|_   _|                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \    | || |_) \  /   / _ \| |     | |                                          #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ _ | ||  __//  \  / ___ \ |___  | |                                          #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___|_|  /_/\_\/_/   \_\____| |_|                                          #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2025 Patrick Lehmann - Bötzingen, Germany                                                             #
+# Copyright 2016-2016 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Testcases for ``LoadStatistics``."""
+from collections import Counter
+from pathlib     import Path
+from tempfile    import TemporaryDirectory
+from unittest    import TestCase
+
+from pyEDAA.IPXACT                 import RootElement, IPXACTException, TreeRetention
+from pyEDAA.IPXACT.Component       import Component
+from pyEDAA.IPXACT.Instrumentation import LoadStatistics
+from pyEDAA.IPXACT.Loader          import BulkLoader
+
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+COMPONENT = "{http://www.accellera.org/XMLSchema/IPXACT/1685-2014}component"
+BUS_INTERFACES = "{http://www.accellera.org/XMLSchema/IPXACT/1685-2014}busInterfaces"
+
+
+class Instrumentation(TestCase):
+	_path = Path("tests/Examples/tudortimi-ipxact/SampleComponent.xml")
+
+	def test_Disabled(self) -> None:
+		component = Component(self._path, parse=True)
+
+		self.assertIsNone(RootElement._instrumentation)
+		self.assertIsNone(component.Statistics)
+
+	def test_Load(self) -> None:
+		with LoadStatistics() as statistics:
+			component = Component(self._path, parse=True)
+		self.assertIsNone(RootElement._instrumentation)
+
+		documentStatistics = component.Statistics
+		self.assertEqual(self._path, documentStatistics.File)
+		self.assertEqual(self._path.stat().st_size, documentStatistics.BytesRead)
+		self.assertEqual(1, documentStatistics.ElementCounts[COMPONENT])
+		self.assertEqual(1, documentStatistics.SkippedSections[BUS_INTERFACES])
+		for phase in ("read", "parse", "schema", "validate", "model"):
+			self.assertGreater(documentStatistics.WallTimes[phase], 0.0, phase)
+
+		self.assertEqual(1, statistics.Documents)
+		self.assertEqual(0, statistics.Failed)
+		self.assertEqual(documentStatistics.ElementCounts, Counter(element.tag for element in component.XmlRoot.iter() if isinstance(element.tag, str)))
+		self.assertEqual(documentStatistics.BytesRead, statistics.BytesRead)
+		self.assertEqual(documentStatistics.ElementCounts, statistics.ElementCounts)
+
+	def test_ReRead(self) -> None:
+		with LoadStatistics() as statistics:
+			component = Component(self._path, parse=True, retention=TreeRetention.Drop)
+
+		documentStatistics = component.Statistics
+		elementCounts = Counter(documentStatistics.ElementCounts)
+		wallTimes = dict(documentStatistics.WallTimes)
+		cpuTimes = dict(documentStatistics.CpuTimes)
+		self.assertIsNotNone(component.XmlRoot)
+		self.assertEqual(elementCounts, documentStatistics.ElementCounts)
+		self.assertEqual(statistics.BytesRead, documentStatistics.BytesRead)
+		self.assertEqual(wallTimes, documentStatistics.WallTimes)
+		self.assertEqual(cpuTimes, documentStatistics.CpuTimes)
+
+	def test_Streaming(self) -> None:
+		with LoadStatistics():
+			component = Component(self._path, parse=True, streaming=True)
+			fullComponent = Component(self._path, parse=True)
+
+		self.assertEqual(fullComponent.Statistics.ElementCounts, component.Statistics.ElementCounts)
+		self.assertEqual(fullComponent.Statistics.SkippedSections, component.Statistics.SkippedSections)
+		self.assertGreater(component.Statistics.WallTimes["model"], 0.0)
+
+	def test_BulkLoad(self) -> None:
+		documents = []
+		with LoadStatistics(callback=documents.append) as statistics:
+			result = BulkLoader(workers=2, useProcesses=False).LoadDirectory(Path("tests/Examples"))
+
+		self.assertEqual(len(result), statistics.Documents)
+		self.assertEqual(len(result) + statistics.Failed, len(documents))
+		self.assertEqual(statistics.Failed, sum(document.Failed for document in documents))
+		self.assertEqual(sum(document.BytesRead for document in documents), statistics.BytesRead)
+
+	def test_Failed(self) -> None:
+		documents = []
+		with TemporaryDirectory() as directory:
+			path = Path(directory) / "Invalid.xml"
+			path.write_bytes(self._path.read_bytes().replace(b"<ipxact:vendor>", b"<ipxact:vendor2>", 1).replace(b"</ipxact:vendor>", b"</ipxact:vendor2>", 1))
+
+			with LoadStatistics(callback=documents.append) as statistics:
+				with self.assertRaises(IPXACTException):
+					Component(path, parse=True)
+
+		self.assertEqual(0, statistics.Documents)
+		self.assertEqual(1, statistics.Failed)
+		self.assertTrue(documents[0].Failed)
+		self.assertEqual(path, documents[0].File)
+		self.assertGreater(statistics.WallTimes["validate"], 0.0)
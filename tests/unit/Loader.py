@@ -0,0 +1,137 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___ ______  __    _    ____ _____                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    |_ _|  _ \ \/ /   / \  / ___|_   _|                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \    | || |_) \  /   / _ \| |     | |                                          #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ _ | ||  __//  \  / ___ \ |___  | |                                          #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___|_|  /_/\_\/_/   \_\____| |_|                                          #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2025 Patrick Lehmann - Bötzingen, Germany                                                             #
+# Copyright 2016-2016 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Testcases for ``BulkLoader``."""
+from gzip            import compress as compressGzip
+from lzma            import compress as compressXz
+from multiprocessing import get_context
+from pathlib         import Path
+from tempfile        import TemporaryDirectory
+from unittest        import TestCase
+
+from pyEDAA.IPXACT.Catalog   import Catalog
+from pyEDAA.IPXACT.Component import Component
+from pyEDAA.IPXACT           import VLNV
+from pyEDAA.IPXACT.Loader    import BulkLoader, DetectDocumentType, ReadDocumentHeader, ScanDirectory
+
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Detection(TestCase):
+	def test_Component(self) -> None:
+		self.assertIs(Component, DetectDocumentType(Path("tests/Examples/tudortimi-ipxact/SampleComponent.xml")))
+
+	def test_Catalog(self) -> None:
+		self.assertIs(Catalog, DetectDocumentType(Path("tests/Examples/Catalog.xml")))
+
+	def test_Unsupported(self) -> None:
+		self.assertIsNone(DetectDocumentType(Path("tests/Examples/tudortimi-ipxact/SampleAbstractor.xml")))
+
+
+class Headers(TestCase):
+	def test_Component(self) -> None:
+		header = ReadDocumentHeader(Path("tests/Examples/tudortimi-ipxact/SampleComponent.xml"))
+
+		self.assertIs(Component, header.DocumentType)
+		self.assertEqual("component", header.RootTagName)
+		self.assertEqual(2014, header.Schema.Version)
+		self.assertEqual(VLNV("accellera.org", "Sample", "SampleComponent", "1.0"), header.VLNV)
+		self.assertIsNone(header.Description)
+
+	def test_Catalog(self) -> None:
+		header = ReadDocumentHeader(Path("tests/Examples/Catalog.xml"))
+
+		self.assertIs(Catalog, header.DocumentType)
+		self.assertEqual(VLNV("VHDL", "PoC", "PoC", "1.0"), header.VLNV)
+		self.assertEqual("IP Core Library", header.Description)
+
+	def test_ScanDirectory(self) -> None:
+		headers = list(ScanDirectory(Path("tests/Examples")))
+
+		self.assertEqual(6, len(headers))
+		self.assertIn("SampleComponent", [header.VLNV.Name for header in headers])
+
+
+class BulkLoading(TestCase):
+	def _CheckResult(self, loader: BulkLoader) -> None:
+		directory = Path("tests/Examples")
+		result = loader.LoadDirectory(directory)
+
+		component = result.Documents[directory / "tudortimi-ipxact/SampleComponent.xml"]
+		self.assertIsInstance(component, Component)
+		self.assertEqual(2, len(component.FileSets))
+		self.assertIsInstance(result.Documents[directory / "Catalog.xml"], Catalog)
+		self.assertIn(directory / "tudortimi-ipxact/SampleAbstractor.xml", result.Skipped)
+		self.assertEqual(10, len(result.Documents) + len(result.Errors) + len(result.Skipped))
+
+	def test_Threads(self) -> None:
+		self._CheckResult(BulkLoader(workers=2, useProcesses=False))
+
+	def test_Processes(self) -> None:
+		self._CheckResult(BulkLoader(workers=2, useProcesses=True))
+
+	def test_SpawnedProcesses(self) -> None:
+		# Spawned workers use their own hash seed, so VLNVs must be equal to and hash like VLNVs of this process.
+		file = Path("tests/Examples/tudortimi-ipxact/SampleComponent.xml")
+		result = BulkLoader(workers=1, useProcesses=True, mpContext=get_context("spawn")).Load([file])
+
+		vlnv = VLNV("accellera.org", "Sample", "SampleComponent", "1.0")
+		self.assertEqual(vlnv, result.Documents[file].VLNV)
+		self.assertIn(result.Documents[file].VLNV, {vlnv})
+
+	def test_MissingFile(self) -> None:
+		file = Path("tests/Examples/missing.xml")
+		result = BulkLoader(workers=1, useProcesses=False).Load([file])
+
+		self.assertIn(file, result.Errors)
+
+	def test_CompressedFiles(self) -> None:
+		content = Path("tests/Examples/tudortimi-ipxact/SampleComponent.xml").read_bytes()
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			(directory / "plain.xml").write_bytes(content)
+			(directory / "component.xml.gz").write_bytes(compressGzip(content))
+			(directory / "component.xml.xz").write_bytes(compressXz(content))
+
+			self.assertEqual(3, len(list(ScanDirectory(directory))))
+			for streaming in (False, True):
+				with self.subTest(streaming=streaming):
+					result = BulkLoader(workers=1, useProcesses=False, streaming=streaming).LoadDirectory(directory)
+
+					self.assertEqual({}, result.Errors)
+					self.assertEqual(3, len(result))
+					for file, component in result.Documents.items():
+						self.assertEqual(file, component.File)
+						self.assertEqual(2, len(component.FileSets))
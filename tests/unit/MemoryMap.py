@@ -0,0 +1,184 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___ ______  __    _    ____ _____                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    |_ _|  _ \ \/ /   / \  / ___|_   _|                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \    | || |_) \  /   / _ \| |     | |                                          #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ _ | ||  __//  \  / ___ \ |___  | |                                          #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___|_|  /_/\_\/_/   \_\____| |_|                                          #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2025 Patrick Lehmann - Bötzingen, Germany                                                             #
+# Copyright 2016-2016 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Testcases for the column-wise memory map model."""
+from pathlib      import Path
+from unittest     import TestCase
+
+from lxml.etree   import XML
+
+from pyEDAA.IPXACT           import __VERSION_TABLE__, VLNV, SchemaCache, IPXACTException
+from pyEDAA.IPXACT.Component import Component
+from pyEDAA.IPXACT.MemoryMap import ParseInteger, AccessType, MemoryMapTable
+
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Integers(TestCase):
+	def test_Literals(self) -> None:
+		self.assertEqual(42, ParseInteger("42"))
+		self.assertEqual(0x1F, ParseInteger("0x1F"))
+		self.assertEqual(0x1F, ParseInteger("#1F"))
+		self.assertEqual(0x1F, ParseInteger("'h1F"))
+		self.assertEqual(5, ParseInteger("3'b101"))
+		self.assertEqual(4096, ParseInteger("4k"))
+		self.assertEqual(10, ParseInteger("010"))
+
+	def test_Expressions(self) -> None:
+		self.assertEqual(1024, ParseInteger("2**10"))
+		self.assertEqual(12, ParseInteger("(1 << 3) + 4"))
+		self.assertIsNone(ParseInteger("WIDTH - 1"))
+		self.assertIsNone(ParseInteger("2**100000"))
+		self.assertIsNone(ParseInteger("((2**256)**256)**256"))
+		self.assertIsNone(ParseInteger("(((2**256)**256)**256)**256"))
+		self.assertEqual(1 << 4095, ParseInteger("(2**63)**65"))
+		self.assertIsNone(ParseInteger(None))
+
+
+class Table(TestCase):
+	def test_Build(self) -> None:
+		table = MemoryMapTable()
+
+		with self.assertRaises(IPXACTException):
+			table.AddRegister("orphan", 0, 32)
+
+		memoryMap = table.AddMemoryMap("map")
+		block = table.AddAddressBlock("block", 0x1000, 0x100, 32, AccessType.ReadWrite)
+		control = table.AddRegister("control", 0x4, 32, reset=0x8000_0001)
+		table.AddField("enable", 0, 1, reset=1)
+		table.AddField("mode", 1, "MODE_WIDTH")
+		status = table.AddRegister("status", "STATUS_OFFSET", 32, AccessType.ReadOnly)
+
+		self.assertEqual(1, table.MemoryMapCount)
+		self.assertEqual(2, table.RegisterCount)
+		self.assertEqual(["block"], [b.Name for b in memoryMap.AddressBlocks])
+		self.assertEqual(["control", "status"], [r.Name for r in block.Registers])
+		self.assertEqual(0x1004, control.Address)
+		self.assertEqual(0x8000_0001, control.Reset)
+		self.assertIsNone(status.Address)
+		self.assertIsNone(status.Reset)
+		self.assertEqual("STATUS_OFFSET", status.Expression("addressOffset"))
+		self.assertEqual(["enable", "mode"], [f.Name for f in control.Fields])
+		self.assertIsNone(control.Fields[1].BitWidth)
+		self.assertEqual(AccessType.ReadWrite, control.Fields[1].EffectiveAccess)
+
+	def test_Columns(self) -> None:
+		table = MemoryMapTable()
+		table.AddMemoryMap("map")
+		table.AddAddressBlock("block", 0, 0x100, 32)
+		for index in range(4):
+			table.AddRegister(f"r{index}", 4 * index, 32)
+
+		offsets = table.Column("register.addressOffset")
+		self.assertEqual([0, 4, 8, 12], offsets.tolist())
+		self.assertTrue(offsets.readonly)
+		self.assertEqual([0, 0, 0, 0], table.Column("register.addressBlock").tolist())
+		self.assertGreater(table.ByteSize, 0)
+
+		with self.assertRaises(KeyError):
+			table.Column("register.unknown")
+
+
+class SampleComponent(TestCase):
+	def test_MemoryMaps(self) -> None:
+		component = Component(Path("tests/Examples/tudortimi-ipxact/SampleComponent.xml"), parse=True)
+
+		self.assertEqual(
+			["SimpleMapWithBlock", "SimpleMapWithBank", "SimpleMapWithSubspace", "MapForMemory"],
+			[memoryMap.Name for memoryMap in component.MemoryMaps]
+		)
+
+		block = component.MemoryMaps[0].AddressBlocks[0]
+		self.assertEqual(1024, block.Range)
+		self.assertEqual(AccessType.ReadWrite, block.Access)
+
+		registers = {register.Name: register for register in block.Registers}
+		basicRegister = registers["BasicRegister"]
+		self.assertEqual(0x4, basicRegister.Address)
+		# Fields F3 and F4 have no reset value, thus the register has none.
+		self.assertIsNone(basicRegister.Reset)
+		self.assertEqual([0, 0, None, None], [field.Reset for field in basicRegister.Fields])
+		self.assertEqual(AccessType.WriteOnce, basicRegister.Fields[0].Access)
+		self.assertEqual(AccessType.ReadWriteOnce, basicRegister.Fields[1].EffectiveAccess)
+		self.assertEqual(0x200, registers["RegArrayEntry"].Address)
+
+
+	def test_ComposedReset(self) -> None:
+		def field(name: str, bitOffset: int, reset: str = "") -> str:
+			resets = f"<ipxact:resets><ipxact:reset><ipxact:value>{reset}</ipxact:value></ipxact:reset></ipxact:resets>" if reset else ""
+			return f"<ipxact:field><ipxact:name>{name}</ipxact:name><ipxact:bitOffset>{bitOffset}</ipxact:bitOffset>{resets}<ipxact:bitWidth>4</ipxact:bitWidth></ipxact:field>"
+
+		def register(name: str, *fields: str) -> str:
+			return f"<ipxact:register><ipxact:name>{name}</ipxact:name><ipxact:addressOffset>0</ipxact:addressOffset><ipxact:size>8</ipxact:size>{''.join(fields)}</ipxact:register>"
+
+		table = MemoryMapTable.FromXml(XML(
+			"<ipxact:memoryMaps xmlns:ipxact='http://www.accellera.org/XMLSchema/IPXACT/1685-2014'><ipxact:memoryMap>"
+			"<ipxact:name>map</ipxact:name><ipxact:addressBlock><ipxact:name>block</ipxact:name>"
+			f"{register('complete', field('low', 0, '3'), field('high', 4, '5'))}"
+			f"{register('partial', field('low', 0, '3'), field('high', 4))}"
+			"</ipxact:addressBlock></ipxact:memoryMap></ipxact:memoryMaps>"
+		))
+
+		complete, partial = table.MemoryMaps[0].AddressBlocks[0].Registers
+		self.assertEqual(0x53, complete.Reset)
+		self.assertIsNone(partial.Reset)
+		self.assertEqual([3, None], [field.Reset for field in partial.Fields])
+
+
+class Writer(TestCase):
+	def test_RoundTrip(self) -> None:
+		table = MemoryMapTable()
+		table.AddMemoryMap("map")
+		table.AddAddressBlock("block", 0x1000, 0x100, 32, AccessType.ReadWrite)
+		table.AddRegister("control", 0x4, 32, AccessType.ReadWrite, reset=0x31)
+		table.AddField("enable", 0, 1, reset=1)
+		table.AddField("mode", 4, 4, AccessType.ReadOnly, reset=3)
+
+		component = Component(vlnv=VLNV("VHDL", "PoC", "PoC", "1.0"))
+		component.AddItem(table.MemoryMaps[0])
+
+		cache = SchemaCache()
+		for version in ("2009", "2014", "2022"):
+			with self.subTest(version=version):
+				schema = __VERSION_TABLE__[version]
+				root = XML(component.ToXml(schema).encode("utf-8"))
+				cache.GetSchema(schema).assertValid(root)
+
+				memoryMaps = root.find(f"{{{schema.SchemaUri}}}memoryMaps")
+				register = MemoryMapTable.FromXml(memoryMaps).MemoryMaps[0].AddressBlocks[0].Registers[0]
+				self.assertEqual(0x1004, register.Address)
+				self.assertEqual(0x31, register.Reset)
+				self.assertEqual([1, 3], [field.Reset for field in register.Fields])
+				self.assertEqual(AccessType.ReadOnly, register.Fields[1].Access)
@@ -0,0 +1,180 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___ ______  __    _    ____ _____                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    |_ _|  _ \ \/ /   / \  / ___|_   _|                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \    | || |_) \  /   / _ \| |     | |                                          #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ _ | ||  __//  \  / ___ \ |___  | |                                          #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___|_|  /_/\_\/_/   \_\____| |_|                                          #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2025 Patrick Lehmann - Bötzingen, Germany                                                             #
+# Copyright 2016-2016 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Testcases for ``Repository`` and ``CatalogResolver``."""
+from asyncio  import CancelledError, create_task, sleep
+from pathlib  import Path
+from tempfile import TemporaryDirectory
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from pyEDAA.IPXACT            import VLNV
+from pyEDAA.IPXACT.Component  import Component
+from pyEDAA.IPXACT.Repository import CatalogResolver, VLNVIndex
+
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+CATALOG = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<ipxact:catalog xmlns:ipxact="http://www.accellera.org/XMLSchema/IPXACT/1685-2022">
+	<ipxact:vendor>VHDL</ipxact:vendor>
+	<ipxact:library>PoC</ipxact:library>
+	<ipxact:name>{name}</ipxact:name>
+	<ipxact:version>1.0</ipxact:version>
+	<ipxact:catalogs>
+		<ipxact:ipxactFile>
+			<ipxact:vlnv vendor="VHDL" library="PoC" name="{reference}" version="1.0"/>
+			<ipxact:name>{reference}.xml</ipxact:name>
+		</ipxact:ipxactFile>
+	</ipxact:catalogs>
+</ipxact:catalog>
+"""
+
+
+class Resolving(TestCase):
+	def test_SampleCatalog(self) -> None:
+		repository = CatalogResolver(workers=4).ResolveFile(Path("tests/Examples/tudortimi-ipxact/SampleCatalog.xml"))
+
+		component = repository.GetByVLNV(VLNV("accellera.org", "Sample", "SampleComponent", "1.0"))
+		self.assertIsInstance(component, Component)
+		self.assertIs(component, repository.GetByPath(Path("tests/Examples/tudortimi-ipxact/SampleComponent.xml")))
+		self.assertEqual(1, len(repository.Components))
+		self.assertEqual(3, len(repository.Unsupported))
+		self.assertEqual(0, len(repository.Cycles))
+
+	def test_Cycle(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			(directory / "A.xml").write_text(CATALOG.format(name="A", reference="B"), encoding="utf-8")
+			(directory / "B.xml").write_text(CATALOG.format(name="B", reference="A"), encoding="utf-8")
+
+			repository = CatalogResolver(workers=2).ResolveFile(directory / "A.xml")
+
+			self.assertEqual(2, len(repository))
+			self.assertEqual(0, len(repository.Errors))
+			self.assertEqual(1, len(repository.Cycles))
+			self.assertEqual(("A.xml", "B.xml", "A.xml"), tuple(path.name for path in repository.Cycles[0]))
+
+	def test_MissingReference(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			(directory / "A.xml").write_text(CATALOG.format(name="A", reference="B"), encoding="utf-8")
+
+			repository = CatalogResolver(workers=2).ResolveFile(directory / "A.xml")
+
+			self.assertEqual(1, len(repository))
+			self.assertIn((directory / "B.xml").resolve(), repository.Errors)
+
+
+class AsyncResolving(IsolatedAsyncioTestCase):
+	async def test_SampleCatalog(self) -> None:
+		repository = await CatalogResolver(workers=4).ResolveFileAsync(Path("tests/Examples/tudortimi-ipxact/SampleCatalog.xml"))
+
+		self.assertIsInstance(repository.GetByVLNV(VLNV("accellera.org", "Sample", "SampleComponent", "1.0")), Component)
+		self.assertEqual(1, len(repository.Components))
+		self.assertEqual(3, len(repository.Unsupported))
+
+	async def test_Cycle(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			(directory / "A.xml").write_text(CATALOG.format(name="A", reference="B"), encoding="utf-8")
+			(directory / "B.xml").write_text(CATALOG.format(name="B", reference="A"), encoding="utf-8")
+
+			repository = await CatalogResolver(workers=1).ResolveFileAsync(directory / "A.xml")
+
+			self.assertEqual(2, len(repository))
+			self.assertEqual(1, len(repository.Cycles))
+
+	async def test_Cancel(self) -> None:
+		task = create_task(CatalogResolver(workers=1).ResolveFileAsync(Path("tests/Examples/tudortimi-ipxact/SampleCatalog.xml")))
+		await sleep(0)
+		task.cancel()
+
+		with self.assertRaises(CancelledError):
+			await task
+
+
+class Indexing(TestCase):
+	def _CreateIndex(self) -> VLNVIndex:
+		index = VLNVIndex()
+		for vendor, library, name, version in (
+			("A", "lib1", "uart", "1.0"),
+			("A", "lib1", "uart", "1.10"),
+			("A", "lib1", "uart", "1.2"),
+			("A", "lib1", "spi",  "2.0"),
+			("A", "lib2", "i2c",  "1.0"),
+			("B", "lib1", "uart", "3.0"),
+		):
+			index.Add(Component(vlnv=VLNV(vendor, library, name, version), description=name))
+
+		return index
+
+	def test_Lookup(self) -> None:
+		index = self._CreateIndex()
+
+		self.assertEqual(6, len(index))
+		self.assertIn(VLNV("A", "lib1", "uart", "1.2"), index)
+		self.assertIsNone(index.Get(VLNV("A", "lib1", "uart", "9.9")))
+		self.assertEqual(["A", "B"], index.Vendors)
+		self.assertEqual(["lib1", "lib2"], index.Libraries("A"))
+		self.assertEqual(["spi", "uart"], index.Names("A", "lib1"))
+
+		with self.assertRaises(ValueError):
+			index.Add(Component(vlnv=VLNV("A", "lib1", "uart", "1.2.0"), description="uart"))
+
+	def test_Latest(self) -> None:
+		index = self._CreateIndex()
+
+		self.assertEqual("1.10", str(index.GetLatest("A", "lib1", "uart").VLNV.Version))
+		self.assertIsNone(index.GetLatest("A", "lib1", "can"))
+
+	def test_Range(self) -> None:
+		index = self._CreateIndex()
+
+		self.assertEqual(["1.2", "1.10"], [str(c.VLNV.Version) for c in index.GetVersions("A", "lib1", "uart", minimum="1.1")])
+		self.assertEqual(["1.0", "1.2"], [str(c.VLNV.Version) for c in index.GetVersions("A", "lib1", "uart", maximum="1.10", includeMaximum=False)])
+
+	def test_Prefix(self) -> None:
+		index = self._CreateIndex()
+
+		self.assertEqual(["spi", "uart", "uart", "uart", "i2c"], [c.VLNV.Name for c in index.IterateVendor("A")])
+		self.assertEqual(["uart"], [c.VLNV.Name for c in index.IterateLibrary("B", "lib1")])
+
+	def test_Remove(self) -> None:
+		index = self._CreateIndex()
+		index.Remove(VLNV("B", "lib1", "uart", "3.0"))
+
+		self.assertEqual(["A"], index.Vendors)
+		self.assertEqual(5, len(index))
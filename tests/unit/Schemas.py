@@ -30,11 +30,15 @@
 # ==================================================================================================================== #
 #
 """Testcases for IP-XACT XSD schema files."""
-from unittest import TestCase
+from pathlib   import Path
+from tempfile  import TemporaryDirectory
+from threading import Thread
+from unittest  import TestCase
 
 from lxml.etree    import XMLParser, parse, XMLSchema
 
-from pyEDAA.IPXACT import __VERSION_TABLE__, __DEFAULT_VERSION__, __DEFAULT_SCHEMA__
+from pyEDAA.IPXACT import __VERSION_TABLE__, __DEFAULT_VERSION__, __DEFAULT_SCHEMA__, SchemaCache, ParserCache, SchemaResolver, IPXACTSchema
+from pyEDAA.IPXACT import IPXACTException
 
 if __name__ == "__main__": # pragma: no cover
 	print("ERROR: you called a testcase declaration file as an executable module.")
@@ -61,3 +65,135 @@ class CheckPaths(TestCase):
 				schemaRoot = parse(schema.LocalPath, schemaParser)
 
 				ipxactSchema = XMLSchema(schemaRoot)
+
+
+class Caching(TestCase):
+	def test_GetSchema(self) -> None:
+		cache = SchemaCache()
+
+		schema1 = cache.GetSchema(__DEFAULT_SCHEMA__)
+		schema2 = cache.GetSchema(__DEFAULT_SCHEMA__)
+
+		self.assertIs(schema1, schema2)
+		self.assertIn(__DEFAULT_SCHEMA__, cache)
+		self.assertEqual(1, cache.Misses)
+		self.assertEqual(1, cache.Hits)
+		self.assertGreater(cache.CompileTime, 0.0)
+
+	def test_WarmUp(self) -> None:
+		cache = SchemaCache()
+		cache.WarmUp(["2014", "2022"])
+
+		self.assertEqual(2, len(cache))
+		self.assertEqual(2, cache.Misses)
+		self.assertEqual(0, cache.Hits)
+
+		cache.GetSchema(__VERSION_TABLE__["2014"])
+		self.assertEqual(1, cache.Hits)
+
+		cache.Clear()
+		self.assertEqual(0, len(cache))
+		self.assertEqual(0, cache.Hits)
+
+	def test_SchemaPerThread(self) -> None:
+		cache = SchemaCache()
+		schema = cache.GetSchema(__DEFAULT_SCHEMA__)
+
+		schemas = []
+		thread = Thread(target=lambda: schemas.append(cache.GetSchema(__DEFAULT_SCHEMA__)))
+		thread.start()
+		thread.join()
+
+		self.assertIsNot(schema, schemas[0])
+		self.assertIs(schema, cache.GetSchema(__DEFAULT_SCHEMA__))
+		self.assertEqual(2, cache.Misses)
+
+	def test_WarmUpUnknownVersion(self) -> None:
+		cache = SchemaCache()
+
+		with self.assertRaises(IPXACTException):
+			cache.WarmUp(["1999"])
+
+	def test_ParserPerThread(self) -> None:
+		cache = ParserCache()
+		parser = cache.GetParser()
+		self.assertIs(parser, cache.GetParser())
+
+		parsers = []
+		thread = Thread(target=lambda: parsers.append(cache.GetParser()))
+		thread.start()
+		thread.join()
+
+		self.assertIsNot(parser, parsers[0])
+		self.assertEqual(2, cache.Created)
+
+
+MAIN_SCHEMA = """\
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" xmlns:t="urn:test" targetNamespace="urn:test">
+	<xs:include schemaLocation="{url}"/>
+	<xs:element name="root" type="t:Text"/>
+</xs:schema>
+"""
+
+SUB_SCHEMA = """\
+<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" targetNamespace="urn:test">
+	<xs:simpleType name="Text"><xs:restriction base="xs:string"/></xs:simpleType>
+</xs:schema>
+"""
+
+
+class Resolving(TestCase):
+	def test_Map(self) -> None:
+		resolver = SchemaResolver()
+
+		path = resolver.Map("http://www.accellera.org/XMLSchema/IPXACT/1685-2014/component.xsd")
+		self.assertEqual(__VERSION_TABLE__["2014"].LocalPath.parent / "component.xsd", path)
+		self.assertTrue(resolver.Map("https://www.w3.org/2001/xml.xsd").exists())
+		self.assertIsNone(resolver.Map("http://example.com/unknown.xsd"))
+
+	def test_MapXmlSchemaFirst(self) -> None:
+		path = SchemaResolver().Map("http://www.w3.org/2001/xml.xsd")
+
+		self.assertIsNotNone(path)
+		self.assertEqual("xml.xsd", path.name)
+
+	def test_Compile(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			(directory / "sub.xsd").write_text(SUB_SCHEMA, encoding="utf-8")
+			(directory / "main.xsd").write_text(MAIN_SCHEMA.format(url="http://example.com/schemas/sub.xsd"), encoding="utf-8")
+
+			resolver = SchemaResolver()
+			resolver.AddMapping("http://example.com/schemas/", directory)
+			schema = IPXACTSchema("2022", "t", "urn:test", "", directory / "main.xsd")
+
+			SchemaCache(resolver).GetSchema(schema)
+			SchemaCache(resolver).GetSchema(schema)
+
+			# main.xsd and the mapped sub.xsd are read once.
+			self.assertEqual(2, resolver.Misses)
+			self.assertEqual(2, resolver.Hits)
+			self.assertEqual([], resolver.Unmapped)
+
+	def test_BundledFilesFromMemory(self) -> None:
+		resolver = SchemaResolver()
+		SchemaCache(resolver).GetSchema(__DEFAULT_SCHEMA__)
+		misses = resolver.Misses
+
+		SchemaCache(resolver).GetSchema(__DEFAULT_SCHEMA__)
+		self.assertGreater(misses, 1)
+		self.assertEqual(misses, resolver.Misses)
+		self.assertEqual(misses, resolver.Hits)
+
+	def test_Unmapped(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			directory = Path(tempDirectory)
+			(directory / "main.xsd").write_text(MAIN_SCHEMA.format(url="http://example.com/schemas/sub.xsd"), encoding="utf-8")
+
+			resolver = SchemaResolver()
+			schema = IPXACTSchema("2022", "t", "urn:test", "", directory / "main.xsd")
+
+			with self.assertRaises(IPXACTException):
+				SchemaCache(resolver).GetSchema(schema)
+
+			self.assertEqual(["http://example.com/schemas/sub.xsd"], resolver.Unmapped)
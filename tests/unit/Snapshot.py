@@ -0,0 +1,103 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___ ______  __    _    ____ _____                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    |_ _|  _ \ \/ /   / \  / ___|_   _|                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \    | || |_) \  /   / _ \| |     | |                                          #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ _ | ||  __//  \  / ___ \ |___  | |                                          #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___|_|  /_/\_\/_/   \_\____| |_|                                          #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2025 Patrick Lehmann - Bötzingen, Germany                                                             #
+# Copyright 2016-2016 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Testcases for ``Snapshot``."""
+from os              import utime
+from pathlib         import Path
+from shutil          import copy
+from tempfile        import TemporaryDirectory
+from unittest        import TestCase
+
+from pyEDAA.IPXACT            import IPXACTException
+from pyEDAA.IPXACT.Component  import Component
+from pyEDAA.IPXACT.Repository import CatalogResolver
+from pyEDAA.IPXACT.Snapshot   import WriteSnapshot, ReadSnapshot, ReadSnapshotSources
+
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class Snapshots(TestCase):
+	def test_RoundTrip(self) -> None:
+		repository = CatalogResolver().ResolveFile(Path("tests/Examples/tudortimi-ipxact/SampleCatalog.xml"))
+
+		with TemporaryDirectory() as tempDirectory:
+			snapshotFile = Path(tempDirectory) / "repository.snapshot"
+			stamps = WriteSnapshot(snapshotFile, repository)
+			reloaded = ReadSnapshot(snapshotFile)
+
+			self.assertEqual(len(repository), len(stamps))
+			self.assertEqual(len(stamps), len(ReadSnapshotSources(snapshotFile)))
+
+		self.assertEqual(len(repository), len(reloaded))
+		self.assertEqual([document.VLNV for document in repository], [document.VLNV for document in reloaded])
+		component = reloaded.Components[0]
+		self.assertEqual(["VerilogFiles", "SystemCFiles"], list(component.FileSets))
+		self.assertIsNotNone(component.XmlRoot)
+
+	def test_Buffer(self) -> None:
+		component = Component(Path("tests/Examples/tudortimi-ipxact/SampleComponent.xml").read_bytes(), parse=True)
+		self.assertEqual(["memoryMaps", "fileSets"], component.PendingSections)
+
+		with TemporaryDirectory() as tempDirectory:
+			snapshotFile = Path(tempDirectory) / "component.snapshot"
+			WriteSnapshot(snapshotFile, component)
+			reloaded = ReadSnapshot(snapshotFile)
+
+		self.assertEqual([], reloaded.PendingSections)
+		self.assertEqual(["VerilogFiles", "SystemCFiles"], list(reloaded.FileSets))
+
+	def test_SourceChanged(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			sourceFile = Path(tempDirectory) / "SampleComponent.xml"
+			copy(Path("tests/Examples/tudortimi-ipxact/SampleComponent.xml"), sourceFile)
+			snapshotFile = Path(tempDirectory) / "component.snapshot"
+			WriteSnapshot(snapshotFile, Component(sourceFile, parse=True))
+
+			# Touching a file without changing its content keeps the snapshot valid.
+			utime(sourceFile, ns=(0, 0))
+			self.assertIsNotNone(ReadSnapshot(snapshotFile))
+
+			sourceFile.write_text(sourceFile.read_text().replace("SampleComponent", "OtherComponent"))
+			self.assertIsNone(ReadSnapshot(snapshotFile))
+			self.assertIsNotNone(ReadSnapshot(snapshotFile, checkSources=False))
+
+	def test_InvalidFile(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			snapshotFile = Path(tempDirectory) / "invalid.snapshot"
+			self.assertIsNone(ReadSnapshot(snapshotFile))
+
+			snapshotFile.write_bytes(b"<?xml version='1.0'?><component/>")
+			with self.assertRaises(IPXACTException):
+				ReadSnapshot(snapshotFile)
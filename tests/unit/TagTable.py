@@ -0,0 +1,97 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___ ______  __    _    ____ _____                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    |_ _|  _ \ \/ /   / \  / ___|_   _|                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \    | || |_) \  /   / _ \| |     | |                                          #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ _ | ||  __//  \  / ___ \ |___  | |                                          #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___|_|  /_/\_\/_/   \_\____| |_|                                          #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2025 Patrick Lehmann - Bötzingen, Germany                                                             #
+# Copyright 2016-2016 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Testcases for ``TagTable``."""
+from pathlib      import Path
+from unittest     import TestCase
+
+from lxml.etree   import XML
+
+from pyEDAA.IPXACT           import __VERSION_TABLE__, VLNV, IPXACTException, TagTable
+from pyEDAA.IPXACT.Component import Component
+
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class TagTables(TestCase):
+	def test_Lookup(self) -> None:
+		table = TagTable({"name": "handler"})
+
+		for schema in __VERSION_TABLE__.values():
+			self.assertEqual("handler", table[f"{{{schema.SchemaUri}}}name"])
+		self.assertNotIn("name", table)
+		self.assertIsNone(table.Get("{urn:other}name"))
+
+		derived = table.Derive({"description": "other"})
+		table.Unregister("name")
+		self.assertEqual(0, len(table))
+		self.assertEqual(2 * len(__VERSION_TABLE__), len(derived))
+
+	def test_ParseChildren(self) -> None:
+		element = XML("""<ipxact:file xmlns:ipxact="http://www.accellera.org/XMLSchema/IPXACT/1685-2022"><!-- comment --><ipxact:name>a.vhdl</ipxact:name><ipxact:unknown/></ipxact:file>""")
+		fields = {}
+		table = TagTable({"name": TagTable.Text("name")})
+
+		with self.assertRaises(IPXACTException):
+			table.ParseChildren(fields, element, "file")
+		self.assertEqual({"name": "a.vhdl"}, fields)
+
+	def test_RegisterElementHandler(self) -> None:
+		parsed = []
+
+		class BusInterfaceComponent(Component):
+			pass
+
+		BusInterfaceComponent.RegisterElementHandler("busInterfaces", lambda self, element: parsed.append(len(element)))
+
+		BusInterfaceComponent(Path("tests/Examples/tudortimi-ipxact/SampleComponent.xml"), parse=True)
+		Component(Path("tests/Examples/tudortimi-ipxact/SampleComponent.xml"), parse=True)
+
+		self.assertEqual(1, len(parsed))
+		self.assertIsNone(Component._tagTable.Get("{http://www.accellera.org/XMLSchema/IPXACT/1685-2014}busInterfaces"))
+
+	def test_RegisterVendorExtensionHandler(self) -> None:
+		extensions = []
+
+		class AcmeComponent(Component):
+			pass
+
+		AcmeComponent.RegisterVendorExtensionHandler("urn:acme", "info", lambda self, element: extensions.append(element.text))
+
+		element = XML("""<ipxact:vendorExtensions xmlns:ipxact="http://www.accellera.org/XMLSchema/IPXACT/1685-2022" xmlns:acme="urn:acme" xmlns:other="urn:other"><acme:info>Hello</acme:info><other:info>World</other:info></ipxact:vendorExtensions>""")
+		component = AcmeComponent(vlnv=VLNV("acme", "lib", "comp", "1.0"))
+		component.Parse(element)
+
+		self.assertEqual(["Hello"], extensions)
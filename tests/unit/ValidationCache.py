@@ -0,0 +1,144 @@
+# ==================================================================================================================== #
+#              _____ ____    _        _      ___ ______  __    _    ____ _____                                         #
+#  _ __  _   _| ____|  _ \  / \      / \    |_ _|  _ \ \/ /   / \  / ___|_   _|                                        #
+# | '_ \| | | |  _| | | | |/ _ \    / _ \    | || |_) \  /   / _ \| |     | |                                          #
+# | |_) | |_| | |___| |_| / ___ \  / ___ \ _ | ||  __//  \  / ___ \ |___  | |                                          #
+# | .__/ \__, |_____|____/_/   \_\/_/   \_(_)___|_|  /_/\_\/_/   \_\____| |_|                                          #
+# |_|    |___/                                                                                                         #
+# ==================================================================================================================== #
+# Authors:                                                                                                             #
+#   Patrick Lehmann                                                                                                    #
+#                                                                                                                      #
+# License:                                                                                                             #
+# ==================================================================================================================== #
+# Copyright 2017-2025 Patrick Lehmann - Bötzingen, Germany                                                             #
+# Copyright 2016-2016 Patrick Lehmann - Dresden, Germany                                                               #
+#                                                                                                                      #
+# Licensed under the Apache License, Version 2.0 (the "License");                                                      #
+# you may not use this file except in compliance with the License.                                                     #
+# You may obtain a copy of the License at                                                                              #
+#                                                                                                                      #
+#   http://www.apache.org/licenses/LICENSE-2.0                                                                         #
+#                                                                                                                      #
+# Unless required by applicable law or agreed to in writing, software                                                  #
+# distributed under the License is distributed on an "AS IS" BASIS,                                                    #
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.                                             #
+# See the License for the specific language governing permissions and                                                  #
+# limitations under the License.                                                                                       #
+#                                                                                                                      #
+# SPDX-License-Identifier: Apache-2.0                                                                                  #
+# ==================================================================================================================== #
+#
+"""Testcases for ``ValidationCache``."""
+from pathlib         import Path
+from sqlite3         import connect
+from tempfile        import TemporaryDirectory
+from unittest        import TestCase
+
+from pyEDAA.IPXACT                 import RootElement
+from pyEDAA.IPXACT.Component       import Component
+from pyEDAA.IPXACT.ValidationCache import ValidationCache
+
+
+if __name__ == "__main__": # pragma: no cover
+	print("ERROR: you called a testcase declaration file as an executable module.")
+	print("Use: 'python -m unitest <testcase module>'")
+	exit(1)
+
+
+class ValidationCaching(TestCase):
+	def test_AddAndContains(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			with ValidationCache(Path(tempDirectory) / "cache.sqlite") as cache:
+				contentHash = cache.ComputeHash(b"<component/>")
+
+				self.assertFalse(cache.Contains(contentHash, "uri"))
+				cache.Add(contentHash, "uri")
+				self.assertTrue(cache.Contains(contentHash, "uri"))
+				self.assertFalse(cache.Contains(contentHash, "otherUri"))
+				self.assertEqual(1, cache.Hits)
+				self.assertEqual(2, cache.Misses)
+
+				cache.Invalidate(contentHash)
+				self.assertFalse(cache.Contains(contentHash, "uri"))
+				self.assertEqual(0, len(cache))
+
+	def test_Eviction(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			with ValidationCache(Path(tempDirectory) / "cache.sqlite", maxEntries=2) as cache:
+				for content in (b"1", b"2", b"3"):
+					cache.Add(cache.ComputeHash(content), "uri")
+
+				self.assertEqual(2, len(cache))
+				self.assertFalse(cache.Contains(cache.ComputeHash(b"1"), "uri"))
+				self.assertTrue(cache.Contains(cache.ComputeHash(b"3"), "uri"))
+
+	def test_AccessTimes(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			with ValidationCache(Path(tempDirectory) / "cache.sqlite", maxEntries=2) as cache:
+				for content in (b"1", b"2"):
+					cache.Add(cache.ComputeHash(content), "uri")
+
+				# The access time of the hit is written before evicting, so the least recently used entry is b"2".
+				self.assertTrue(cache.Contains(cache.ComputeHash(b"1"), "uri"))
+				cache.Add(cache.ComputeHash(b"3"), "uri")
+
+				self.assertTrue(cache.Contains(cache.ComputeHash(b"1"), "uri"))
+				self.assertFalse(cache.Contains(cache.ComputeHash(b"2"), "uri"))
+
+	def test_SharedEviction(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			cacheFile = Path(tempDirectory) / "cache.sqlite"
+			with ValidationCache(cacheFile, maxEntries=2) as cache1, ValidationCache(cacheFile, maxEntries=2) as cache2:
+				cache1.Add(cache1.ComputeHash(b"1"), "uri")
+				cache2.Add(cache2.ComputeHash(b"2"), "uri")
+				cache1.Add(cache1.ComputeHash(b"3"), "uri")
+
+				self.assertEqual(2, len(cache1))
+				self.assertEqual(2, len(cache2))
+				self.assertFalse(cache2.Contains(cache2.ComputeHash(b"1"), "uri"))
+
+	def test_EntryCount(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			cacheFile = Path(tempDirectory) / "cache.sqlite"
+			with ValidationCache(cacheFile) as cache:
+				for content in (b"1", b"2", b"3"):
+					cache.Add(cache.ComputeHash(content), "uri")
+				cache.Add(cache.ComputeHash(b"3"), "uri")
+				cache.Invalidate(cache.ComputeHash(b"2"))
+				self.assertEqual(2, len(cache))
+
+			# Cache files created without the entry counter are counted once when opened.
+			connection = connect(cacheFile)
+			connection.executescript("DROP TRIGGER validated_insert; DROP TRIGGER validated_delete; DROP TABLE entryCount;")
+			connection.close()
+
+			with ValidationCache(cacheFile) as cache:
+				self.assertEqual(2, len(cache))
+				cache.Clear()
+				self.assertEqual(0, len(cache))
+
+	def test_Persistence(self) -> None:
+		with TemporaryDirectory() as tempDirectory:
+			cacheFile = Path(tempDirectory) / "cache.sqlite"
+			with ValidationCache(cacheFile) as cache:
+				cache.Add(cache.ComputeHash(b"1"), "uri")
+
+			with ValidationCache(cacheFile) as cache:
+				self.assertTrue(cache.Contains(cache.ComputeHash(b"1"), "uri"))
+
+	def test_RootElement(self) -> None:
+		ipxactFile = Path("tests/Examples/tudortimi-ipxact/SampleComponent.xml")
+
+		with TemporaryDirectory() as tempDirectory:
+			with ValidationCache(Path(tempDirectory) / "cache.sqlite") as cache:
+				RootElement.SetValidationCache(cache)
+				try:
+					Component(ipxactFile, parse=True)
+					Component(ipxactFile, parse=True)
+				finally:
+					RootElement.SetValidationCache(None)
+
+				self.assertEqual(1, len(cache))
+				self.assertEqual(1, cache.Hits)
+				self.assertEqual(1, cache.Misses)